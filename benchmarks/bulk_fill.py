@@ -0,0 +1,87 @@
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from playwright.sync_api import Page, sync_playwright
+
+from components.courses.create_course_form_component import CreateCourseFormComponent
+from config import settings
+from elements.ui_coverage import tracker
+from tools.logger import configure_logging
+from tools.routes import AppRoute
+
+# Offline stand-in with the same data-testids as the create course form of the app
+CREATE_COURSE_FORM_HTML = """
+<div data-testid="create-course-form-title-input"><input></div>
+<div data-testid="create-course-form-estimated-time-input"><input></div>
+<div data-testid="create-course-form-description-input"><textarea></textarea></div>
+<div data-testid="create-course-form-max-score-input"><input></div>
+<div data-testid="create-course-form-min-score-input"><input></div>
+"""
+
+
+def fill_per_field(form: CreateCourseFormComponent, fields: dict):
+    for element, value in fields.items():
+        element.fill(value)
+        element.check_have_value(value)
+
+
+def fill_bulk(form: CreateCourseFormComponent, fields: dict):
+    form.fill_fields(fields)
+
+
+def measure(page: Page, fill, runs: int) -> list[float]:
+    form = CreateCourseFormComponent(page)
+    durations = []
+
+    for run in range(runs):
+        fields = {
+            form.title_input: f"Playwright {run}",
+            form.estimated_time_input: "2 weeks",
+            form.description_textarea: f"Description {run}",
+            form.max_score_input: "100",
+            form.min_score_input: "10"
+        }
+
+        started = time.perf_counter()
+        fill(form, fields)
+        durations.append(time.perf_counter() - started)
+
+    return durations
+
+
+def print_durations(label: str, durations: list[float]):
+    print(f"{label}: runs={len(durations)} mean={statistics.mean(durations) * 1000:.1f}ms "
+          f"median={statistics.median(durations) * 1000:.1f}ms")
+
+
+def main():
+    configure_logging()
+
+    # Keep coverage events produced by the benchmark out of the real coverage results
+    tracker.tracker.settings.results_dir = Path(tempfile.mkdtemp())
+
+    parser = argparse.ArgumentParser(description="Compare per-field and bulk filling of the create course form")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--offline", action="store_true", help="Use a static stand-in form instead of the app")
+    args = parser.parse_args()
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        page = browser.new_page(base_url=settings.get_base_url())
+
+        if args.offline:
+            page.set_content(CREATE_COURSE_FORM_HTML)
+        else:
+            page.goto(AppRoute.COURSE_CREATE, wait_until="networkidle")
+
+        print_durations("fill + check_have_value per field", measure(page, fill_per_field, args.runs))
+        print_durations("fill_fields", measure(page, fill_bulk, args.runs))
+
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
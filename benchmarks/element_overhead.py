@@ -0,0 +1,113 @@
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import allure_commons
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import TestResult, TestStepResult, Parameter
+from allure_commons.reporter import AllureReporter
+from allure_commons.utils import uuid4, now
+
+from config import settings, ReportingLevel
+from elements.button import Button
+from elements.input import Input
+from elements.ui_coverage import tracker
+from tools.logger import configure_logging
+
+
+# No driver round trips, so only the framework overhead is measured
+class StubLocator:
+    def nth(self, index: int):
+        return self
+
+    def locator(self, selector: str):
+        return self
+
+    def click(self):
+        pass
+
+    def fill(self, value: str):
+        pass
+
+
+class StubPage:
+    def get_by_test_id(self, test_id: str) -> StubLocator:
+        return StubLocator()
+
+    def on(self, event: str, callback):
+        pass
+
+
+# Mirrors the step hooks of allure-pytest, so steps cost the same as in a real run
+class StepListener:
+    def __init__(self, reporter: AllureReporter):
+        self.reporter = reporter
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        parameters = [Parameter(name=name, value=value) for name, value in params.items()]
+        self.reporter.start_step(None, uuid, TestStepResult(name=title, start=now(), parameters=parameters))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self.reporter.stop_step(uuid, stop=now())
+
+
+def measure(level: ReportingLevel, actions: int, runs: int) -> tuple[list[float], int]:
+    settings.reporting_level = level
+    page = StubPage()
+    button = Button(page, "benchmark-button-{index}", "Benchmark")
+    input = Input(page, "benchmark-input-{index}", "Benchmark")
+
+    durations = []
+    results_size = 0
+    for _ in range(runs):
+        results_dir = tempfile.mkdtemp()
+        reporter = AllureReporter()
+        listener = StepListener(reporter)
+        file_logger = AllureFileLogger(results_dir)
+        allure_commons.plugin_manager.register(listener)
+        allure_commons.plugin_manager.register(file_logger)
+
+        test_uuid = uuid4()
+        reporter.schedule_test(test_uuid, TestResult(uuid=test_uuid, name="benchmark", start=now()))
+
+        started = time.perf_counter()
+        for action in range(actions):
+            button.click(index=action % 10)
+            input.fill(f"value {action}", index=action % 10)
+        durations.append((time.perf_counter() - started) / (actions * 2))
+
+        reporter.close_test(test_uuid)
+        allure_commons.plugin_manager.unregister(listener)
+        allure_commons.plugin_manager.unregister(file_logger)
+        results_size = sum(path.stat().st_size for path in Path(results_dir).iterdir())
+
+    return durations, results_size
+
+
+def main():
+    configure_logging()
+
+    # Keep coverage events produced by the benchmark out of the real coverage results
+    tracker.tracker.settings.results_dir = Path(tempfile.mkdtemp())
+
+    parser = argparse.ArgumentParser(
+        description="Measure framework overhead per element action at each reporting level "
+                    "(redirect stderr to keep log output out of the terminal)"
+    )
+    parser.add_argument("--actions", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for level in ReportingLevel:
+        durations, results_size = measure(level, args.actions, args.runs)
+        print(f"{level.value}: mean={statistics.mean(durations) * 1_000_000:.1f}us "
+              f"median={statistics.median(durations) * 1_000_000:.1f}us per action, "
+              f"result file={results_size / 1024:.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import argparse
+import os
+from pathlib import Path
+
+from benchmarks.suite_duration import measure, print_durations
+from config import NavigationMode
+
+FLOWS = {
+    "TestCourses": ["tests/courses/test_courses.py::TestCourses"],
+    "TestDashboard": ["tests/dashboard/test_dashboard.py::TestDashboard"]
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full-reload and hash-route navigation")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    root = Path(__file__).resolve().parent.parent
+
+    for flow, pytest_args in FLOWS.items():
+        for mode in NavigationMode:
+            os.environ["NAVIGATION_MODE"] = mode.value
+            print_durations(f"{flow} ({mode.value})", measure(pytest_args, root, args.runs))
+
+
+if __name__ == "__main__":
+    main()
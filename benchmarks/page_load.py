@@ -0,0 +1,60 @@
+import argparse
+import statistics
+import time
+from urllib.parse import urlparse
+
+from playwright.sync_api import Browser, sync_playwright
+
+from config import settings
+from tools.local_app import LocalAppServer
+from tools.logger import configure_logging
+from tools.routes import AppRoute
+
+
+def measure_page_load(browser: Browser, base_url: str, route: AppRoute, runs: int) -> list[float]:
+    durations = []
+
+    for _ in range(runs):
+        context = browser.new_context(base_url=base_url)
+        page = context.new_page()
+
+        started = time.perf_counter()
+        page.goto(route, wait_until="networkidle")
+        durations.append(time.perf_counter() - started)
+
+        context.close()
+
+    return durations
+
+
+def print_durations(label: str, durations: list[float]):
+    print(
+        f"{label}: runs={len(durations)} "
+        f"mean={statistics.mean(durations) * 1000:.0f}ms "
+        f"median={statistics.median(durations) * 1000:.0f}ms "
+        f"max={max(durations) * 1000:.0f}ms"
+    )
+
+
+def main():
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Compare page load times of the local and the remote app")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--route", type=AppRoute, default=AppRoute.LOGIN)
+    args = parser.parse_args()
+
+    server = LocalAppServer(settings.local_app.build_dir, prefix=urlparse(str(settings.app_url)).path)
+    server.start()
+
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=True)
+            print_durations("remote", measure_page_load(browser, settings.get_base_url(), args.route, args.runs))
+            print_durations("local", measure_page_load(browser, f"{server.url}/", args.route, args.runs))
+            browser.close()
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import statistics
+import time
+import tracemalloc
+from functools import cache
+
+from benchmarks.element_overhead import StubPage
+from elements.descriptors import LazyAttribute
+from pages.authentication.login_page import LoginPage
+from pages.authentication.registration_page import RegistrationPage
+from pages.base_page import BasePage
+from pages.courses.courses_list_page import CoursesListPage
+from pages.courses.create_course_page import CreateCoursePage
+from pages.dashboard.dashboard_page import DashboardPage
+from tools.logger import configure_logging
+
+PAGES = [LoginPage, RegistrationPage, DashboardPage, CoursesListPage, CreateCoursePage]
+
+
+@cache
+def get_lazy_attributes(owner: type) -> list[str]:
+    return [name for name in dir(owner) if isinstance(getattr(owner, name, None), LazyAttribute)]
+
+
+def materialize(page_object) -> int:
+    # Touches every declared element, which is what eager construction in __init__ used to cost
+    count = 0
+    for name in get_lazy_attributes(type(page_object)):
+        count += 1 + materialize(getattr(page_object, name))
+
+    return count
+
+
+def construct(page_class: type[BasePage], touch_all: bool):
+    page_object = page_class(StubPage())
+    if touch_all:
+        materialize(page_object)
+
+    return page_object
+
+
+def measure_time(page_class: type[BasePage], touch_all: bool, runs: int) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        construct(page_class, touch_all)
+        durations.append(time.perf_counter() - started)
+
+    return durations
+
+
+def measure_memory(page_class: type[BasePage], touch_all: bool) -> int:
+    tracemalloc.start()
+    page_object = construct(page_class, touch_all)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del page_object
+    return size
+
+
+def main():
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Measure page object construction time and memory")
+    parser.add_argument("--runs", type=int, default=1000)
+    args = parser.parse_args()
+
+    for page_class in PAGES:
+        # Warm up per class caches such as the resolved annotations
+        construct(page_class, touch_all=True)
+        elements = materialize(page_class(StubPage()))
+
+        for label, touch_all in (("lazy", False), ("all attributes", True)):
+            durations = measure_time(page_class, touch_all, args.runs)
+            print(f"{page_class.__name__} ({elements} attributes) {label}: "
+                  f"mean={statistics.mean(durations) * 1_000_000:.1f}us "
+                  f"median={statistics.median(durations) * 1_000_000:.1f}us "
+                  f"memory={measure_memory(page_class, touch_all)}B")
+
+
+if __name__ == "__main__":
+    main()
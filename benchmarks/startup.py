@@ -0,0 +1,89 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HISTORY_FILE = Path(__file__).resolve().parent.joinpath("startup_history.json")
+
+IMPORT_CONFTEST = "import importlib, conftest; [importlib.import_module(plugin) for plugin in conftest.pytest_plugins]"
+
+
+def measure_import_time() -> tuple[float, list[tuple[str, float]]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_CONFTEST],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    total, modules = 0.0, []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        total += int(self_us) / 1000
+        # Nested imports are indented further, top-level ones show the cost of everything they pull in
+        if not name.startswith("  "):
+            modules.append((name.strip(), int(cumulative_us) / 1000))
+
+    return total, sorted(modules, key=lambda module: module[1], reverse=True)
+
+
+def measure_collection_time() -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "--numprocesses=0"],
+        cwd=ROOT, capture_output=True, check=True
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def get_commit() -> str:
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of the pytest plugins and collection time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--save", action="store_true", help=f"Append the result to {HISTORY_FILE.name}")
+    args = parser.parse_args()
+
+    import_times, collection_times, modules = [], [], []
+    for _ in range(args.runs):
+        total, modules = measure_import_time()
+        import_times.append(total)
+        collection_times.append(measure_collection_time())
+
+    result = {
+        "commit": get_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "import_ms": round(statistics.median(import_times), 1),
+        "collection_ms": round(statistics.median(collection_times), 1)
+    }
+
+    print(f"import: median={result['import_ms']:.1f}ms runs={args.runs}")
+    for name, cumulative in modules[:args.top]:
+        print(f"  {name}: {cumulative:.1f}ms")
+    print(f"collection: median={result['collection_ms']:.1f}ms runs={args.runs}")
+
+    history = json.loads(HISTORY_FILE.read_text()) if HISTORY_FILE.exists() else []
+    if history:
+        previous = history[-1]
+        print(
+            f"compared with {previous['commit']}: "
+            f"import {result['import_ms'] - previous['import_ms']:+.1f}ms, "
+            f"collection {result['collection_ms'] - previous['collection_ms']:+.1f}ms"
+        )
+
+    if args.save:
+        HISTORY_FILE.write_text(json.dumps([*history, result], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+HISTORY_FILE = Path(__file__).resolve().parent.joinpath("suite_duration_history.json")
+
+
+def run_suite(pytest_args: list[str], cwd: Path) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "pytest", "-q", *pytest_args], cwd=cwd, check=False)
+    return time.perf_counter() - started
+
+
+def measure(pytest_args: list[str], cwd: Path, runs: int) -> list[float]:
+    return [run_suite(pytest_args, cwd) for _ in range(runs)]
+
+
+def print_durations(label: str, durations: list[float]):
+    print(
+        f"{label}: runs={len(durations)} "
+        f"mean={statistics.mean(durations):.2f}s "
+        f"median={statistics.median(durations):.2f}s "
+        f"min={min(durations):.2f}s"
+    )
+
+
+def get_commit(cwd: Path) -> str:
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def get_result(cwd: Path, pytest_args: list[str], durations: list[float]) -> dict:
+    return {
+        "commit": get_commit(cwd),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "pytest_args": pytest_args,
+        "runs": len(durations),
+        "median_s": round(statistics.median(durations), 2),
+        "min_s": round(min(durations), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure wall-clock duration of the test suite")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--baseline", help="Git ref to measure in a temporary worktree for comparison")
+    parser.add_argument("--save", action="store_true", help=f"Append the results to {HISTORY_FILE.name}")
+    parser.add_argument("pytest_args", nargs="*", default=["-k", "regression"])
+    args = parser.parse_args()
+
+    root = Path(__file__).resolve().parent.parent
+    results = []
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as worktree:
+            subprocess.run(["git", "worktree", "add", "--detach", worktree, args.baseline], cwd=root, check=True)
+            try:
+                durations = measure(args.pytest_args, Path(worktree), args.runs)
+                print_durations(f"baseline ({args.baseline})", durations)
+                results.append(get_result(Path(worktree), args.pytest_args, durations))
+            finally:
+                subprocess.run(["git", "worktree", "remove", "--force", worktree], cwd=root, check=False)
+
+    durations = measure(args.pytest_args, root, args.runs)
+    print_durations("current", durations)
+    results.append(get_result(root, args.pytest_args, durations))
+
+    if args.save:
+        history = json.loads(HISTORY_FILE.read_text()) if HISTORY_FILE.exists() else []
+        HISTORY_FILE.write_text(json.dumps([*history, *results], indent=2))
+
+
+if __name__ == "__main__":
+    main()
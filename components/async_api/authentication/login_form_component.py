@@ -0,0 +1,23 @@
+from tools.allure.steps import async_step
+
+from components.async_api.base_component import BaseComponent
+from components.authentication import login_form_component
+from elements.async_api.input import Input
+
+
+class LoginFormComponent(BaseComponent, login_form_component.LoginFormComponent):
+    email_input: Input
+    password_input: Input
+
+    @async_step("Fill login form")
+    async def fill(self, email: str, password: str):
+        await self.email_input.fill(email)
+        await self.password_input.fill(password)
+
+    @async_step("Check that login form is filled by proper data")
+    async def check_visible(self, email: str, password: str):
+        await self.email_input.check_visible()
+        await self.email_input.check_have_value(email)
+
+        await self.password_input.check_visible()
+        await self.password_input.check_have_value(password)
@@ -0,0 +1,18 @@
+from typing import Pattern
+
+from config import ReportingLevel
+from tools.allure.steps import report_step
+from playwright.async_api import expect
+
+from components import base_component
+from tools.logger import get_logger
+
+logger = get_logger("ASYNC_BASE_COMPONENT")
+
+
+class BaseComponent(base_component.BaseComponent):
+    async def check_current_url(self, expected_url: Pattern[str]):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that current page have url {}", expected_url.pattern
+        ):
+            await expect(self.page).to_have_url(expected_url)
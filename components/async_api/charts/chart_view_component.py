@@ -0,0 +1,18 @@
+from tools.allure.steps import async_step
+
+from components.async_api.base_component import BaseComponent
+from components.charts import chart_view_component
+from elements.async_api.image import Image
+from elements.async_api.text import Text
+
+
+class ChartViewComponent(BaseComponent, chart_view_component.ChartViewComponent):
+    title: Text
+    chart: Image
+
+    @async_step("Check visible '{title} chart'")
+    async def check_visible(self, title: str):
+        await self.title.check_visible()
+        await self.title.check_have_text(title)
+
+        await self.chart.check_visible()
@@ -0,0 +1,12 @@
+from tools.allure.steps import async_step
+from playwright.async_api import expect
+
+from components.async_api.base_component import BaseComponent
+from components.dashboard import dashboard_toolbar_view_component
+
+
+class DashboardToolbarViewComponent(BaseComponent, dashboard_toolbar_view_component.DashboardToolbarViewComponent):
+    @async_step("Check visible dashboard toolbar view")
+    async def check_visible(self):
+        await expect(self.title).to_be_visible()
+        await expect(self.title).to_have_text("Dashboard")
@@ -0,0 +1,18 @@
+from tools.allure.steps import async_step
+
+from components.async_api.base_component import BaseComponent
+from components.navigation import navbar_component
+from elements.async_api.text import Text
+
+
+class NavbarComponent(BaseComponent, navbar_component.NavbarComponent):
+    app_title: Text
+    welcome_title: Text
+
+    @async_step("Check visible navbar")
+    async def check_visible(self, username: str):
+        await self.app_title.check_visible()
+        await self.app_title.check_have_text("UI Course")
+
+        await self.welcome_title.check_visible()
+        await self.welcome_title.check_have_text(f'Welcome, {username}!')
@@ -0,0 +1,31 @@
+import re
+
+from tools.allure.steps import async_step
+
+from components.async_api.base_component import BaseComponent
+from components.async_api.navigation.sidebar_list_item_component import SidebarListItemComponent
+from components.navigation import sidebar_component
+
+
+class SidebarComponent(BaseComponent, sidebar_component.SidebarComponent):
+    logout_list_item: SidebarListItemComponent
+    courses_list_item: SidebarListItemComponent
+    dashboard_list_item: SidebarListItemComponent
+
+    @async_step("Check visible sidebar")
+    async def check_visible(self):
+        await self.logout_list_item.check_visible('Logout')
+        await self.courses_list_item.check_visible('Courses')
+        await self.dashboard_list_item.check_visible('Dashboard')
+
+    @async_step("Click logout on sidebar")
+    async def click_logout(self):
+        await self.logout_list_item.navigate(re.compile(r".*/#/auth/login"))
+
+    @async_step("Click course on sidebar")
+    async def click_courses(self):
+        await self.courses_list_item.navigate(re.compile(r".*/#/courses"))
+
+    @async_step("Click dashboard on sidebar")
+    async def click_dashboard(self):
+        await self.dashboard_list_item.navigate(re.compile(r".*/#/dashboard"))
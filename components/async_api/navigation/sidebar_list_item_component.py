@@ -0,0 +1,28 @@
+from typing import Pattern
+
+from tools.allure.steps import async_step
+
+from components.async_api.base_component import BaseComponent
+from components.navigation import sidebar_list_item_component
+from elements.async_api.button import Button
+from elements.async_api.icon import Icon
+from elements.async_api.text import Text
+
+
+class SidebarListItemComponent(BaseComponent, sidebar_list_item_component.SidebarListItemComponent):
+    icon: Icon
+    title: Text
+    button: Button
+
+    @async_step("Check visible '{title}' sidebar list item")
+    async def check_visible(self, title: str):
+        await self.icon.check_visible()
+
+        await self.title.check_visible()
+        await self.title.check_have_text(title)
+
+        await self.button.check_visible()
+
+    async def navigate(self, expected_url: Pattern[str]):
+        await self.button.click()
+        await self.check_current_url(expected_url)
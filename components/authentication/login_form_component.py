@@ -1,24 +1,21 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 
 from elements.input import Input
+from elements.descriptors import Element
 
 
 class LoginFormComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    email_input = Element(Input, "login-form-email-input", "Login email")
+    password_input = Element(Input, "login-form-password-input", "Login password")
 
-        self.email_input = Input(page, "login-form-email-input", "Login email")
-        self.password_input = Input(page, "login-form-password-input", "Login password")
-
-    @allure.step("Fill login form")
+    @step("Fill login form")
     def fill(self, email: str, password: str):
-        self.email_input.fill(email)
-        self.password_input.fill(password)
+        self.fill_fields({self.email_input: email, self.password_input: password})
 
-    @allure.step("Check that login form is filled by proper data")
+    @step("Check that login form is filled by proper data")
     def check_visible(self, email: str, password: str):
         self.email_input.check_visible()
         self.email_input.check_have_value(email)
@@ -1,25 +1,25 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 
 from elements.input import Input
+from elements.descriptors import Element
 
 class RegistrationFormComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    email_input = Element(Input, "registration-form-email-input", "Email input")
+    username_input = Element(Input, "registration-form-username-input", "Username input")
+    password_input = Element(Input, "registration-form-password-input", "Password input")
 
-        self.email_input = Input(page, "registration-form-email-input", "Email input")
-        self.username_input = Input(page, "registration-form-username-input", "Username input")
-        self.password_input = Input(page,"registration-form-password-input", "Password input")
-
-    @allure.step("Fill login form")
+    @step("Fill login form")
     def fill(self, email: str, username: str, password: str):
-        self.email_input.fill(email)
-        self.username_input.fill(username)
-        self.password_input.fill(password)
+        self.fill_fields({
+            self.email_input: email,
+            self.username_input: username,
+            self.password_input: password
+        })
 
-    @allure.step("Check visible registration form")
+    @step("Check visible registration form")
     def check_visible(self, email: str, username: str, password: str):
         self.email_input.check_visible()
         self.email_input.check_have_value(email)
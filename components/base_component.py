@@ -1,8 +1,11 @@
 from typing import Pattern
-import allure
+from config import ReportingLevel
+from tools.allure.steps import report_step
 from playwright.sync_api import Page, expect
 
+from elements.base_element import BaseElement
 from tools.logger import get_logger
+from tools.playwright.batch_expect import BatchExpectation
 
 logger = get_logger("BASE_COMPONENT")
 
@@ -10,9 +13,19 @@ class BaseComponent:
     def __init__(self, page: Page):
         self.page = page
 
-    def check_current_url(self, expected_url: Pattern[str]):
-        step = f"Checking that current page have url {expected_url.pattern}"
+    def expect_batch(self) -> BatchExpectation:
+        return BatchExpectation(self.page)
+
+    def fill_fields(self, fields: dict[BaseElement, str], nth: int = 0, **kwargs):
+        for element, value in fields.items():
+            element.fill(value, nth, **kwargs)
 
-        with allure.step(step):
-            logger.info(step)
+        with self.expect_batch() as batch:
+            for element, value in fields.items():
+                batch.value(element, value, nth, **kwargs)
+
+    def check_current_url(self, expected_url: Pattern[str]):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that current page have url {}", expected_url.pattern
+        ):
             expect(self.page).to_have_url(expected_url)
\ No newline at end of file
@@ -1,18 +1,21 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 from elements.text import Text
 from elements.image import Image
+from elements.descriptors import Element
 
 class ChartViewComponent(BaseComponent):
+    title = Element(Text, "{identifier}-widget-title-text", "Title")
+    chart = Element(Image, "{identifier}-{chart_type}-chart", "Chart")
+
     def __init__(self, page: Page, identifier: str, chart_type: str):
         super().__init__(page)
+        self.identifier = identifier
+        self.chart_type = chart_type
 
-        self.title = Text(page, f"{identifier}-widget-title-text", "Title")
-        self.chart = Image(page, f"{identifier}-{chart_type}-chart", "Chart")
-
-    @allure.step("Check visible '{title} chart'")
+    @step("Check visible '{title} chart'")
     def check_visible(self, title: str):
         self.title.check_visible()
         self.title.check_have_text(title)
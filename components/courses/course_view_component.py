@@ -1,4 +1,4 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
@@ -6,32 +6,32 @@ from playwright.sync_api import Page, expect
 from components.courses.course_view_menu_component import CourseViewMenuComponent
 from elements.text import Text
 from elements.image import Image
+from elements.descriptors import Element
+from components.descriptors import Component
 
 
 class CourseViewComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    menu = Component(CourseViewMenuComponent)
 
-        self.menu = CourseViewMenuComponent(page)
+    title = Element(Text, "course-widget-title-text", "Title")
+    image = Element(Image, "course-preview-image", "Preview")
+    max_score_text = Element(Text, "course-max-score-info-row-view-text", "Max score")
+    min_score_text = Element(Text, "course-min-score-info-row-view-text", "Min score")
+    estimated_time_text = Element(Text, "course-estimated-time-info-row-view-text", "Estimated time")
 
-        self.title = Text(page, "course-widget-title-text", "Title")
-        self.image = Image(page, "course-preview-image", "Preview")
-        self.max_score_text = Text(page, "course-max-score-info-row-view-text", "Max score")
-        self.min_score_text = Text(page, "course-min-score-info-row-view-text", "Min score")
-        self.estimated_time_text = Text(page, "course-estimated-time-info-row-view-text", "Estimated time")
-
-    @allure.step("Check visible course view at index '{index}'")
+    @step("Check visible course view at index '{index}'")
     def check_visible(self, index: int, title: str, max_score: str, min_score: str, estimated_time: str):
-        self.image.check_visible(nth=index)
+        with self.expect_batch() as batch:
+            batch.visible(self.image, nth=index)
 
-        self.title.check_visible(nth=index)
-        self.title.check_have_text(title, nth=index)
+            batch.visible(self.title, nth=index)
+            batch.text(self.title, title, nth=index)
 
-        self.max_score_text.check_visible(nth=index)
-        self.max_score_text.check_have_text(f"Max score: {max_score}", nth=index)
+            batch.visible(self.max_score_text, nth=index)
+            batch.text(self.max_score_text, f"Max score: {max_score}", nth=index)
 
-        self.min_score_text.check_visible(nth=index)
-        self.min_score_text.check_have_text(f"Min score: {min_score}", nth=index)
+            batch.visible(self.min_score_text, nth=index)
+            batch.text(self.min_score_text, f"Min score: {min_score}", nth=index)
 
-        self.estimated_time_text.check_visible(nth=index)
-        self.estimated_time_text.check_have_text(f"Estimated time: {estimated_time}", nth=index)
\ No newline at end of file
+            batch.visible(self.estimated_time_text, nth=index)
+            batch.text(self.estimated_time_text, f"Estimated time: {estimated_time}", nth=index)
\ No newline at end of file
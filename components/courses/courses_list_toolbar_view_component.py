@@ -1,27 +1,25 @@
 import re
 
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 from elements.text import Text
 from elements.button import Button
+from elements.descriptors import Element
 
 class CoursesListToolbarViewComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    title = Element(Text, 'courses-list-toolbar-title-text', 'Title')
+    create_course_button = Element(Button, 'courses-list-toolbar-create-course-button', 'Create course button')
 
-        self.title = Text(page, 'courses-list-toolbar-title-text', 'Title')
-        self.create_course_button = Button(page, 'courses-list-toolbar-create-course-button', 'Create course button')
-
-    @allure.step("Check visible courses list toolbar view component")
+    @step("Check visible courses list toolbar view component")
     def check_visible(self):
         self.title.check_visible()
         self.title.check_have_text('Courses')
 
         self.create_course_button.check_visible()
 
-    @allure.step("Click create course button")
+    @step("Click create course button")
     def click_create_course_button(self):
         self.create_course_button.click()
         self.check_current_url(re.compile(".*/#/courses/create"))
\ No newline at end of file
@@ -1,4 +1,4 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
@@ -6,28 +6,19 @@ from playwright.sync_api import Page, expect
 from elements.button import Button
 from elements.text import Text
 from elements.input import Input
+from elements.descriptors import Element
 
 
 class CreateCourseExerciseFormComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        self.delete_exercise_button = Button(
-            page, "create-course-exercise-{index}-box-toolbar-delete-exercise-button", "Delete exercise")
-        self.subtitle = Text(
-            page, "create-course-exercise-{index}-box-toolbar-subtitle-text", "Exercise subtitle"
-        )
-        self.title_input = Input(
-            page, "create-course-exercise-form-title-{index}-input", "Subtitle"
-        )
-        self.description_input = Input(
-            page, "create-course-exercise-form-description-{index}-input", "Description"
-        )
+    delete_exercise_button = Element(Button, "create-course-exercise-{index}-box-toolbar-delete-exercise-button", "Delete exercise")
+    subtitle = Element(Text, "create-course-exercise-{index}-box-toolbar-subtitle-text", "Exercise subtitle")
+    title_input = Element(Input, "create-course-exercise-form-title-{index}-input", "Subtitle")
+    description_input = Element(Input, "create-course-exercise-form-description-{index}-input", "Description")
 
     def click_delete_button(self, index: int):
         self.delete_exercise_button.click(index=index)
 
-    @allure.step('Check visible create course exercise form at index "{index}"')
+    @step('Check visible create course exercise form at index "{index}"')
     def check_visible(self, index: int, title: str, description: str):
         self.subtitle.check_visible(index=index)
         self.subtitle.check_have_text(f"#{index + 1} Exercise", index=index)
@@ -38,11 +29,7 @@ class CreateCourseExerciseFormComponent(BaseComponent):
         self.description_input.check_visible(index=index)
         self.description_input.check_have_value(value=description, index=index)
 
-    @allure.step('Check visible create course exercise form at index "{index}"')
+    @step('Check visible create course exercise form at index "{index}"')
     def fill(self, index: int, title: str, description: str):
-        self.title_input.fill(title, index=index)
-        self.title_input.check_have_value(title, index=index)
-
-        self.description_input.fill(description, index=index)
-        self.title_input.check_have_value(description, index=index)
+        self.fill_fields({self.title_input: title, self.description_input: description}, index=index)
 
@@ -1,18 +1,16 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 from elements.text import Text
 from elements.button import Button
+from elements.descriptors import Element
 
 class CreateCourseExercisesToolbarViewComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    title = Element(Text, 'create-course-exercises-box-toolbar-title-text', 'Title')
+    create_exercise_button = Element(Button, 'create-course-exercises-box-toolbar-create-exercise-button', 'Create exercise button')
 
-        self.title = Text(page, 'create-course-exercises-box-toolbar-title-text', 'Title')
-        self.create_exercise_button = Button(page, 'create-course-exercises-box-toolbar-create-exercise-button', 'Create exercise button')
-
-    @allure.step("Check visible create course exercise toolbar view")
+    @step("Check visible create course exercise toolbar view")
     def check_visible(self):
         self.title.check_visible()
         self.title.check_have_text('Exercises')
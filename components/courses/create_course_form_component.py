@@ -1,26 +1,20 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 
 from elements.input import Input
 from elements.textarea import TextArea
+from elements.descriptors import Element
 
 class CreateCourseFormComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    title_input = Element(Input, 'create-course-form-title-input', 'Title input')
+    estimated_time_input = Element(Input, 'create-course-form-estimated-time-input', 'Estimated time input')
+    description_textarea = Element(TextArea, 'create-course-form-description-input', 'Description textarea')
+    max_score_input = Element(Input, 'create-course-form-max-score-input', 'Max score input')
+    min_score_input = Element(Input, 'create-course-form-min-score-input', 'Min score input')
 
-        self.title_input = Input(page, 'create-course-form-title-input', 'Title input')
-        self.estimated_time_input = (
-            Input(page, 'create-course-form-estimated-time-input', 'Estimated time input')
-        )
-        self.description_textarea = TextArea(
-            page, 'create-course-form-description-input', 'Description textarea'
-        )
-        self.max_score_input = Input(page, 'create-course-form-max-score-input', 'Max score input')
-        self.min_score_input = Input(page, 'create-course-form-min-score-input', 'Min score input')
-
-    @allure.step("Fill create course form")
+    @step("Fill create course form")
     def fill(
             self,
             title: str,
@@ -29,22 +23,15 @@ class CreateCourseFormComponent(BaseComponent):
             max_score: str,
             min_score: str
     ):
-        self.title_input.fill(title)
-        self.title_input.check_have_value(title)
-
-        self.estimated_time_input.fill(estimated_time)
-        self.estimated_time_input.check_have_value(estimated_time)
-
-        self.description_textarea.fill(description)
-        self.description_textarea.check_have_value(description)
-
-        self.max_score_input.fill(max_score)
-        self.max_score_input.check_have_value(max_score)
-
-        self.min_score_input.fill(min_score)
-        self.min_score_input.check_have_value(min_score)
-
-    @allure.step("Check visible create course form")
+        self.fill_fields({
+            self.title_input: title,
+            self.estimated_time_input: estimated_time,
+            self.description_textarea: description,
+            self.max_score_input: max_score,
+            self.min_score_input: min_score
+        })
+
+    @step("Check visible create course form")
     def check_visible(
             self,
             title: str,
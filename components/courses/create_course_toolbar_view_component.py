@@ -1,23 +1,17 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 
 from elements.text import Text
 from elements.button import Button
+from elements.descriptors import Element
 
 class CreateCourseToolbarViewComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    title = Element(Text, 'create-course-toolbar-title-text', 'Title')
+    create_course_button = Element(Button, 'create-course-toolbar-create-course-button', 'Create course button')
 
-        self.title = Text(page, 'create-course-toolbar-title-text', 'Title')
-        self.create_course_button = Button(
-            page,
-            'create-course-toolbar-create-course-button',
-            'Create course button'
-        )
-
-    @allure.step("Check visible create course toolbar view with state 'disabled' {is_create_course_disabled} ")
+    @step("Check visible create course toolbar view with state 'disabled' {is_create_course_disabled} ")
     def check_visible(self, is_create_course_disabled: bool = True):
         self.title.check_visible()
         self.title.check_have_text('Create course')
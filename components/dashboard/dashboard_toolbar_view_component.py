@@ -1,4 +1,4 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
@@ -10,7 +10,7 @@ class DashboardToolbarViewComponent(BaseComponent):
 
         self.title = page.get_by_test_id("dashboard-toolbar-title-text")
 
-    @allure.step("Check visible dashboard toolbar view")
+    @step("Check visible dashboard toolbar view")
     def check_visible(self):
         expect(self.title).to_be_visible()
         expect(self.title).to_have_text("Dashboard")
\ No newline at end of file
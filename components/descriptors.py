@@ -0,0 +1,11 @@
+from components.base_component import BaseComponent
+from elements.descriptors import LazyAttribute
+
+
+class Component(LazyAttribute):
+    def __init__(self, component_type: type[BaseComponent], *args: str):
+        super().__init__(component_type)
+        self.args = args
+
+    def create(self, instance, component_type: type[BaseComponent]) -> BaseComponent:
+        return component_type(instance.page, *(self.format(instance, arg) for arg in self.args))
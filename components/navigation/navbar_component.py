@@ -1,17 +1,15 @@
-import allure
+from tools.allure.steps import step
 from playwright.sync_api import Page, expect
 
 from components.base_component import BaseComponent
 from elements.text import Text
+from elements.descriptors import Element
 
 class NavbarComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    app_title = Element(Text, "navigation-navbar-app-title-text", "App title")
+    welcome_title = Element(Text, "navigation-navbar-welcome-title-text", "Welcome title")
 
-        self.app_title = Text(page, "navigation-navbar-app-title-text", "App title")
-        self.welcome_title = Text(page,"navigation-navbar-welcome-title-text", "Welcome title")
-
-    @allure.step("Check visible navbar")
+    @step("Check visible navbar")
     def check_visible(self, username: str):
         self.app_title.check_visible()
         self.app_title.check_have_text("UI Course")
@@ -1,34 +1,33 @@
 import re
 
-import allure
+from tools.allure.steps import step
 from playwright.sync_api import Page
 
 from components.base_component import BaseComponent
 from components.navigation.sidebar_list_item_component import SidebarListItemComponent
+from components.descriptors import Component
 
 
 class SidebarComponent(BaseComponent):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    logout_list_item = Component(SidebarListItemComponent, 'logout')
+    courses_list_item = Component(SidebarListItemComponent, 'courses')
+    dashboard_list_item = Component(SidebarListItemComponent, 'dashboard')
 
-        self.logout_list_item = SidebarListItemComponent(page, 'logout')
-        self.courses_list_item = SidebarListItemComponent(page, 'courses')
-        self.dashboard_list_item = SidebarListItemComponent(page, 'dashboard')
-
-    @allure.step("Check visible sidebar")
+    @step("Check visible sidebar")
     def check_visible(self):
-        self.logout_list_item.check_visible('Logout')
-        self.courses_list_item.check_visible('Courses')
-        self.dashboard_list_item.check_visible('Dashboard')
+        with self.expect_batch() as batch:
+            self.logout_list_item.expect_visible(batch, 'Logout')
+            self.courses_list_item.expect_visible(batch, 'Courses')
+            self.dashboard_list_item.expect_visible(batch, 'Dashboard')
 
-    @allure.step("Click logout on sidebar")
+    @step("Click logout on sidebar")
     def click_logout(self):
         self.logout_list_item.navigate(re.compile(r".*/#/auth/login"))
 
-    @allure.step("Click course on sidebar")
+    @step("Click course on sidebar")
     def click_courses(self):
         self.courses_list_item.navigate(re.compile(r".*/#/courses"))
 
-    @allure.step("Click dashboard on sidebar")
+    @step("Click dashboard on sidebar")
     def click_dashboard(self):
         self.dashboard_list_item.navigate(re.compile(r".*/#/dashboard"))
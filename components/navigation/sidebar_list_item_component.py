@@ -1,29 +1,36 @@
 from typing import Pattern
 
-import allure
+from tools.allure.steps import step
 from playwright.sync_api import Page, expect
 
 from components.base_component import BaseComponent
 from elements.icon import Icon
 from elements.text import Text
 from elements.button import Button
+from tools.playwright.batch_expect import BatchExpectation
+from elements.descriptors import Element
 
 class SidebarListItemComponent(BaseComponent):
+    icon = Element(Icon, "{identifier}-drawer-list-item-icon", "Icon")
+    title = Element(Text, "{identifier}-drawer-list-item-title-text", "Title")
+    button = Element(Button, "{identifier}-drawer-list-item-button", "Button")
+
     def __init__(self, page: Page, identifier: str):
         super().__init__(page)
+        self.identifier = identifier
 
-        self.icon = Icon(page, f"{identifier}-drawer-list-item-icon", "Icon")
-        self.title = Text(page, f"{identifier}-drawer-list-item-title-text", "Title")
-        self.button = Button(page,f"{identifier}-drawer-list-item-button", "Button")
-
-    @allure.step("Check visible '{title}' sidebar list item")
+    @step("Check visible '{title}' sidebar list item")
     def check_visible(self, title: str):
-        self.icon.check_visible()
+        with self.expect_batch() as batch:
+            self.expect_visible(batch, title)
+
+    def expect_visible(self, batch: BatchExpectation, title: str):
+        batch.visible(self.icon)
 
-        self.title.check_visible()
-        self.title.check_have_text(title)
+        batch.visible(self.title)
+        batch.text(self.title, title)
 
-        self.button.check_visible()
+        batch.visible(self.button)
 
     def navigate(self, expected_url: Pattern[str]):
         self.button.click()
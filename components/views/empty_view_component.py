@@ -1,24 +1,31 @@
-import allure
+from tools.allure.steps import step
 
 from components.base_component import BaseComponent
 from playwright.sync_api import Page, expect
 from elements.icon import Icon
 from elements.text import Text
+from tools.playwright.batch_expect import BatchExpectation
+from elements.descriptors import Element
 
 class EmptyViewComponent(BaseComponent):
+    icon = Element(Icon, "{identifier}-empty-view-icon", "Icon")
+    title = Element(Text, "{identifier}-empty-view-title-text", "Title")
+    description = Element(Text, "{identifier}-empty-view-description-text", "Description")
+
     def __init__(self, page: Page, identifier: str):
         super().__init__(page)
+        self.identifier = identifier
 
-        self.icon = Icon(page, f"{identifier}-empty-view-icon", "Icon")
-        self.title = Text(page, f"{identifier}-empty-view-title-text", "Title")
-        self.description = Text(page, f"{identifier}-empty-view-description-text", "Description")
-
-    @allure.step('Check visible empty view "{title}"')
+    @step('Check visible empty view "{title}"')
     def check_visible(self, title: str, description: str):
-        self.icon.check_visible()
+        with self.expect_batch() as batch:
+            self.expect_visible(batch, title, description)
+
+    def expect_visible(self, batch: BatchExpectation, title: str, description: str):
+        batch.visible(self.icon)
 
-        self.title.check_visible()
-        self.title.check_have_text(title)
+        batch.visible(self.title)
+        batch.text(self.title, title)
 
-        self.description.check_visible()
-        self.description.check_have_text(description)
\ No newline at end of file
+        batch.visible(self.description)
+        batch.text(self.description, description)
\ No newline at end of file
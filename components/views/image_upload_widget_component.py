@@ -7,58 +7,47 @@ from elements.icon import Icon
 from elements.text import Text
 from elements.file_input import FileInput
 from elements.button import Button
+from elements.descriptors import Element
+from components.descriptors import Component
 
 
 class ImageUploadWidgetComponent(BaseComponent):
-    def __init__(self, page: Page, identifier: str):
-        super().__init__(page)
-
-        self.preview_empty_view = EmptyViewComponent(page, identifier)
+    preview_empty_view = Component(EmptyViewComponent, "{identifier}")
 
-        self.preview_image = Image(
-            page, f"{identifier}-image-upload-widget-preview-image", "Preview image"
-        )
+    preview_image = Element(Image, "{identifier}-image-upload-widget-preview-image", "Preview image")
+    image_upload_info_icon = Element(Icon, "{identifier}-image-upload-widget-info-icon", "Upload icon")
+    image_upload_info_title = Element(Text, "{identifier}-image-upload-widget-info-title-text", "Upload title")
+    image_upload_info_description = Element(Text, "{identifier}-image-upload-widget-info-description-text", "Upload description")
+    upload_button = Element(Button, "{identifier}-image-upload-widget-upload-button", "Upload button")
+    remove_button = Element(Button, "{identifier}-image-upload-widget-remove-button", "Remove image button")
+    upload_input = Element(FileInput, "{identifier}-image-upload-widget-input", "Upload image input")
 
-        self.image_upload_info_icon = Icon(
-            page, f"{identifier}-image-upload-widget-info-icon", "Upload icon"
-        )
-        self.image_upload_info_title = Text(
-            page, f"{identifier}-image-upload-widget-info-title-text", "Upload title"
-        )
-        self.image_upload_info_description = Text(
-            page, f"{identifier}-image-upload-widget-info-description-text", "Upload description"
-        )
-
-        self.upload_button = Button(
-            page,f"{identifier}-image-upload-widget-upload-button", "Upload button"
-        )
-        self.remove_button = Button(
-            page, f"{identifier}-image-upload-widget-remove-button", "Remove image button"
-        )
-        self.upload_input = FileInput(
-            page, f"{identifier}-image-upload-widget-input", "Upload image input"
-        )
+    def __init__(self, page: Page, identifier: str):
+        super().__init__(page)
+        self.identifier = identifier
 
     def check_visible(self, is_image_uploaded: bool = False):
-        self.image_upload_info_icon.check_visible()
+        with self.expect_batch() as batch:
+            batch.visible(self.image_upload_info_icon)
 
-        self.image_upload_info_title.check_visible()
-        self.image_upload_info_title.check_have_text('Tap on "Upload image" button to select file')
+            batch.visible(self.image_upload_info_title)
+            batch.text(self.image_upload_info_title, 'Tap on "Upload image" button to select file')
 
-        self.image_upload_info_description.check_visible()
-        self.image_upload_info_description.check_have_text('Recommended file size 540X300')
+            batch.visible(self.image_upload_info_description)
+            batch.text(self.image_upload_info_description, 'Recommended file size 540X300')
 
-        self.upload_button.check_visible()
+            batch.visible(self.upload_button)
 
-        if is_image_uploaded:
-            self.remove_button.check_visible()
-            self.preview_image.check_visible()
+            if is_image_uploaded:
+                batch.visible(self.remove_button)
+                batch.visible(self.preview_image)
 
-        if not is_image_uploaded:
-            self.preview_empty_view.check_visible(
-                title='No image selected',
-                description='Preview of selected image will be displayed here'
-            )
+            if not is_image_uploaded:
+                self.preview_empty_view.expect_visible(
+                    batch,
+                    title='No image selected',
+                    description='Preview of selected image will be displayed here'
+                )
 
     def click_remove_image_button(self):
         self.remove_button.click()
@@ -1,5 +1,9 @@
+import hashlib
+import os
+from functools import cache
+from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Self
+from typing import Self, cast
 from pydantic import EmailStr, FilePath, HttpUrl, DirectoryPath, BaseModel
 from enum import Enum
 
@@ -17,6 +21,74 @@ class TestUser(BaseModel):
 class TestData(BaseModel):
     image_png_file: FilePath
 
+class ArtifactPolicy(str, Enum):
+    OFF = "off"
+    ALWAYS = "always"
+    RETAIN_ON_FAILURE = "retain-on-failure"
+    ON_FIRST_RETRY = "on-first-retry"
+
+class ContextReuse(str, Enum):
+    SCRUB = "scrub"
+    DISCARD = "discard"
+
+class ContextPoolSettings(BaseModel):
+    size: int = 2
+    reuse: ContextReuse = ContextReuse.SCRUB
+
+
+class NetworkCacheSettings(BaseModel):
+    enabled: bool = False
+    cache_dir: Path = Path("./network-cache")
+    url_pattern: str = "**/*.{js,css,png}"
+    revalidate: bool = False
+
+class ResourceProfile(str, Enum):
+    MINIMAL = "minimal"
+    VISUAL = "visual"
+    FULL = "full"
+
+class ResourcePolicySettings(BaseModel):
+    profile: ResourceProfile = ResourceProfile.MINIMAL
+    blocked_url_patterns: list[str] = []
+    blocked_resource_types: list[str] = []
+    sizes_file: Path = Path("./resource-sizes.json")
+    # Sizes are asked for with HEAD requests at session end, which runners without outside access can't answer
+    resolve_sizes: bool = False
+
+class NavigationMode(str, Enum):
+    FULL = "full"
+    HASH = "hash"
+
+class ReportingLevel(str, Enum):
+    FULL = "full"
+    ACTIONS = "actions"
+    NONE = "none"
+
+class LoggingSettings(BaseModel):
+    logs_dir: Path = Path("./logs")
+    level: str = "DEBUG"
+    levels: dict[str, str] = {}
+    console: bool = True
+
+class WorkersSettings(BaseModel):
+    # Resident memory in MB, measured values from "python -m tools.scheduling.capacity" override them
+    footprints_mb: dict[str, int] = {"worker": 120, "driver": 80, "chromium": 350, "firefox": 450, "webkit": 300}
+    footprints_file: Path = Path("./engine-footprints.json")
+    max_workers: int | None = None
+    # Workers are retired under memory pressure only by the lpt and browser schedulers
+    memory_reserve_mb: int = 1024
+    pressure_interval: float = 10.0
+
+class CheckpointSettings(BaseModel):
+    cache_dir: Path = Path("./checkpoints")
+    max_entries: int = 64
+
+class LocalAppSettings(BaseModel):
+    enabled: bool = False
+    build_dir: Path = Path("./app-build")
+    # Each xdist worker serves on port + its index, a fixed origin keeps the cached browser states valid between runs
+    port: int = 8400
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -29,6 +101,10 @@ class Settings(BaseSettings):
     def get_base_url(self):
         return f"{self.app_url}/"
 
+    def get_browser_state_file(self, browser: Browser) -> Path:
+        key = hashlib.sha256(f"{self.app_url}|{self.test_user.model_dump_json()}".encode()).hexdigest()[:16]
+        return self.browser_states_dir.joinpath(f"{browser.value}-{key}.json")
+
     app_url: HttpUrl
     headless: bool
     browsers: list[Browser]
@@ -37,26 +113,71 @@ class Settings(BaseSettings):
     videos_dir: DirectoryPath
     tracing_dir: DirectoryPath
     allure_results_dir: DirectoryPath
-    browser_state_file: FilePath
+    browser_states_dir: DirectoryPath
+    browser_state_ttl: int = 3600
+    metrics_dir: DirectoryPath
+    timings_file: Path = Path("./timings.json")
+    impact_graph_file: Path = Path("./impact-graph.json")
+    workers: WorkersSettings = WorkersSettings()
+    video_policy: ArtifactPolicy = ArtifactPolicy.RETAIN_ON_FAILURE
+    tracing_policy: ArtifactPolicy = ArtifactPolicy.RETAIN_ON_FAILURE
+    context_pool: ContextPoolSettings = ContextPoolSettings()
+    local_app: LocalAppSettings = LocalAppSettings()
+    checkpoints: CheckpointSettings = CheckpointSettings()
+    network_cache: NetworkCacheSettings = NetworkCacheSettings()
+    resource_policy: ResourcePolicySettings = ResourcePolicySettings()
+    navigation_mode: NavigationMode = NavigationMode.FULL
+    locator_cache_size: int = 256
+    reporting_level: ReportingLevel = ReportingLevel.FULL
+    logging: LoggingSettings = LoggingSettings()
 
     @classmethod
     def initialize(cls) -> Self:
         videos_dir = DirectoryPath("./videos")
         tracing_dir = DirectoryPath("./tracing")
         allure_results_dir = DirectoryPath("./allure-results")
-        browser_state_file = FilePath("browser-context.json")
+        browser_states_dir = DirectoryPath("./browser-states")
+        metrics_dir = DirectoryPath("./metrics")
 
         videos_dir.mkdir(exist_ok=True)
         tracing_dir.mkdir(exist_ok=True)
         allure_results_dir.mkdir(exist_ok=True)
-        browser_state_file.touch(exist_ok=True)
+        browser_states_dir.mkdir(exist_ok=True)
+        metrics_dir.mkdir(exist_ok=True)
 
         return Settings(
             videos_dir=videos_dir,
             tracing_dir=tracing_dir,
             allure_results_dir=allure_results_dir,
-            browser_state_file=browser_state_file
+            browser_states_dir=browser_states_dir,
+            metrics_dir=metrics_dir
         )
 
 
-settings = Settings.initialize()
\ No newline at end of file
+# Set by the xdist controller, workers inherit it and validate it instead of parsing .env again
+SETTINGS_SNAPSHOT_ENV = "SETTINGS_SNAPSHOT"
+
+
+@cache
+def get_settings() -> Settings:
+    snapshot = os.environ.get(SETTINGS_SNAPSHOT_ENV)
+    if snapshot:
+        return Settings.model_validate_json(snapshot)
+
+    return Settings.initialize()
+
+
+def share_settings():
+    os.environ[SETTINGS_SNAPSHOT_ENV] = get_settings().model_dump_json()
+
+
+class LazySettings:
+    # Importing config stays cheap, the settings are built on the first attribute access
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(get_settings(), name, value)
+
+
+settings = cast(Settings, LazySettings())
\ No newline at end of file
@@ -1,5 +1,21 @@
+import pytest
+
+from config import share_settings
+
 pytest_plugins = (
+    "fixtures.logs",
+    "fixtures.scheduling",
+    "fixtures.impact",
+    "fixtures.local_app",
     "fixtures.browsers",
     "fixtures.allure",
-    "fixtures.pages"
-)
\ No newline at end of file
+    "fixtures.pages",
+    "fixtures.reruns",
+    "fixtures.metrics",
+    "fixtures.ui_coverage"
+)
+
+
+def pytest_configure(config: pytest.Config):
+    if not hasattr(config, "workerinput"):
+        share_settings()
@@ -0,0 +1,40 @@
+from config import ReportingLevel
+from tools.allure.steps import report_step
+from playwright.async_api import expect
+from ui_coverage_tool import ActionType
+
+from elements import base_element
+from tools.logger import get_logger
+
+logger = get_logger("ASYNC_BASE_ELEMENT")
+
+class BaseElement(base_element.BaseElement):
+    __slots__ = ()
+
+    async def click(self, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Clicking {} '{}'", self.type_of, self.name, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await locator.click()
+
+        self.track_coverage(ActionType.CLICK, nth, **kwargs)
+
+    async def check_visible(self, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Check that {} '{}' is visible", self.type_of, self.name, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await expect(locator).to_be_visible()
+
+        self.track_coverage(ActionType.VISIBLE, nth, **kwargs)
+
+    async def check_have_text(self, text: str, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Check that {} '{}' has text '{}'",
+            self.type_of, self.name, text, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await expect(locator).to_have_text(text)
+
+        self.track_coverage(ActionType.TEXT, nth, **kwargs)
@@ -0,0 +1,33 @@
+from config import ReportingLevel
+from tools.allure.steps import report_step
+from playwright.async_api import expect
+from ui_coverage_tool import ActionType
+
+from elements import button
+from elements.async_api.base_element import BaseElement
+from tools.logger import get_logger
+
+logger = get_logger("ASYNC_BUTTON")
+
+class Button(BaseElement, button.Button):
+    __slots__ = ()
+
+    async def check_enabled(self, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that {} '{}' is enabled",
+            self.type_of, self.name, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await expect(locator).to_be_enabled()
+
+            self.track_coverage(ActionType.ENABLED, nth, **kwargs)
+
+    async def check_disabled(self, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that {} '{}' is disabled",
+            self.type_of, self.name, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await expect(locator).to_be_disabled()
+
+            self.track_coverage(ActionType.DISABLED, nth, **kwargs)
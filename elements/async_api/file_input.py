@@ -0,0 +1,19 @@
+from config import ReportingLevel
+from tools.allure.steps import report_step
+
+from elements import file_input
+from elements.async_api.base_element import BaseElement
+from tools.logger import get_logger
+
+logger = get_logger("ASYNC_FILE_INPUT")
+
+class FileInput(BaseElement, file_input.FileInput):
+    __slots__ = ()
+
+    async def set_input_file(self, file, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Set file '{}' to the {} '{}'",
+            file, self.type_of, self.name, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await locator.set_input_files(file)
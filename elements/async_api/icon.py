@@ -0,0 +1,6 @@
+from elements import icon
+from elements.async_api.base_element import BaseElement
+
+
+class Icon(BaseElement, icon.Icon):
+    __slots__ = ()
@@ -0,0 +1,6 @@
+from elements import image
+from elements.async_api.base_element import BaseElement
+
+
+class Image(BaseElement, image.Image):
+    __slots__ = ()
@@ -0,0 +1,6 @@
+from elements import link
+from elements.async_api.base_element import BaseElement
+
+
+class Link(BaseElement, link.Link):
+    __slots__ = ()
@@ -0,0 +1,6 @@
+from elements import text
+from elements.async_api.base_element import BaseElement
+
+
+class Text(BaseElement, text.Text):
+    __slots__ = ()
@@ -0,0 +1,33 @@
+from config import ReportingLevel
+from tools.allure.steps import report_step
+from playwright.async_api import expect
+from ui_coverage_tool import ActionType
+
+from elements import textarea
+from elements.async_api.base_element import BaseElement
+from tools.logger import get_logger
+
+logger = get_logger("ASYNC_TEXT_AREA")
+
+class TextArea(BaseElement, textarea.TextArea):
+    __slots__ = ()
+
+    async def fill(self, value, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Filling {} '{}' with a '{}'",
+            self.type_of, self.name, value, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await locator.fill(value)
+
+        self.track_coverage(ActionType.FILL, nth, **kwargs)
+
+    async def check_have_value(self, value, nth: int = 0, **kwargs):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that {} '{}' has value a '{}'",
+            self.type_of, self.name, value, element=self.name
+        ):
+            locator = self.get_locator(nth, **kwargs)
+            await expect(locator).to_have_value(value)
+
+        self.track_coverage(ActionType.VALUE, nth, **kwargs)
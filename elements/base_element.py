@@ -1,12 +1,16 @@
-import allure
+from config import ReportingLevel
+from tools.allure.steps import report_step
 from playwright.sync_api import Page, Locator, expect
 from elements.ui_coverage import tracker
-from ui_coverage_tool import ActionType, SelectorType
+from ui_coverage_tool import ActionType
 from tools.logger import get_logger
+from tools.playwright.locators import get_locator_cache
 
 logger = get_logger("BASE_ELEMENT")
 
 class BaseElement:
+    __slots__ = ("page", "locator", "name")
+
     def __init__(self, page: Page, locator: str, name: str):
         self.page = page
         self.locator = locator
@@ -17,49 +21,49 @@ class BaseElement:
         return "base element"
 
     def get_locator(self, nth: int = 0, **kwargs) -> Locator:
-        locator = self.locator.format(**kwargs)
-        step = f"Getting locator with 'data_test_id={locator}' at index '{nth}'"
-
-        with allure.step(step):
-            logger.info(step)
+        key = (type(self), self.locator, nth, frozenset(kwargs.items()))
+        return get_locator_cache().get(self.page, key, lambda: self.build_locator(self.locator.format(**kwargs), nth))
+
+    def build_locator(self, locator: str, nth: int) -> Locator:
+        with report_step(
+            ReportingLevel.FULL, logger, "Getting locator with 'data_test_id={}' at index '{}'",
+            locator, nth, element=self.name
+        ):
             return self.page.get_by_test_id(locator).nth(nth)
 
+    def get_query(self, nth: int = 0, **kwargs) -> dict:
+        return {"testId": self.locator.format(**kwargs), "nth": nth, "selector": None}
+
     def get_raw_locator(self, nth: int = 0, **kwargs) -> str:
         return f"//*[@data-testid='{self.locator.format(**kwargs)}'][{nth + 1}]"
 
     def track_coverage(self, action_type: ActionType, nth: int = 0, **kwargs):
-        tracker.track_coverage(
-            selector=self.get_raw_locator(nth, **kwargs),
-            action_type=action_type,
-            selector_type=SelectorType.XPATH
-        )
+        tracker.track_element_coverage(self, action_type, nth, kwargs)
 
     def click(self, nth: int = 0, **kwargs):
-        step = f"Clicking {self.type_of} '{self.name}'"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Clicking {} '{}'", self.type_of, self.name, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             locator.click()
 
         self.track_coverage(ActionType.CLICK, nth, **kwargs)
 
     def check_visible(self, nth: int = 0, **kwargs):
-        step = f"Check that {self.type_of} '{self.name}' is visible"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Check that {} '{}' is visible", self.type_of, self.name, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             expect(locator).to_be_visible()
 
         self.track_coverage(ActionType.VISIBLE, nth, **kwargs)
 
     def check_have_text(self, text: str, nth: int = 0, **kwargs):
-        step = f"Check that {self.type_of} '{self.name}' has text '{text}'"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Check that {} '{}' has text '{}'",
+            self.type_of, self.name, text, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             expect(locator).to_have_text(text)
 
         self.track_coverage(ActionType.TEXT, nth, **kwargs)
\ No newline at end of file
@@ -1,4 +1,5 @@
-import allure
+from config import ReportingLevel
+from tools.allure.steps import report_step
 
 from elements.base_element import BaseElement
 from playwright.sync_api import expect
@@ -9,27 +10,28 @@ from tools.logger import get_logger
 logger = get_logger("BUTTON")
 
 class Button(BaseElement):
+    __slots__ = ()
 
     @property
     def type_of(self) -> str:
         return "button"
 
     def check_enabled(self, nth: int = 0, **kwargs):
-        step = f"Checking that {self.type_of} '{self.name}' is enabled"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that {} '{}' is enabled",
+            self.type_of, self.name, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             expect(locator).to_be_enabled()
 
             self.track_coverage(ActionType.ENABLED, nth, **kwargs)
 
     def check_disabled(self, nth: int = 0, **kwargs):
-        step = f"Checking that {self.type_of} '{self.name}' is disabled"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that {} '{}' is disabled",
+            self.type_of, self.name, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             expect(locator).to_be_disabled()
 
             self.track_coverage(ActionType.DISABLED, nth, **kwargs)
\ No newline at end of file
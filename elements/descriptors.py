@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import get_type_hints
+
+from elements.base_element import BaseElement
+
+
+class TemplateFields(dict):
+    # Fields the owner doesn't have, such as the runtime {index}, stay in the locator for get_locator
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+class LazyAttribute(ABC):
+    def __init__(self, attribute_type: type):
+        self.attribute_type = attribute_type
+        self.resolved_types: dict[type, type] = {}
+
+    def __set_name__(self, owner: type, name: str):
+        self.attribute = name
+
+    def resolve_type(self, owner: type) -> type:
+        if owner not in self.resolved_types:
+            # Async page objects narrow the declared classes in their annotations
+            hint = get_type_hints(owner).get(self.attribute)
+            is_narrowed = isinstance(hint, type) and issubclass(hint, self.attribute_type)
+            self.resolved_types[owner] = hint if is_narrowed else self.attribute_type
+
+        return self.resolved_types[owner]
+
+    def format(self, instance, template: str) -> str:
+        if "{" not in template:
+            return template
+
+        return template.format_map(TemplateFields(vars(instance)))
+
+    @abstractmethod
+    def create(self, instance, attribute_type: type):
+        ...
+
+    def __get__(self, instance, owner: type):
+        if instance is None:
+            return self
+
+        # Stored in the instance dict, which shadows this non-data descriptor on every later access
+        value = self.create(instance, self.resolve_type(owner))
+        vars(instance)[self.attribute] = value
+        return value
+
+
+class Element(LazyAttribute):
+    def __init__(self, element_type: type[BaseElement], locator: str, name: str):
+        super().__init__(element_type)
+        self.locator = locator
+        self.name = name
+
+    def create(self, instance, element_type: type[BaseElement]) -> BaseElement:
+        return element_type(instance.page, self.format(instance, self.locator), self.name)
@@ -1,4 +1,5 @@
-import allure
+from config import ReportingLevel
+from tools.allure.steps import report_step
 
 from elements.base_element import BaseElement
 
@@ -7,15 +8,16 @@ from tools.logger import get_logger
 logger = get_logger("FILE_INPUT")
 
 class FileInput(BaseElement):
+    __slots__ = ()
 
     @property
     def type_of(self) -> str:
         return "file input"
 
     def set_input_file(self, file, nth: int = 0, **kwargs):
-        step = f"Set file '{file}' to the {self.type_of} '{self.name}'"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Set file '{}' to the {} '{}'",
+            file, self.type_of, self.name, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             locator.set_input_files(file)
\ No newline at end of file
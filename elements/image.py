@@ -2,6 +2,8 @@ from elements.base_element import BaseElement
 
 
 class Image(BaseElement):
+    __slots__ = ()
+
     @property
     def type_of(self) -> str:
         return "image"
\ No newline at end of file
@@ -1,4 +1,5 @@
-import allure
+from config import ReportingLevel
+from tools.allure.steps import report_step
 
 from elements.base_element import BaseElement
 from playwright.sync_api import expect, Locator
@@ -8,33 +9,37 @@ from tools.logger import get_logger
 logger = get_logger("INPUT")
 
 class Input(BaseElement):
+    __slots__ = ()
 
     @property
     def type_of(self) -> str:
         return "input"
 
-    def get_locator(self, nth: int = 0, **kwargs) -> Locator:
-        return super().get_locator(nth, **kwargs).locator("input")
+    def build_locator(self, locator: str, nth: int) -> Locator:
+        return super().build_locator(locator, nth).locator("input")
+
+    def get_query(self, nth: int = 0, **kwargs) -> dict:
+        return {**super().get_query(nth, **kwargs), "selector": "input"}
 
     def get_raw_locator(self, nth: int = 0, **kwargs) -> str:
         return f"{super().get_raw_locator(nth, **kwargs)}//input"
 
     def fill(self, value, nth: int = 0, **kwargs):
-        step = f"Filling {self.type_of} '{self.name}' with a '{value}'"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Filling {} '{}' with a '{}'",
+            self.type_of, self.name, value, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             locator.fill(value)
 
         self.track_coverage(ActionType.FILL, nth, **kwargs)
 
     def check_have_value(self, value, nth: int = 0, **kwargs):
-        step = f"Checking that {self.type_of} '{self.name}' has value a '{value}'"
-
-        with allure.step(step):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that {} '{}' has value a '{}'",
+            self.type_of, self.name, value, element=self.name
+        ):
             locator = self.get_locator(nth, **kwargs)
-            logger.info(step)
             expect(locator).to_have_value(value)
 
         self.track_coverage(ActionType.VALUE, nth, **kwargs)
\ No newline at end of file
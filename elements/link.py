@@ -1,6 +1,8 @@
 from elements.base_element import BaseElement
 
 class Link(BaseElement):
+    __slots__ = ()
+
     @property
     def type_of(self) -> str:
         return "link"
\ No newline at end of file
@@ -2,6 +2,8 @@ from elements.base_element import BaseElement
 
 
 class Text(BaseElement):
+    __slots__ = ()
+
     @property
     def type_of(self) -> str:
         return "text"
\ No newline at end of file
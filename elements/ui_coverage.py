@@ -1,3 +1,49 @@
-from ui_coverage_tool import UICoverageTracker
+import atexit
+from collections import Counter
+from typing import Hashable, Protocol
 
-tracker = UICoverageTracker(app="ui-course")
+from ui_coverage_tool import ActionType, SelectorType, UICoverageTracker
+
+# Safety net for very long tests, buffers are normally flushed after every test
+MAX_BUFFERED_EVENTS = 1_000
+
+
+class CoverageElement(Protocol):
+    def get_raw_locator(self, nth: int = 0, **kwargs) -> str: ...
+
+
+class BufferedUICoverageTracker:
+    def __init__(self, tracker: UICoverageTracker):
+        self.tracker = tracker
+        self.events: Counter[tuple[CoverageElement, ActionType, int, frozenset]] = Counter()
+        self.buffered = 0
+
+        atexit.register(self.flush)
+
+    def track_element_coverage(self, element: CoverageElement, action_type: ActionType, nth: int, kwargs: dict):
+        self.events[(element, action_type, nth, frozenset(kwargs.items()))] += 1
+        self.buffered += 1
+
+        if self.buffered >= MAX_BUFFERED_EVENTS:
+            self.flush()
+
+    def flush(self):
+        events, self.events, self.buffered = self.events, Counter(), 0
+        selectors: Counter[tuple[str, ActionType]] = Counter()
+
+        # Raw XPath selectors are only built here, once per distinct element event
+        for (element, action_type, nth, kwargs), count in events.items():
+            selectors[(element.get_raw_locator(nth, **dict(kwargs)), action_type)] += count
+
+        # A ui-coverage-tool result has no count, the report counts result files, so it cannot be
+        # aggregated per selector and action type: only the XPath building is deduplicated here
+        for (selector, action_type), count in selectors.items():
+            for _ in range(count):
+                self.tracker.track_coverage(
+                    selector=selector,
+                    action_type=action_type,
+                    selector_type=SelectorType.XPATH
+                )
+
+
+tracker = BufferedUICoverageTracker(UICoverageTracker(app="ui-course"))
@@ -1,19 +1,119 @@
+from functools import cache
+from pathlib import Path
+from typing import Callable, TYPE_CHECKING
+
 import pytest
 from _pytest.fixtures import SubRequest
-from playwright.sync_api import Playwright
-from pages.authentication.registration_page import RegistrationPage
+from playwright.sync_api import Playwright, BrowserContext
+from tools.playwright.artifacts import artifacts_stats, phase_report_key
+from tools.impact.graph import ImpactGraph
+from tools.playwright.browsers import BrowserRegistry
+from tools.metrics import save_metrics
+from tools.playwright.contexts import ContextPoolRegistry
+from tools.playwright.network_cache import NetworkCache
+from tools.playwright.readiness import save_readiness_stats
 from tools.playwright.page import initialize_playwright_page
-from config import settings
+from tools.playwright.state import get_browser_state
+from config import settings, Browser
 from tools.routes import AppRoute
 
+# Checkpoints, resource sizes and locators pull in filelock, the async API and the settings, they are imported when used
+if TYPE_CHECKING:
+    from tools.playwright.checkpoints import CheckpointStore
+
+# Fixtures that run once per configured browser engine
+BROWSER_FIXTURES = ("page", "page_with_state")
+
+
+def get_parametrized_names(metafunc: pytest.Metafunc) -> set[str]:
+    names = set()
+    for marker in metafunc.definition.iter_markers("parametrize"):
+        argnames = marker.args[0] if marker.args else marker.kwargs["argnames"]
+        names.update(argnames.replace(" ", "").split(",") if isinstance(argnames, str) else argnames)
+
+    return names
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    # The engines are read from the settings at collection, not when this plugin is imported.
+    # A test parametrizing one of these names directly overrides the fixture, like with fixture params
+    parametrized_names = get_parametrized_names(metafunc)
+    for name in BROWSER_FIXTURES:
+        if name in metafunc.fixturenames and name not in parametrized_names:
+            metafunc.parametrize(name, settings.browsers, indirect=True)
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    report = yield
+    item.stash.setdefault(phase_report_key, {})[report.when] = report
+    return report
+
+@pytest.fixture(scope="session", autouse=True)
+def save_artifacts_stats():
+    yield
+    artifacts_stats.save()
+
+@pytest.fixture(scope="session", autouse=True)
+def save_resource_policy_stats():
+    yield
+
+    from tools.playwright.resources import save_blocked_resources_stats
+    save_blocked_resources_stats()
+
+@pytest.fixture(scope="session", autouse=True)
+def save_page_readiness_stats():
+    yield
+    save_readiness_stats()
+
+@pytest.fixture(scope="session", autouse=True)
+def save_locator_cache_stats():
+    yield
+
+    from tools.playwright.locators import get_locator_cache
+    if get_locator_cache.cache_info().currsize:
+        get_locator_cache().save()
+
+@pytest.fixture(scope="session")
+def browser_registry(request: SubRequest, playwright: Playwright) -> BrowserRegistry:
+    registry = BrowserRegistry(playwright, exclusive=request.config.getoption("schedule") == "browser")
+    yield registry
+    registry.close()
+    save_metrics("browsers", {"launches": registry.launches})
 
 @pytest.fixture(scope="session")
-def initialize_browser_state(playwright: Playwright):
-    browser = playwright.chromium.launch(headless=settings.headless)
-    context = browser.new_context(base_url=settings.get_base_url())
-    page = context.new_page()
+def network_cache() -> NetworkCache | None:
+    if not settings.network_cache.enabled:
+        yield None
+        return
+
+    cache = NetworkCache(settings.network_cache.cache_dir, revalidate=settings.network_cache.revalidate)
+    yield cache
+    save_metrics("network_cache", cache.stats.model_dump())
 
-    registration_page = RegistrationPage(page=page)
+@pytest.fixture(scope="session")
+def context_pools(browser_registry: BrowserRegistry, network_cache: NetworkCache | None) -> ContextPoolRegistry:
+    registry = ContextPoolRegistry(network_cache=network_cache)
+    yield registry
+    registry.close()
+
+@pytest.fixture(scope="session")
+def checkpoint_store(request: SubRequest) -> "CheckpointStore":
+    from tools.playwright.checkpoints import CheckpointStore
+
+    graph = ImpactGraph(request.config.rootpath, settings.impact_graph_file)
+    store = CheckpointStore(settings.checkpoints.cache_dir, settings.checkpoints.max_entries, graph)
+    yield store
+    save_metrics("checkpoints", store.stats.model_dump())
+
+@pytest.fixture
+def checkpoint(checkpoint_store: "CheckpointStore") -> Callable[..., bool]:
+    return checkpoint_store.run
+
+def register_test_user(context: BrowserContext):
+    from pages.authentication.registration_page import RegistrationPage
+
+    registration_page = RegistrationPage(page=context.new_page())
     registration_page.visit(AppRoute.REGISTRATION)
     registration_page.registration_form.fill(
         email=settings.test_user.email,
@@ -22,22 +122,34 @@ def initialize_browser_state(playwright: Playwright):
     )
     registration_page.click_registration_button()
 
-    context.storage_state(path=settings.browser_state_file)
-    browser.close()
+@pytest.fixture(scope="session")
+def initialize_browser_state(browser_registry: BrowserRegistry) -> Callable[[Browser], Path]:
+    @cache
+    def initialize(browser_type: Browser) -> Path:
+        return get_browser_state(browser_registry.get(browser_type), browser_type, create=register_test_user)
+
+    return initialize
 
-@pytest.fixture(params=settings.browsers)
-def page(request: SubRequest, playwright: Playwright):
+@pytest.fixture
+def page(request: SubRequest, browser_registry: BrowserRegistry, context_pools: ContextPoolRegistry):
     yield from initialize_playwright_page(
-        playwright=playwright,
+        context_pools=context_pools,
+        browser=browser_registry.get(request.param),
         browser_type=request.param,
-        test_name=request.node.name
+        item=request.node
     )
 
-@pytest.fixture(scope="function", params=settings.browsers)
-def page_with_state(request: SubRequest, playwright: Playwright, initialize_browser_state):
+@pytest.fixture(scope="function")
+def page_with_state(
+        request: SubRequest,
+        browser_registry: BrowserRegistry,
+        context_pools: ContextPoolRegistry,
+        initialize_browser_state: Callable[[Browser], Path]
+):
     yield from initialize_playwright_page(
-        playwright=playwright,
-        test_name=request.node.name,
+        context_pools=context_pools,
+        browser=browser_registry.get(request.param),
         browser_type=request.param,
-        storage_state=settings.browser_state_file
+        item=request.node,
+        storage_state=initialize_browser_state(request.param)
     )
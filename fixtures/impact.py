@@ -0,0 +1,63 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from config import settings
+from tools.impact.changes import get_git_diff, parse_diff
+from tools.impact.graph import ImpactGraph
+from tools.metrics import get_worker_id, save_metrics
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--changed-since",
+        default=None,
+        help="run only tests affected by the changes between this git ref and the working tree"
+    )
+    parser.addoption(
+        "--changed-diff",
+        default=None,
+        help=(
+            "run only tests using the data-testids changed by a unified diff file, "
+            "e.g. one taken from the application repository"
+        )
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    changed_since = config.getoption("changed_since")
+    changed_diff = config.getoption("changed_diff")
+    if not changed_since and not changed_diff:
+        return
+
+    started = time.perf_counter()
+    changed_files, changed_testids = parse_diff(get_git_diff(config.rootpath, changed_since) if changed_since else "")
+
+    # Paths in an external diff belong to another repository, only the data-testids it touches select tests here
+    if changed_diff:
+        changed_testids |= parse_diff(Path(changed_diff).read_text())[1]
+
+    graph = ImpactGraph(config.rootpath, settings.impact_graph_file)
+    affected = graph.get_affected_tests(changed_files, changed_testids)
+
+    selected, deselected = items, []
+    if affected is not None:
+        selected = [item for item in items if item.nodeid.partition("[")[0] in affected]
+        deselected = [item for item in items if item.nodeid.partition("[")[0] not in affected]
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    # Every xdist worker collects and selects the same items, one report is enough
+    if get_worker_id() in ("master", "gw0"):
+        save_metrics("impact", {
+            "changed_files": len(changed_files),
+            "changed_testids": len(changed_testids),
+            "modules_parsed": graph.parsed,
+            "selected": len(selected),
+            "deselected": len(deselected),
+            "selection_time": round(time.perf_counter() - started, 3)
+        })
@@ -0,0 +1,34 @@
+from urllib.parse import urlparse
+
+import pytest
+from pydantic import HttpUrl
+
+from config import settings
+from tools.local_app import LocalAppServer
+from tools.metrics import get_worker_id
+
+
+def get_local_app_port() -> int:
+    worker_id = get_worker_id()
+    return settings.local_app.port + (int(worker_id.removeprefix("gw")) if worker_id != "master" else 0)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_app_server() -> LocalAppServer | None:
+    if not settings.local_app.enabled:
+        yield None
+        return
+
+    remote_app_url = settings.app_url
+    server = LocalAppServer(
+        settings.local_app.build_dir,
+        prefix=urlparse(str(remote_app_url)).path,
+        port=get_local_app_port()
+    )
+    server.start()
+    settings.app_url = HttpUrl(server.url)
+
+    yield server
+
+    settings.app_url = remote_app_url
+    server.stop()
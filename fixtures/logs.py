@@ -0,0 +1,19 @@
+import pytest
+
+from tools.logger import configure_logging, log_test_context, stop_logging
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config):
+    configure_logging()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_unconfigure(config: pytest.Config):
+    stop_logging()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(item: pytest.Item):
+    with log_test_context(item.nodeid):
+        return (yield)
@@ -0,0 +1,18 @@
+import pytest
+
+from tools.metrics import clear_metrics, load_metrics, merge_metrics
+
+
+def pytest_sessionstart(session: pytest.Session):
+    if not hasattr(session.config, "workerinput"):
+        clear_metrics()
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter):
+    metrics = load_metrics()
+    if not metrics:
+        return
+
+    terminalreporter.section("metrics")
+    for name, items in metrics.items():
+        terminalreporter.write_line(f"{name}: {merge_metrics(items)}")
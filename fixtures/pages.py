@@ -1,31 +1,42 @@
+from typing import TYPE_CHECKING
+
 import pytest
 from playwright.sync_api import Page
-from pages.dashboard.dashboard_page import DashboardPage
-from pages.authentication.login_page import LoginPage
-from pages.authentication.registration_page import RegistrationPage
-from pages.courses.courses_list_page import CoursesListPage
-from pages.courses.create_course_page import CreateCoursePage
+
+# Pages pull in every component and element, they are imported when a fixture is requested, not at collection
+if TYPE_CHECKING:
+    from pages.authentication.login_page import LoginPage
+    from pages.authentication.registration_page import RegistrationPage
+    from pages.courses.courses_list_page import CoursesListPage
+    from pages.courses.create_course_page import CreateCoursePage
+    from pages.dashboard.dashboard_page import DashboardPage
 
 @pytest.fixture
-def login_page(page: Page) -> LoginPage:
+def login_page(page: Page) -> "LoginPage":
+    from pages.authentication.login_page import LoginPage
     return LoginPage(page=page)
 
 @pytest.fixture
-def registration_page(page: Page) -> RegistrationPage:
+def registration_page(page: Page) -> "RegistrationPage":
+    from pages.authentication.registration_page import RegistrationPage
     return RegistrationPage(page=page)
 
 @pytest.fixture
-def dashboard_page(page: Page) -> DashboardPage:
+def dashboard_page(page: Page) -> "DashboardPage":
+    from pages.dashboard.dashboard_page import DashboardPage
     return DashboardPage(page=page)
 
 @pytest.fixture
-def dashboard_page_with_state(page_with_state: Page) -> DashboardPage:
+def dashboard_page_with_state(page_with_state: Page) -> "DashboardPage":
+    from pages.dashboard.dashboard_page import DashboardPage
     return DashboardPage(page=page_with_state)
 
 @pytest.fixture
-def courses_list_page(page_with_state: Page) -> CoursesListPage:
+def courses_list_page(page_with_state: Page) -> "CoursesListPage":
+    from pages.courses.courses_list_page import CoursesListPage
     return CoursesListPage(page=page_with_state)
 
 @pytest.fixture
-def create_course_page(page_with_state: Page) -> CreateCoursePage:
-    return CreateCoursePage(page=page_with_state)
\ No newline at end of file
+def create_course_page(page_with_state: Page) -> "CreateCoursePage":
+    from pages.courses.create_course_page import CreateCoursePage
+    return CreateCoursePage(page=page_with_state)
@@ -0,0 +1,132 @@
+import time
+from enum import Enum
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+from tools.metrics import save_metrics
+from tools.playwright.page import playwright_pages_key
+
+logger = get_logger("FAST_RERUN")
+
+# Immutable values that are the same in every attempt
+REBUILDABLE_TYPES = (str, bytes, int, float, bool, Enum, Path, type(None))
+
+rerunning_key = pytest.StashKey[bool]()
+
+
+class FastRerunStats(BaseModel):
+    tests: int = 0
+    attempts: int = 0
+    passed_on_rerun: int = 0
+    restart_time: float = 0.0
+    durations: dict[str, list[float]] = {}
+
+
+fast_rerun_stats = FastRerunStats()
+
+
+def get_pages(item: pytest.Function) -> list:
+    return [playwright_page.page for playwright_page in item.stash.get(playwright_pages_key, [])]
+
+
+def is_rebuildable(item: pytest.Function, name: str, value) -> bool:
+    from pages.base_page import BasePage
+
+    # Fixtures of a wider scope outlive the attempt, direct parametrize values are passed as they are
+    fixturedefs = item._fixtureinfo.name2fixturedefs.get(name)
+    if fixturedefs and fixturedefs[-1].scope != "function":
+        return True
+
+    callspec = getattr(item, "callspec", None)
+    if callspec and name in callspec.params and value is callspec.params[name]:
+        return True
+
+    pages = get_pages(item)
+    if any(value is page for page in pages):
+        return True
+
+    if isinstance(value, BasePage):
+        return any(value.page is page for page in pages)
+
+    return isinstance(value, REBUILDABLE_TYPES)
+
+
+def restart_pages(item: pytest.Function):
+    from pages.base_page import BasePage
+
+    for playwright_page in item.stash.get(playwright_pages_key, []):
+        old_page, new_page = playwright_page.page, playwright_page.restart()
+
+        # Page objects were built by function fixtures for the old page, they are rebuilt instead of the fixtures
+        for name, value in item.funcargs.items():
+            if value is old_page:
+                item.funcargs[name] = new_page
+            elif isinstance(value, BasePage) and value.page is old_page:
+                item.funcargs[name] = type(value)(page=new_page)
+
+
+def call_again(pyfuncitem: pytest.Function):
+    # Runs every pytest_pyfunc_call implementation again, e.g. the ones of async plugins, only this wrapper steps aside
+    pyfuncitem.stash[rerunning_key] = True
+    try:
+        return pyfuncitem.ihook.pytest_pyfunc_call(pyfuncitem=pyfuncitem)
+    finally:
+        pyfuncitem.stash[rerunning_key] = False
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function):
+    marker = pyfuncitem.get_closest_marker("fast_rerun")
+    if marker is None or pyfuncitem.stash.get(rerunning_key, False):
+        return (yield)
+
+    not_rebuildable = [
+        name for name in pyfuncitem._fixtureinfo.argnames
+        if not is_rebuildable(pyfuncitem, name, pyfuncitem.funcargs[name])
+    ]
+    if not_rebuildable:
+        pytest.fail(
+            f"fast_rerun can only rebuild pages, page objects and immutable values, "
+            f"'{pyfuncitem.nodeid}' also gets {', '.join(not_rebuildable)}",
+            pytrace=False
+        )
+
+    reruns = marker.kwargs.get("reruns", marker.args[0] if marker.args else 1)
+    durations = fast_rerun_stats.durations[pyfuncitem.nodeid] = []
+    fast_rerun_stats.tests += 1
+
+    try:
+        for attempt in range(1, reruns + 2):
+            # Artifact policies such as on-first-retry count attempts the same way as pytest-rerunfailures
+            pyfuncitem.execution_count = attempt
+            fast_rerun_stats.attempts += 1
+            started = time.perf_counter()
+
+            try:
+                result = (yield) if attempt == 1 else call_again(pyfuncitem)
+                durations.append(round(time.perf_counter() - started, 3))
+                fast_rerun_stats.passed_on_rerun += attempt > 1
+                return result
+            except Exception as error:
+                durations.append(round(time.perf_counter() - started, 3))
+                if attempt > reruns:
+                    raise
+
+                logger.warning(
+                    f"Attempt {attempt} of '{pyfuncitem.nodeid}' failed, rerunning in a fresh context: {error}"
+                )
+                started = time.perf_counter()
+                pyfuncitem.execution_count = attempt + 1
+                restart_pages(pyfuncitem)
+                fast_rerun_stats.restart_time += time.perf_counter() - started
+    finally:
+        pyfuncitem.user_properties.append(("attempt_durations", durations))
+
+
+def pytest_sessionfinish():
+    if fast_rerun_stats.tests:
+        fast_rerun_stats.restart_time = round(fast_rerun_stats.restart_time, 3)
+        save_metrics("fast_reruns", fast_rerun_stats.model_dump())
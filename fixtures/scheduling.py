@@ -0,0 +1,101 @@
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from config import settings
+from tools.metrics import save_metrics
+from tools.scheduling.capacity import get_worker_count
+from tools.scheduling.timings import TimingStore
+
+# The schedulers pull in the xdist controller side, runs without xdist or with the default --schedule never use it
+if TYPE_CHECKING:
+    from tools.scheduling.lpt import LPTScheduling
+
+# Only set on the controller, which sees the reports of every worker
+timings: TimingStore | None = None
+scheduler: "LPTScheduling | None" = None
+capacity: dict | None = None
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--schedule",
+        choices=["load", "lpt", "browser"],
+        default="load",
+        help=(
+            "xdist scheduling: load keeps the --dist mode, lpt sends the longest tests first by recorded timings, "
+            "browser does the same while keeping each worker on one browser engine. Only lpt and browser retire "
+            "workers when available memory drops below WORKERS.MEMORY_RESERVE_MB"
+        )
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    global timings
+
+    if not hasattr(config, "workerinput"):
+        timings = TimingStore(settings.timings_file)
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_auto_num_workers(config: pytest.Config) -> int | None:
+    global capacity
+
+    # An explicit count still wins, like with the default xdist implementation
+    if os.environ.get("PYTEST_XDIST_AUTO_NUM_WORKERS"):
+        return None
+
+    engines = [browser.value for browser in settings.browsers]
+    capacity = get_worker_count(engines, exclusive=config.getoption("schedule") == "browser")
+    return capacity["workers"]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    global scheduler
+
+    from tools.scheduling.affinity import BrowserAffinityScheduling
+    from tools.scheduling.lpt import LPTScheduling
+
+    if config.getoption("schedule") == "lpt":
+        scheduler = LPTScheduling(config, log, timings)
+        return scheduler
+
+    if config.getoption("schedule") == "browser":
+        scheduler = BrowserAffinityScheduling(config, log, timings)
+        return scheduler
+
+    return None
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    # Without xdist the collection order is the run order, so tests of one engine are kept together
+    if config.getoption("schedule") == "browser":
+        from tools.scheduling.affinity import get_test_engine
+        items.sort(key=lambda item: get_test_engine(item.nodeid) or "")
+
+
+def get_attempt_duration(report: pytest.TestReport) -> float:
+    # Fast reruns retry inside a single call phase, only the time of their last attempt counts
+    attempt_durations = dict(report.user_properties).get("attempt_durations")
+    if report.when == "call" and attempt_durations:
+        return attempt_durations[-1]
+
+    return report.duration
+
+
+def pytest_runtest_logreport(report: pytest.TestReport):
+    if timings is not None:
+        timings.record(report.nodeid, report.when, get_attempt_duration(report))
+
+
+def pytest_sessionfinish():
+    if timings is not None:
+        timings.save()
+
+    if scheduler is not None:
+        save_metrics("scheduling", scheduler.get_report())
+
+    if capacity is not None:
+        save_metrics("workers", capacity)
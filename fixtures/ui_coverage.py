@@ -0,0 +1,11 @@
+import pytest
+
+from elements.ui_coverage import tracker
+
+
+def pytest_runtest_logfinish():
+    tracker.flush()
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    tracker.flush()
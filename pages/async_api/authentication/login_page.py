@@ -0,0 +1,25 @@
+from components.async_api.authentication.login_form_component import LoginFormComponent
+from elements.async_api.button import Button
+from elements.async_api.link import Link
+from elements.async_api.text import Text
+from pages.async_api.base_page import BasePage
+from pages.authentication import login_page
+from tools.allure.steps import async_step
+
+
+class LoginPage(BasePage, login_page.LoginPage):
+    login_form: LoginFormComponent
+    login_button: Button
+    registration_link: Link
+    wrong_email_or_password_alert: Text
+
+    async def click_login_button(self):
+        await self.login_button.click()
+
+    async def click_registration_link(self):
+        await self.registration_link.click()
+
+    @async_step("Check visible wrong email or password alert")
+    async def check_visible_wrong_email_or_password_alert(self):
+        await self.wrong_email_or_password_alert.check_visible()
+        await self.wrong_email_or_password_alert.check_have_text("Wrong email or password")
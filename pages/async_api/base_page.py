@@ -0,0 +1,47 @@
+from typing import Pattern
+
+from config import ReportingLevel
+from tools.allure.steps import report_step
+from playwright.async_api import expect
+
+from config import settings, NavigationMode
+from pages import base_page
+from tools.logger import get_logger
+from tools.playwright.readiness import wait_for_readiness_async
+
+logger = get_logger("ASYNC_BASE_PAGE")
+
+class BasePage(base_page.BasePage):
+    async def visit(self, url: str):
+        with report_step(ReportingLevel.ACTIONS, logger, "Opening the {}", url):
+            if settings.navigation_mode == NavigationMode.HASH:
+                await self.navigate(url)
+            else:
+                await self.page.goto(url, wait_until="networkidle")
+
+    async def navigate(self, url: str):
+        _, _, route = url.partition("#")
+
+        if route and self.is_app_loaded():
+            await self.page.evaluate(base_page.SET_HASH_SCRIPT, route)
+        else:
+            await self.page.goto(url, wait_until="load")
+
+        await self.wait_for_ready()
+
+    async def wait_for_ready(self) -> float:
+        return await wait_for_readiness_async(self.page, self.readiness, type(self).__name__)
+
+    async def reload(self):
+        with report_step(ReportingLevel.ACTIONS, logger, "Reload page with {}", self.page.url):
+            if settings.navigation_mode == NavigationMode.HASH:
+                await self.page.reload(wait_until="load")
+                await self.wait_for_ready()
+            else:
+                await self.page.reload(wait_until="networkidle")
+
+    async def check_current_url(self, expected_url: Pattern[str]):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that current page have url {}", expected_url.pattern
+        ):
+            await expect(self.page).to_have_url(expected_url)
@@ -0,0 +1,42 @@
+import asyncio
+
+from components.async_api.charts.chart_view_component import ChartViewComponent
+from components.async_api.dashboard.dashboard_toolbar_view_component import DashboardToolbarViewComponent
+from components.async_api.navigation.navbar_component import NavbarComponent
+from components.async_api.navigation.sidebar_component import SidebarComponent
+from pages.async_api.base_page import BasePage
+from pages.dashboard import dashboard_page
+from tools.allure.steps import async_step, suspend_steps
+
+
+class DashboardPage(BasePage, dashboard_page.DashboardPage):
+    sidebar: SidebarComponent
+    navbar: NavbarComponent
+    dashboard_toolbar: DashboardToolbarViewComponent
+    chart_view_students: ChartViewComponent
+    chart_view_activities: ChartViewComponent
+    chart_view_courses: ChartViewComponent
+    chart_view_scores: ChartViewComponent
+
+    async def check_visible_students_chart(self):
+        await self.chart_view_students.check_visible(title="Students")
+
+    async def check_visible_activities_chart(self):
+        await self.chart_view_activities.check_visible(title="Activities")
+
+    async def check_visible_courses_chart(self):
+        await self.chart_view_courses.check_visible(title="Courses")
+
+    async def check_visible_scores_chart(self):
+        await self.chart_view_scores.check_visible(title="Scores")
+
+    @async_step("Check visible dashboard charts")
+    async def check_visible_charts(self):
+        # The charts are checked concurrently, so their own steps are only logged under this one
+        with suspend_steps():
+            await asyncio.gather(
+                self.check_visible_students_chart(),
+                self.check_visible_activities_chart(),
+                self.check_visible_courses_chart(),
+                self.check_visible_scores_chart()
+            )
@@ -1,4 +1,4 @@
-import allure
+from tools.allure.steps import step
 from playwright.sync_api import Page, expect
 
 from components.authentication.login_form_component import LoginFormComponent
@@ -6,16 +6,18 @@ from elements.button import Button
 from elements.link import Link
 from elements.text import Text
 from pages.base_page import BasePage
+from tools.playwright.readiness import ElementVisibleReadiness
+from elements.descriptors import Element
+from components.descriptors import Component
 
 class LoginPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    readiness = ElementVisibleReadiness("login-page-login-button")
 
-        self.login_form = LoginFormComponent(page)
+    login_form = Component(LoginFormComponent)
 
-        self.login_button = Button(page, "login-page-login-button", "Login")
-        self.registration_link = Link(page, "login-page-registration-link", "Registration")
-        self.wrong_email_or_password_alert = Text(page, "login-page-wrong-email-or-password-alert", "Alert")
+    login_button = Element(Button, "login-page-login-button", "Login")
+    registration_link = Element(Link, "login-page-registration-link", "Registration")
+    wrong_email_or_password_alert = Element(Text, "login-page-wrong-email-or-password-alert", "Alert")
 
     def click_login_button(self):
         self.login_button.click()
@@ -23,7 +25,7 @@ class LoginPage(BasePage):
     def click_registration_link(self):
         self.registration_link.click()
 
-    @allure.step("Check visible wrong email or password alert")
+    @step("Check visible wrong email or password alert")
     def check_visible_wrong_email_or_password_alert(self):
         self.wrong_email_or_password_alert.check_visible()
         self.wrong_email_or_password_alert.check_have_text("Wrong email or password")
\ No newline at end of file
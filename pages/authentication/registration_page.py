@@ -2,22 +2,21 @@ from playwright.sync_api import Page, expect
 
 from components.authentication.registration_form_component import RegistrationFormComponent
 from pages.base_page import BasePage
+from tools.playwright.readiness import ElementVisibleReadiness
 from elements.text import Text
 from elements.button import Button
 from elements.link import Link
+from elements.descriptors import Element
+from components.descriptors import Component
 
 class RegistrationPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    readiness = ElementVisibleReadiness("registration-page-registration-button")
 
-        self.registration_form = RegistrationFormComponent(page)
-
-        self.page_title = Text(page, "authentication-ui-course-title-text", "Authentication page title")
-        self.registration_button = Button(
-            page, "registration-page-registration-button", "Registration button"
-        )
-        self.login_link = Link(page, "registration-page-login-link", "Login link")
+    registration_form = Component(RegistrationFormComponent)
 
+    page_title = Element(Text, "authentication-ui-course-title-text", "Authentication page title")
+    registration_button = Element(Button, "registration-page-registration-button", "Registration button")
+    login_link = Element(Link, "registration-page-login-link", "Login link")
 
     def click_registration_button(self):
         self.registration_button.click()
@@ -1,33 +1,57 @@
-import allure
+from config import ReportingLevel
+from tools.allure.steps import report_step
 from playwright.sync_api import Page, expect
 from typing import Pattern
 
+from config import settings, NavigationMode
 from tools.logger import get_logger
+from tools.playwright.readiness import ReadinessStrategy, LoadStateReadiness, wait_for_readiness
 
 logger = get_logger("BASE_PAGE")
 
+SET_HASH_SCRIPT = "route => { window.location.hash = route }"
+
 class BasePage:
+    readiness: ReadinessStrategy = LoadStateReadiness("networkidle")
+
     def __init__(self, page: Page):
         self.page = page
 
 
     def visit(self, url: str):
-        step = f"Opening the {url}"
+        with report_step(ReportingLevel.ACTIONS, logger, "Opening the {}", url):
+            if settings.navigation_mode == NavigationMode.HASH:
+                self.navigate(url)
+            else:
+                self.page.goto(url, wait_until="networkidle")
 
-        with allure.step(step):
-            logger.info(step)
-            self.page.goto(url, wait_until="networkidle")
+    def navigate(self, url: str):
+        _, _, route = url.partition("#")
 
-    def reload(self):
-        step = f"Reload page with {self.page.url}"
+        # All app routes are hash routes, once the SPA is loaded switching the hash does not reload it
+        if route and self.is_app_loaded():
+            self.page.evaluate(SET_HASH_SCRIPT, route)
+        else:
+            self.page.goto(url, wait_until="load")
 
-        with allure.step(step):
-            logger.info(step)
-            self.page.reload(wait_until="networkidle")
+        self.wait_for_ready()
 
-    def check_current_url(self, expected_url: Pattern[str]):
-        step = f"Checking that current page have url {expected_url.pattern}"
+    def is_app_loaded(self) -> bool:
+        return self.page.url.startswith(settings.get_base_url())
 
-        with allure.step(step):
-            logger.info(step)
-            expect(self.page).to_have_url(expected_url)
\ No newline at end of file
+    def wait_for_ready(self) -> float:
+        return wait_for_readiness(self.page, self.readiness, type(self).__name__)
+
+    def reload(self):
+        with report_step(ReportingLevel.ACTIONS, logger, "Reload page with {}", self.page.url):
+            if settings.navigation_mode == NavigationMode.HASH:
+                self.page.reload(wait_until="load")
+                self.wait_for_ready()
+            else:
+                self.page.reload(wait_until="networkidle")
+
+    def check_current_url(self, expected_url: Pattern[str]):
+        with report_step(
+            ReportingLevel.ACTIONS, logger, "Checking that current page have url {}", expected_url.pattern
+        ):
+            expect(self.page).to_have_url(expected_url)
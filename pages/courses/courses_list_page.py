@@ -7,18 +7,18 @@ from components.navigation.navbar_component import NavbarComponent
 from components.navigation.sidebar_component import SidebarComponent
 from components.views.empty_view_component import EmptyViewComponent
 from pages.base_page import BasePage
+from tools.playwright.readiness import ElementVisibleReadiness
+from components.descriptors import Component
 
 
 class CoursesListPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        self.navbar = NavbarComponent(page)
-        self.sidebar = SidebarComponent(page)
-        self.empty_view = EmptyViewComponent(page, "courses-list")
-        self.course_view = CourseViewComponent(page)
-        self.toolbar_view = CoursesListToolbarViewComponent(page)
+    readiness = ElementVisibleReadiness("courses-list-toolbar-title-text")
 
+    navbar = Component(NavbarComponent)
+    sidebar = Component(SidebarComponent)
+    empty_view = Component(EmptyViewComponent, "courses-list")
+    course_view = Component(CourseViewComponent)
+    toolbar_view = Component(CoursesListToolbarViewComponent)
 
     def check_visible_empty_view(self):
         self.empty_view.check_visible(
@@ -7,18 +7,19 @@ from components.courses.create_course_toolbar_view_component import CreateCourse
 from components.views.empty_view_component import EmptyViewComponent
 from components.views.image_upload_widget_component import ImageUploadWidgetComponent
 from pages.base_page import BasePage
+from tools.playwright.readiness import ElementVisibleReadiness
+from components.descriptors import Component
 
 
 class CreateCoursePage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    readiness = ElementVisibleReadiness("create-course-toolbar-title-text")
 
-        self.image_upload_widget = ImageUploadWidgetComponent(page, "create-course-preview")
-        self.create_course_form = CreateCourseFormComponent(page)
-        self.exercises_empty_view = EmptyViewComponent(page, "create-course-exercises")
-        self.create_exercise_form = CreateCourseExerciseFormComponent(page)
-        self.exercises_toolbar = CreateCourseExercisesToolbarViewComponent(page)
-        self.create_course_toolbar = CreateCourseToolbarViewComponent(page)
+    image_upload_widget = Component(ImageUploadWidgetComponent, "create-course-preview")
+    create_course_form = Component(CreateCourseFormComponent)
+    exercises_empty_view = Component(EmptyViewComponent, "create-course-exercises")
+    create_exercise_form = Component(CreateCourseExerciseFormComponent)
+    exercises_toolbar = Component(CreateCourseExercisesToolbarViewComponent)
+    create_course_toolbar = Component(CreateCourseToolbarViewComponent)
 
     def check_visible_exercises_empty_view(self):
         self.exercises_empty_view.check_visible(
@@ -5,19 +5,20 @@ from components.dashboard.dashboard_toolbar_view_component import DashboardToolb
 from components.navigation.navbar_component import NavbarComponent
 from components.navigation.sidebar_component import SidebarComponent
 from pages.base_page import BasePage
+from tools.playwright.readiness import ElementVisibleReadiness
+from components.descriptors import Component
 
 
 class DashboardPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        self.sidebar = SidebarComponent(page)
-        self.navbar = NavbarComponent(page)
-        self.dashboard_toolbar = DashboardToolbarViewComponent(page)
-        self.chart_view_students = ChartViewComponent(page, "students", "bar")
-        self.chart_view_activities = ChartViewComponent(page, "activities", "line")
-        self.chart_view_courses = ChartViewComponent(page, "courses", "pie")
-        self.chart_view_scores = ChartViewComponent(page, "scores", "scatter")
+    readiness = ElementVisibleReadiness("dashboard-toolbar-title-text")
+
+    sidebar = Component(SidebarComponent)
+    navbar = Component(NavbarComponent)
+    dashboard_toolbar = Component(DashboardToolbarViewComponent)
+    chart_view_students = Component(ChartViewComponent, "students", "bar")
+    chart_view_activities = Component(ChartViewComponent, "activities", "line")
+    chart_view_courses = Component(ChartViewComponent, "courses", "pie")
+    chart_view_scores = Component(ChartViewComponent, "scores", "scatter")
 
     def check_visible_students_chart(self):
         self.chart_view_students.check_visible(title="Students")
@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 import allure
 import pytest
-from pages.authentication.login_page import LoginPage
+from typing import TYPE_CHECKING
 from tools.allure.tags import AllureTag
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
@@ -8,6 +10,9 @@ from tools.allure.stories import AllureStory
 from allure_commons.types import Severity
 from tools.routes import AppRoute
 
+if TYPE_CHECKING:
+    from pages.authentication.login_page import LoginPage
+
 
 
 @pytest.mark.regression
@@ -20,7 +25,7 @@ from tools.routes import AppRoute
 @allure.suite(AllureFeature.AUTHENTICATION)
 @allure.sub_suite(AllureStory.AUTHORIZATION)
 class TestAuthorization:
-    @pytest.mark.flaky(reruns=5)
+    @pytest.mark.fast_rerun(reruns=5)
     @pytest.mark.parametrize(
         "email, password",
         [
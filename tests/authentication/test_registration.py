@@ -1,7 +1,8 @@
+from __future__ import annotations
+
 import allure
 import pytest
-from pages.dashboard.dashboard_page import DashboardPage
-from pages.authentication.registration_page import RegistrationPage
+from typing import TYPE_CHECKING
 from tools.allure.tags import AllureTag
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
@@ -10,6 +11,10 @@ from allure_commons.types import Severity
 from tools.routes import AppRoute
 from config import settings
 
+if TYPE_CHECKING:
+    from pages.dashboard.dashboard_page import DashboardPage
+    from pages.authentication.registration_page import RegistrationPage
+
 
 @pytest.mark.regression
 @pytest.mark.registration
@@ -1,8 +1,11 @@
+from __future__ import annotations
+
+import re
+
 import allure
 import pytest
+from typing import TYPE_CHECKING, Callable
 
-from pages.courses.courses_list_page import CoursesListPage
-from pages.courses.create_course_page import CreateCoursePage
 from tools.allure.tags import AllureTag
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
@@ -11,6 +14,10 @@ from allure_commons.types import Severity
 from tools.routes import AppRoute
 from config import settings
 
+if TYPE_CHECKING:
+    from pages.courses.courses_list_page import CoursesListPage
+    from pages.courses.create_course_page import CreateCoursePage
+
 
 @pytest.mark.courses
 @pytest.mark.regression
@@ -31,6 +38,7 @@ class TestCourses:
         courses_list_page.toolbar_view.check_visible()
         courses_list_page.check_visible_empty_view()
 
+    @pytest.mark.resource_profile("visual")
     @allure.severity(Severity.BLOCKER)
     @allure.title("Successful course creation")
     def test_create_course(self, courses_list_page: CoursesListPage, create_course_page: CreateCoursePage):
@@ -63,28 +71,40 @@ class TestCourses:
 
     @allure.severity(Severity.CRITICAL)
     @allure.title("Successful course edition")
-    def test_edit_course(self, create_course_page: CreateCoursePage, courses_list_page: CoursesListPage
+    def test_edit_course(
+            self,
+            create_course_page: CreateCoursePage,
+            courses_list_page: CoursesListPage,
+            checkpoint: Callable[..., bool]
     ):
-        create_course_page.visit(url=AppRoute.COURSE_CREATE)
-        create_course_page.create_course_form.fill(
-            title="Супер курс",
-            estimated_time="2 недели",
-            description="Описание супер курса",
-            max_score="50",
-            min_score="10"
-        )
+        course = {
+            "title": "Супер курс",
+            "estimated_time": "2 недели",
+            "description": "Описание супер курса",
+            "max_score": "50",
+            "min_score": "10"
+        }
 
-        create_course_page.create_course_form.check_visible(
-            title="Супер курс",
-            estimated_time="2 недели",
-            description="Описание супер курса",
-            max_score="50",
-            min_score="10"
-        )
+        def create_course():
+            create_course_page.visit(url=AppRoute.COURSE_CREATE)
+            create_course_page.create_course_form.fill(**course)
+            create_course_page.create_course_form.check_visible(**course)
+            create_course_page.image_upload_widget.upload_preview_image(file=settings.test_data.image_png_file)
+            create_course_page.create_course_toolbar.create_course_button.click()
 
-        create_course_page.image_upload_widget.upload_preview_image(file=settings.test_data.image_png_file)
+            # The snapshot is taken from this state, so the app has to be back on the list showing the stored course
+            courses_list_page.check_current_url(re.compile(r".*/#/courses$"))
+            courses_list_page.wait_for_ready()
+            courses_list_page.course_view.check_visible(
+                index=0,
+                title=course["title"],
+                estimated_time=course["estimated_time"],
+                max_score=course["max_score"],
+                min_score=course["min_score"]
+            )
 
-        create_course_page.create_course_toolbar.create_course_button.click()
+        # The created course is restored from a storage snapshot once a run has recorded it
+        checkpoint("course-created", course, create_course, pages=[create_course_page, courses_list_page])
 
         courses_list_page.course_view.check_visible(
             index=0,
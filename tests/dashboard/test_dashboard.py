@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import allure
 import pytest
+from typing import TYPE_CHECKING
 from tools.allure.tags import AllureTag
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
@@ -7,7 +10,9 @@ from tools.allure.stories import AllureStory
 from allure_commons.types import Severity
 from tools.routes import AppRoute
 
-from pages.dashboard.dashboard_page import DashboardPage
+if TYPE_CHECKING:
+    from pages.dashboard.dashboard_page import DashboardPage
+
 
 @pytest.mark.dashboard
 @pytest.mark.regression
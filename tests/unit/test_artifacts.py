@@ -0,0 +1,37 @@
+import pytest
+
+from config import ArtifactPolicy
+from tools.playwright.artifacts import should_record, should_retain
+
+
+class TestShouldRecord:
+    @pytest.mark.parametrize("execution_count", [1, 2, 3])
+    def test_off_never_records(self, execution_count: int):
+        assert not should_record(ArtifactPolicy.OFF, execution_count)
+
+    @pytest.mark.parametrize("policy", [ArtifactPolicy.ALWAYS, ArtifactPolicy.RETAIN_ON_FAILURE])
+    @pytest.mark.parametrize("execution_count", [1, 2, 3])
+    def test_records_every_attempt(self, policy: ArtifactPolicy, execution_count: int):
+        assert should_record(policy, execution_count)
+
+    @pytest.mark.parametrize("execution_count, expected", [(1, False), (2, True), (3, False)])
+    def test_on_first_retry_records_second_attempt_only(self, execution_count: int, expected: bool):
+        assert should_record(ArtifactPolicy.ON_FIRST_RETRY, execution_count) is expected
+
+
+class TestShouldRetain:
+    @pytest.mark.parametrize("failed", [True, False])
+    def test_retain_on_failure_follows_outcome(self, failed: bool):
+        assert should_retain(ArtifactPolicy.RETAIN_ON_FAILURE, failed, execution_count=1) is failed
+
+    @pytest.mark.parametrize("failed", [True, False])
+    def test_always_retains(self, failed: bool):
+        assert should_retain(ArtifactPolicy.ALWAYS, failed, execution_count=1)
+
+    @pytest.mark.parametrize("failed", [True, False])
+    def test_off_never_retains(self, failed: bool):
+        assert not should_retain(ArtifactPolicy.OFF, failed, execution_count=1)
+
+    @pytest.mark.parametrize("execution_count, expected", [(1, False), (2, True)])
+    def test_on_first_retry_retains_recorded_attempt(self, execution_count: int, expected: bool):
+        assert should_retain(ArtifactPolicy.ON_FIRST_RETRY, failed=False, execution_count=execution_count) is expected
@@ -0,0 +1,53 @@
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from tools.impact.graph import ImpactGraph
+from tools.playwright.checkpoints import CheckpointStore
+
+
+class PageObject:
+    pass
+
+
+def create_course():
+    return "course"
+
+
+def create_other_course():
+    return "other course"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CheckpointStore:
+    graph = ImpactGraph(Path(__file__).parents[2], tmp_path.joinpath("impact-graph.json"))
+    return CheckpointStore(tmp_path.joinpath("checkpoints"), max_entries=2, graph=graph)
+
+
+class TestCheckpointStoreGetFile:
+    def test_same_flow_gives_same_file(self, store: CheckpointStore):
+        assert store.get_file("course", {}, [PageObject], create_course, "chromium") == store.get_file(
+            "course", {}, [PageObject], create_course, "chromium"
+        )
+
+    def test_flow_source_is_part_of_the_key(self, store: CheckpointStore):
+        assert store.get_file("course", {}, [PageObject], create_course, "chromium") != store.get_file(
+            "course", {}, [PageObject], create_other_course, "chromium"
+        )
+
+    def test_params_are_part_of_the_key(self, store: CheckpointStore):
+        assert store.get_file("course", {"title": "A"}, [PageObject], create_course, "chromium") != store.get_file(
+            "course", {"title": "B"}, [PageObject], create_course, "chromium"
+        )
+
+    def test_engine_is_part_of_the_key(self, store: CheckpointStore):
+        assert store.get_file("course", {}, [PageObject], create_course, "chromium") != store.get_file(
+            "course", {}, [PageObject], create_course, "firefox"
+        )
+
+    def test_partial_uses_the_source_of_its_function(self, store: CheckpointStore):
+        assert store.get_flow_source(partial(create_course)) == store.get_flow_source(create_course)
+
+    def test_flow_without_source_uses_its_name(self, store: CheckpointStore):
+        assert store.get_flow_source(print) == "builtins.print"
@@ -0,0 +1,145 @@
+from pathlib import Path
+
+import pytest
+
+from tools.impact.changes import parse_diff
+from tools.impact.graph import ImpactGraph
+
+DIFF = """diff --git a/pages/login_page.py b/pages/login_page.py
+index 1111111..2222222 100644
+--- a/pages/login_page.py
++++ b/pages/login_page.py
+@@ -1,3 +1,3 @@
+ class LoginPage:
+-    button = "login-page-login-button"
++    button = 'login-page-submit-button'
+     title = "login-page-title-text"
+diff --git a/tests/test_new.py b/tests/test_new.py
+new file mode 100644
+--- /dev/null
++++ b/tests/test_new.py
+@@ -0,0 +1 @@
++def test_new(): pass
+"""
+
+SOURCES = {
+    "elements/button.py": """
+class Button:
+    def __init__(self, locator: str):
+        self.locator = locator
+""",
+    "pages/login_page.py": """
+from elements.button import Button
+
+
+class LoginPage:
+    def __init__(self):
+        self.login_button = Button("login-page-login-button")
+""",
+    "pages/courses_page.py": """
+class CoursesPage:
+    title = "courses-list-toolbar-title-text"
+    course_title = "course-view-{index}-title-text"
+""",
+    "fixtures/pages.py": """
+import pytest
+
+from pages.courses_page import CoursesPage
+from pages.login_page import LoginPage
+
+
+@pytest.fixture
+def login_page():
+    return LoginPage()
+
+
+@pytest.fixture
+def courses_page():
+    return CoursesPage()
+""",
+    "tools/helpers.py": """
+def unused():
+    pass
+""",
+    "tests/test_login.py": """
+def test_login(login_page):
+    pass
+""",
+    "tests/test_courses.py": """
+class TestCourses:
+    def test_courses_list(self, courses_page):
+        pass
+
+    def test_courses_empty(self):
+        pass
+"""
+}
+
+LOGIN = "tests/test_login.py::test_login"
+COURSES_LIST = "tests/test_courses.py::TestCourses::test_courses_list"
+COURSES_EMPTY = "tests/test_courses.py::TestCourses::test_courses_empty"
+
+
+class TestParseDiff:
+    def test_changed_files(self):
+        changed_files, _ = parse_diff(DIFF)
+
+        assert changed_files == ["pages/login_page.py", "tests/test_new.py"]
+
+    def test_changed_testids_from_added_and_removed_lines(self):
+        _, changed_testids = parse_diff(DIFF)
+
+        assert changed_testids == {"login-page-login-button", "login-page-submit-button"}
+
+    def test_empty_diff(self):
+        assert parse_diff("") == ([], set())
+
+
+@pytest.fixture
+def graph(tmp_path: Path) -> ImpactGraph:
+    root = tmp_path.joinpath("repo")
+    for path, source in SOURCES.items():
+        root.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+        root.joinpath(path).write_text(source)
+
+    return ImpactGraph(root, tmp_path.joinpath("impact-graph.json"))
+
+
+class TestImpactGraph:
+    def test_collects_tests(self, graph: ImpactGraph):
+        assert graph.tests.keys() == {LOGIN, COURSES_LIST, COURSES_EMPTY}
+
+    def test_changed_test_file_selects_its_tests(self, graph: ImpactGraph):
+        assert graph.get_affected_tests(["tests/test_courses.py"], set()) == {COURSES_LIST, COURSES_EMPTY}
+
+    def test_changed_page_selects_tests_through_fixtures(self, graph: ImpactGraph):
+        assert graph.get_affected_tests(["pages/login_page.py"], set()) == {LOGIN}
+
+    def test_changed_element_selects_tests_through_imports(self, graph: ImpactGraph):
+        assert graph.get_affected_tests(["elements/button.py"], set()) == {LOGIN}
+
+    def test_changed_testid_selects_tests_using_it(self, graph: ImpactGraph):
+        assert graph.get_affected_tests([], {"login-page-login-button"}) == {LOGIN}
+
+    def test_changed_testid_matches_templates(self, graph: ImpactGraph):
+        assert graph.get_affected_tests([], {"course-view-3-title-text"}) == {COURSES_LIST}
+
+    def test_unused_testid_selects_nothing(self, graph: ImpactGraph):
+        assert graph.get_affected_tests([], {"dashboard-toolbar-title-text"}) == set()
+
+    def test_ignored_files_select_nothing(self, graph: ImpactGraph):
+        assert graph.get_affected_tests(["README.md", "benchmarks/startup.py"], set()) == set()
+
+    def test_unknown_file_selects_every_test(self, graph: ImpactGraph):
+        assert graph.get_affected_tests(["pytest.ini"], set()) is None
+
+    def test_module_without_tests_selects_every_test(self, graph: ImpactGraph):
+        assert graph.get_affected_tests(["tools/helpers.py"], set()) is None
+
+    def test_unchanged_modules_are_read_from_cache(self, tmp_path: Path, graph: ImpactGraph):
+        assert graph.parsed == len(SOURCES)
+
+        cached_graph = ImpactGraph(graph.root, tmp_path.joinpath("impact-graph.json"))
+
+        assert cached_graph.parsed == 0
+        assert cached_graph.tests == graph.tests
@@ -0,0 +1,35 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from config import SETTINGS_SNAPSHOT_ENV
+
+# The test session has already configured logging, so records logged before that are checked in a new process
+LOG_BEFORE_CONFIGURE = """
+from tools.logger import configure_logging, get_logger, stop_logging
+
+logger = get_logger("EARLY")
+logger.info("before configure")
+configure_logging()
+logger.info("after configure")
+logger.debug("below the level")
+stop_logging()
+"""
+
+
+class TestGetLogger:
+    def test_records_before_configure_are_written(self, tmp_path: Path):
+        env = {**os.environ, "LOGGING.LOGS_DIR": str(tmp_path), "LOGGING.LEVEL": "INFO", "LOGGING.CONSOLE": "false"}
+        # The settings and the worker id of this session would override the variables above
+        env.pop(SETTINGS_SNAPSHOT_ENV, None)
+        env.pop("PYTEST_XDIST_WORKER", None)
+        subprocess.run(
+            [sys.executable, "-c", LOG_BEFORE_CONFIGURE],
+            cwd=Path(__file__).resolve().parents[2], env=env, check=True
+        )
+
+        records = [json.loads(line) for line in tmp_path.joinpath("master.jsonl").read_text().splitlines()]
+
+        assert [record["message"] for record in records] == ["before configure", "after configure"]
@@ -0,0 +1,32 @@
+from tools.metrics import merge_metrics
+
+
+class TestMergeMetrics:
+    def test_sums_numbers_across_workers(self):
+        merged = merge_metrics([{"created": 2, "wait_time": 0.5}, {"created": 3, "wait_time": 1.0}])
+
+        assert merged == {"created": 5, "wait_time": 1.5}
+
+    def test_merges_nested_dicts(self):
+        merged = merge_metrics([
+            {"chromium": {"created": 1}},
+            {"chromium": {"created": 2}, "firefox": {"created": 4}}
+        ])
+
+        assert merged == {"chromium": {"created": 3}, "firefox": {"created": 4}}
+
+    def test_keeps_last_non_numeric_value(self):
+        merged = merge_metrics([{"enabled": True, "mode": "scrub"}, {"enabled": False, "mode": "discard"}])
+
+        assert merged == {"enabled": False, "mode": "discard"}
+
+    def test_recomputes_hit_rate_from_merged_counts(self):
+        merged = merge_metrics([{"hits": 3, "misses": 1}, {"hits": 1, "misses": 3}])
+
+        assert merged["hit_rate"] == 0.5
+
+    def test_hit_rate_without_lookups_is_zero(self):
+        assert merge_metrics([{"hits": 0, "misses": 0}])["hit_rate"] == 0.0
+
+    def test_empty(self):
+        assert merge_metrics([]) == {}
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from config import settings, NavigationMode
+from pages.async_api.base_page import BasePage
+from tools.playwright.readiness import LoadStateReadiness
+
+
+class FakeAsyncPage:
+    def __init__(self, url: str):
+        self.url = url
+        self.calls: list[tuple] = []
+
+    async def goto(self, url: str, wait_until: str):
+        self.calls.append(("goto", url, wait_until))
+
+    async def reload(self, wait_until: str):
+        self.calls.append(("reload", wait_until))
+
+    async def evaluate(self, script: str, arg):
+        self.calls.append(("evaluate", arg))
+
+    async def wait_for_load_state(self, state: str):
+        self.calls.append(("wait_for_load_state", state))
+
+
+class ReadyPage(BasePage):
+    readiness = LoadStateReadiness("domcontentloaded")
+
+
+@pytest.fixture
+def hash_mode(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "navigation_mode", NavigationMode.HASH)
+
+
+@pytest.fixture
+def full_mode(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "navigation_mode", NavigationMode.FULL)
+
+
+class TestAsyncNavigation:
+    def test_full_mode_waits_for_network_idle(self, full_mode):
+        page = FakeAsyncPage("about:blank")
+        asyncio.run(ReadyPage(page=page).visit("./#/dashboard"))
+
+        assert page.calls == [("goto", "./#/dashboard", "networkidle")]
+
+    def test_hash_mode_loads_app_once(self, hash_mode):
+        page = FakeAsyncPage("about:blank")
+        asyncio.run(ReadyPage(page=page).visit("./#/dashboard"))
+
+        assert page.calls == [("goto", "./#/dashboard", "load"), ("wait_for_load_state", "domcontentloaded")]
+
+    def test_hash_mode_switches_route_in_loaded_app(self, hash_mode):
+        page = FakeAsyncPage(f"{settings.get_base_url()}#/courses")
+        asyncio.run(ReadyPage(page=page).visit("./#/dashboard"))
+
+        assert page.calls == [("evaluate", "/dashboard"), ("wait_for_load_state", "domcontentloaded")]
+
+    def test_hash_mode_reload_waits_for_readiness(self, hash_mode):
+        page = FakeAsyncPage(f"{settings.get_base_url()}#/courses")
+        asyncio.run(ReadyPage(page=page).reload())
+
+        assert page.calls == [("reload", "load"), ("wait_for_load_state", "domcontentloaded")]
@@ -0,0 +1,85 @@
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from tools.playwright import resources
+from tools.playwright.resources import ResourceSizeIndex
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def static_server(tmp_path: Path) -> str:
+    tmp_path.joinpath("static").mkdir()
+    tmp_path.joinpath("static", "font.woff2").write_bytes(b"x" * 1234)
+
+    handler = partial(QuietRequestHandler, directory=str(tmp_path.joinpath("static")))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+class TestResourceSizeIndex:
+    def test_resolves_sizes_with_head_requests(self, tmp_path: Path, static_server: str):
+        index_file = tmp_path.joinpath("sizes.json")
+        url = f"{static_server}/font.woff2"
+
+        ResourceSizeIndex(index_file).resolve({url})
+
+        assert json.loads(index_file.read_text()) == {url: 1234}
+
+    def test_unreachable_size_stays_unknown(self, tmp_path: Path, static_server: str):
+        index = ResourceSizeIndex(tmp_path.joinpath("sizes.json"))
+        index.resolve({f"{static_server}/missing.woff2"})
+
+        stats = index.get_stats([f"{static_server}/missing.woff2"])
+
+        assert (stats.requests, stats.bytes, stats.unknown_size) == (1, 0, 1)
+
+    def test_failed_lookup_is_not_repeated(
+            self,
+            monkeypatch: pytest.MonkeyPatch,
+            tmp_path: Path,
+            static_server: str
+    ):
+        index_file = tmp_path.joinpath("sizes.json")
+        url = f"{static_server}/missing.woff2"
+        ResourceSizeIndex(index_file).resolve({url})
+
+        requested = []
+        monkeypatch.setattr(resources, "fetch_content_length", requested.append)
+        ResourceSizeIndex(index_file).resolve({url})
+
+        assert json.loads(index_file.read_text()) == {url: None}
+        assert requested == []
+
+    def test_stats_count_every_blocked_request(self, tmp_path: Path):
+        index_file = tmp_path.joinpath("sizes.json")
+        index_file.write_text(json.dumps({"https://app/icon.svg": 100}))
+
+        stats = ResourceSizeIndex(index_file).get_stats(
+            ["https://app/icon.svg", "https://app/icon.svg", "https://app/font.woff"]
+        )
+
+        assert (stats.requests, stats.bytes, stats.unknown_size) == (3, 200, 1)
+
+    def test_merges_sizes_resolved_by_other_workers(self, tmp_path: Path, static_server: str):
+        index_file = tmp_path.joinpath("sizes.json")
+        index = ResourceSizeIndex(index_file)
+        index_file.write_text(json.dumps({"https://app/icon.svg": 100}))
+
+        index.resolve({f"{static_server}/font.woff2"})
+
+        assert json.loads(index_file.read_text()) == {"https://app/icon.svg": 100, f"{static_server}/font.woff2": 1234}
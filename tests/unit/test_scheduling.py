@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.scheduling.affinity import assign_engines, get_test_engine
+from tools.scheduling.lpt import predict_makespan
+from tools.scheduling.timings import DEFAULT_DURATION, TimingStore
+
+
+class TestPredictMakespan:
+    def test_single_worker_runs_everything(self):
+        assert predict_makespan([3.0, 1.0, 2.0], workers=1) == 6.0
+
+    def test_longest_tests_go_first(self):
+        # 5 and 4 start first, 3 joins the worker that finishes 4
+        assert predict_makespan([3.0, 5.0, 4.0], workers=2) == 7.0
+
+    def test_longest_test_bounds_the_makespan(self):
+        assert predict_makespan([10.0, 1.0, 1.0, 1.0], workers=4) == 10.0
+
+    def test_no_tests(self):
+        assert predict_makespan([], workers=3) == 0.0
+
+    def test_no_workers_counts_as_one(self):
+        assert predict_makespan([1.0, 2.0], workers=0) == 3.0
+
+
+class TestGetTestEngine:
+    @pytest.mark.parametrize("nodeid, engine", [
+        ("tests/test_login.py::test_login[chromium]", "chromium"),
+        ("tests/test_login.py::test_login[firefox-user@gmail.com-password]", "firefox"),
+        ("tests/test_login.py::test_login[user@gmail.com-webkit]", "webkit"),
+        ("tests/test_login.py::test_login[user@gmail.com]", None),
+        ("tests/test_login.py::test_login", None)
+    ])
+    def test_engine_from_params(self, nodeid: str, engine: str | None):
+        assert get_test_engine(nodeid) == engine
+
+
+class TestAssignEngines:
+    def test_every_engine_gets_a_worker(self):
+        assert sorted(assign_engines({"chromium": 10.0, "firefox": 5.0}, workers=2)) == [["chromium"], ["firefox"]]
+
+    def test_spare_workers_go_to_the_most_loaded_engine(self):
+        assigned = assign_engines({"chromium": 30.0, "firefox": 10.0}, workers=4)
+
+        assert sorted(assigned) == [["chromium"], ["chromium"], ["chromium"], ["firefox"]]
+
+    def test_engines_are_packed_when_workers_are_short(self):
+        assigned = assign_engines({"chromium": 10.0, "firefox": 6.0, "webkit": 5.0}, workers=2)
+
+        assert sorted(assigned) == [["chromium"], ["firefox", "webkit"]]
+
+    def test_no_engines(self):
+        assert assign_engines({}, workers=2) == [[], []]
+
+    def test_no_workers(self):
+        assert assign_engines({"chromium": 1.0}, workers=0) == []
+
+
+@pytest.fixture
+def timings_file(tmp_path: Path) -> Path:
+    timings_file = tmp_path.joinpath("timings.json")
+    timings_file.write_text(json.dumps({
+        "tests/test_login.py::test_login[chromium]": [2.0, 4.0, 3.0],
+        "tests/test_login.py::test_logout[chromium]": [1.0],
+        "tests/test_courses.py::test_create[chromium]": [10.0]
+    }))
+    return timings_file
+
+
+class TestTimingStore:
+    def test_predicts_median_of_known_test(self, timings_file: Path):
+        assert TimingStore(timings_file).predict("tests/test_login.py::test_login[chromium]") == 3.0
+
+    def test_new_param_uses_same_test(self, timings_file: Path):
+        assert TimingStore(timings_file).predict("tests/test_login.py::test_login[firefox]") == 3.0
+
+    def test_new_test_uses_same_file(self, timings_file: Path):
+        assert TimingStore(timings_file).predict("tests/test_login.py::test_register[chromium]") == 2.0
+
+    def test_unknown_file_uses_median_of_all(self, timings_file: Path):
+        assert TimingStore(timings_file).predict("tests/test_dashboard.py::test_charts[chromium]") == 3.0
+
+    def test_empty_store_uses_default(self, tmp_path: Path):
+        store = TimingStore(tmp_path.joinpath("timings.json"))
+
+        assert store.predict("tests/test_login.py::test_login") == DEFAULT_DURATION
+
+    def test_records_all_phases_of_an_attempt(self, tmp_path: Path):
+        store = TimingStore(tmp_path.joinpath("timings.json"))
+
+        store.record("tests/test_login.py::test_login", "setup", 1.0)
+        store.record("tests/test_login.py::test_login", "call", 2.0)
+        store.record("tests/test_login.py::test_login", "teardown", 0.5)
+
+        assert store.recorded == {"tests/test_login.py::test_login": 3.5}
+
+    def test_rerun_replaces_the_failed_attempt(self, tmp_path: Path):
+        store = TimingStore(tmp_path.joinpath("timings.json"))
+
+        phases = [("setup", 1.0), ("call", 30.0), ("teardown", 1.0), ("setup", 1.0), ("call", 2.0), ("teardown", 0.5)]
+        for when, duration in phases:
+            store.record("tests/test_login.py::test_login", when, duration)
+
+        assert store.recorded == {"tests/test_login.py::test_login": 3.5}
+
+    def test_save_keeps_limited_history(self, timings_file: Path):
+        store = TimingStore(timings_file, history=3)
+        store.record("tests/test_login.py::test_login[chromium]", "setup", 5.0)
+        store.record("tests/test_login.py::test_logout[chromium]", "setup", 1.5)
+
+        store.save()
+
+        durations = json.loads(timings_file.read_text())
+        assert durations["tests/test_login.py::test_login[chromium]"] == [4.0, 3.0, 5.0]
+        assert durations["tests/test_login.py::test_logout[chromium]"] == [1.0, 1.5]
+        assert durations["tests/test_courses.py::test_create[chromium]"] == [10.0]
@@ -0,0 +1,79 @@
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+
+from config import ReportingLevel
+from tools.allure import steps
+from tools.allure.steps import async_step, report_step, suspend_steps
+from tools.logger import get_logger
+
+logger = get_logger("TEST_STEPS")
+
+
+@pytest.fixture
+def opened_steps(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    opened = []
+
+    @contextmanager
+    def record_step(title: str):
+        opened.append(title)
+        yield
+
+    monkeypatch.setattr(steps.allure, "step", record_step)
+    monkeypatch.setattr(steps, "is_reported", lambda level: True)
+    return opened
+
+
+@async_step("Check chart {title}")
+async def check_chart(title: str):
+    with report_step(ReportingLevel.ACTIONS, logger, "Checking chart {}", title):
+        await asyncio.sleep(0)
+
+
+@async_step("Check charts")
+async def check_charts(titles: list[str]):
+    with suspend_steps():
+        await asyncio.gather(*(check_chart(title) for title in titles))
+
+
+class TestSuspendSteps:
+    def test_steps_are_opened_outside(self, opened_steps: list[str]):
+        asyncio.run(check_chart("Students"))
+
+        assert opened_steps == ["Check chart 'Students'", "Checking chart Students"]
+
+    def test_gathered_tasks_open_no_steps(self, opened_steps: list[str]):
+        asyncio.run(check_charts(["Students", "Scores"]))
+
+        assert opened_steps == ["Check charts"]
+
+    def test_steps_resume_after_block(self, opened_steps: list[str]):
+        async def run():
+            await check_charts(["Students"])
+            await check_chart("Scores")
+
+        asyncio.run(run())
+
+        assert opened_steps == ["Check charts", "Check chart 'Scores'", "Checking chart Scores"]
+
+
+class Unformattable:
+    def __format__(self, format_spec: str) -> str:
+        raise AssertionError("Formatted below the reporting level")
+
+
+class TestReportStep:
+    def test_formats_title_with_args(self, opened_steps: list[str]):
+        with report_step(ReportingLevel.ACTIONS, logger, "Filling {} '{}' with a '{}'", "input", "Title", "Playwright"):
+            pass
+
+        assert opened_steps == ["Filling input 'Title' with a 'Playwright'"]
+
+    def test_args_are_not_formatted_below_level(self, monkeypatch: pytest.MonkeyPatch, opened_steps: list[str]):
+        monkeypatch.setattr(steps, "is_reported", lambda level: False)
+
+        with report_step(ReportingLevel.FULL, logger, "Getting locator {}", Unformattable()):
+            pass
+
+        assert opened_steps == []
@@ -0,0 +1,118 @@
+import pytest
+from ui_coverage_tool import ActionType, SelectorType
+
+from elements import ui_coverage
+from elements.ui_coverage import BufferedUICoverageTracker
+
+
+class RecordingTracker:
+    def __init__(self):
+        self.results = []
+
+    def track_coverage(self, selector: str, action_type: ActionType, selector_type: SelectorType):
+        self.results.append((selector, action_type, selector_type))
+
+
+class FakeElement:
+    def __init__(self, test_id: str):
+        self.test_id = test_id
+        self.raw_locator_calls = 0
+
+    def get_raw_locator(self, nth: int = 0, **kwargs) -> str:
+        self.raw_locator_calls += 1
+        test_id = self.test_id.format(**kwargs)
+        return f"(//*[@data-testid='{test_id}'])[{nth + 1}]"
+
+
+@pytest.fixture
+def recording_tracker() -> RecordingTracker:
+    return RecordingTracker()
+
+
+@pytest.fixture
+def buffered_tracker(recording_tracker: RecordingTracker) -> BufferedUICoverageTracker:
+    return BufferedUICoverageTracker(recording_tracker)
+
+
+class TestBufferedUICoverageTracker:
+    def test_tracking_only_buffers(
+            self,
+            buffered_tracker: BufferedUICoverageTracker,
+            recording_tracker: RecordingTracker
+    ):
+        buffered_tracker.track_element_coverage(FakeElement("login-button"), ActionType.CLICK, 0, {})
+
+        assert recording_tracker.results == []
+        assert buffered_tracker.buffered == 1
+
+    def test_flush_writes_every_action(
+            self,
+            buffered_tracker: BufferedUICoverageTracker,
+            recording_tracker: RecordingTracker
+    ):
+        button = FakeElement("login-button")
+        for _ in range(3):
+            buffered_tracker.track_element_coverage(button, ActionType.CLICK, 0, {})
+        buffered_tracker.track_element_coverage(button, ActionType.VISIBLE, 0, {})
+
+        buffered_tracker.flush()
+
+        selector = "(//*[@data-testid='login-button'])[1]"
+        assert sorted(recording_tracker.results) == sorted([
+            *[(selector, ActionType.CLICK, SelectorType.XPATH)] * 3,
+            (selector, ActionType.VISIBLE, SelectorType.XPATH)
+        ])
+
+    def test_raw_locator_is_built_once_per_distinct_event(self, buffered_tracker: BufferedUICoverageTracker):
+        button = FakeElement("login-button")
+        for _ in range(5):
+            buffered_tracker.track_element_coverage(button, ActionType.CLICK, 0, {})
+        buffered_tracker.track_element_coverage(button, ActionType.CLICK, 1, {})
+
+        buffered_tracker.flush()
+
+        assert button.raw_locator_calls == 2
+
+    def test_kwargs_resolve_into_selectors(
+            self,
+            buffered_tracker: BufferedUICoverageTracker,
+            recording_tracker: RecordingTracker
+    ):
+        chart = FakeElement("{identifier}-chart")
+        buffered_tracker.track_element_coverage(chart, ActionType.VISIBLE, 0, {"identifier": "scores"})
+        buffered_tracker.track_element_coverage(chart, ActionType.VISIBLE, 0, {"identifier": "courses"})
+
+        buffered_tracker.flush()
+
+        assert sorted(selector for selector, _, _ in recording_tracker.results) == [
+            "(//*[@data-testid='courses-chart'])[1]",
+            "(//*[@data-testid='scores-chart'])[1]"
+        ]
+
+    def test_flush_empties_the_buffer(
+            self,
+            buffered_tracker: BufferedUICoverageTracker,
+            recording_tracker: RecordingTracker
+    ):
+        buffered_tracker.track_element_coverage(FakeElement("login-button"), ActionType.CLICK, 0, {})
+
+        buffered_tracker.flush()
+        buffered_tracker.flush()
+
+        assert len(recording_tracker.results) == 1
+        assert buffered_tracker.buffered == 0
+
+    def test_flushes_when_buffer_is_full(
+            self,
+            monkeypatch: pytest.MonkeyPatch,
+            buffered_tracker: BufferedUICoverageTracker,
+            recording_tracker: RecordingTracker
+    ):
+        monkeypatch.setattr(ui_coverage, "MAX_BUFFERED_EVENTS", 3)
+        button = FakeElement("login-button")
+
+        for _ in range(4):
+            buffered_tracker.track_element_coverage(button, ActionType.CLICK, 0, {})
+
+        assert len(recording_tracker.results) == 3
+        assert buffered_tracker.buffered == 1
@@ -0,0 +1,76 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from logging import Logger
+import allure
+from allure_commons.utils import func_parameters, represent
+
+from config import settings, ReportingLevel
+
+REPORTING_RANKS = {ReportingLevel.NONE: 0, ReportingLevel.ACTIONS: 1, ReportingLevel.FULL: 2}
+
+NO_STEP = nullcontext()
+
+# Allure keeps one step stack per thread, steps opened by tasks running concurrently would nest into each other
+steps_suspended: ContextVar[bool] = ContextVar("steps_suspended", default=False)
+
+
+def is_reported(level: ReportingLevel) -> bool:
+    return REPORTING_RANKS[settings.reporting_level] >= REPORTING_RANKS[level]
+
+
+@contextmanager
+def suspend_steps():
+    """Only logs the steps inside, tasks started here, e.g. by asyncio.gather, inherit it."""
+    token = steps_suspended.set(True)
+    try:
+        yield
+    finally:
+        steps_suspended.reset(token)
+
+
+# The title is a format string, it is only formatted with its args at or above the configured level
+def report_step(level: ReportingLevel, logger: Logger, title: str, *args, element: str | None = None):
+    if not is_reported(level):
+        return NO_STEP
+
+    step = title.format(*args)
+    logger.info(step, extra={"element": element})
+    return NO_STEP if steps_suspended.get() else allure.step(step)
+
+
+def format_title(title: str, func, args, kwargs) -> str:
+    params = func_parameters(func, *args, **kwargs)
+    return title.format(*map(represent, args), **params)
+
+
+def step(title: str, level: ReportingLevel = ReportingLevel.ACTIONS):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            __tracebackhide__ = True
+
+            if not is_reported(level) or steps_suspended.get():
+                return func(*args, **kwargs)
+
+            with allure.step(format_title(title, func, args, kwargs)):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def async_step(title: str, level: ReportingLevel = ReportingLevel.ACTIONS):
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not is_reported(level) or steps_suspended.get():
+                return await func(*args, **kwargs)
+
+            with allure.step(format_title(title, func, args, kwargs)):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,29 @@
+import re
+import subprocess
+from pathlib import Path
+
+# Quoted strings that look like data-testid values, e.g. "courses-list-toolbar-title-text"
+TESTID_LITERAL_PATTERN = re.compile(r"""["'`]([\w]+(?:-[\w]+)+)["'`]""")
+
+
+def get_git_diff(root: Path, ref: str) -> str:
+    # Compared with the working tree, so uncommitted edits are included
+    result = subprocess.run(["git", "diff", ref, "--"], cwd=root, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def parse_diff(diff: str) -> tuple[list[str], set[str]]:
+    changed_files: list[str] = []
+    changed_testids: set[str] = set()
+
+    for line in diff.splitlines():
+        if line.startswith(("--- ", "+++ ")):
+            path = line[4:].strip()
+            if path != "/dev/null":
+                path = path.partition("/")[2]
+                if path not in changed_files:
+                    changed_files.append(path)
+        elif line.startswith(("+", "-")):
+            changed_testids.update(TESTID_LITERAL_PATTERN.findall(line))
+
+    return changed_files, changed_testids
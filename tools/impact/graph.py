@@ -0,0 +1,218 @@
+import ast
+import fnmatch
+import os
+import re
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("IMPACT")
+
+SOURCES = ("config.py", "conftest.py", "components", "elements", "fixtures", "pages", "tests", "tools")
+TESTID_SOURCES = ("components", "elements", "pages")
+# Files that cannot change what a test does, every other unknown file selects the whole suite
+IGNORED_FILES = ("*.md", "benchmarks/*")
+
+TESTID_PATTERN = re.compile(r"^[\w{}]+(?:-[\w{}]+)+$")
+TEMPLATE_FIELD_PATTERN = re.compile(r"\\{\w*\\}")
+
+
+class FunctionInfo(BaseModel):
+    names: list[str] = []
+    params: list[str] = []
+    fixture: bool = False
+
+
+class ModuleInfo(BaseModel):
+    path: str
+    mtime: int
+    size: int
+    imports: dict[str, str] = {}
+    functions: dict[str, FunctionInfo] = {}
+    testids: list[str] = []
+
+
+class GraphCache(BaseModel):
+    modules: dict[str, ModuleInfo] = {}
+
+
+def get_module_name(path: Path) -> str:
+    parts = path.with_suffix("").parts
+    return ".".join(parts[:-1] if parts[-1] == "__init__" else parts)
+
+
+def get_template_pattern(template: str) -> re.Pattern:
+    return re.compile(TEMPLATE_FIELD_PATTERN.sub(".+", re.escape(template)))
+
+
+def parse_function(node: ast.FunctionDef) -> FunctionInfo:
+    return FunctionInfo(
+        names=sorted({child.id for child in ast.walk(node) if isinstance(child, ast.Name)}),
+        params=[arg.arg for arg in [*node.args.args, *node.args.kwonlyargs] if arg.arg not in ("self", "cls")],
+        fixture=any("fixture" in ast.unparse(decorator) for decorator in node.decorator_list)
+    )
+
+
+def parse_module(root: Path, path: Path, local_modules: set[str]) -> ModuleInfo:
+    stat = root.joinpath(path).stat()
+    tree = ast.parse(root.joinpath(path).read_text(encoding="utf-8"))
+    info = ModuleInfo(path=path.as_posix(), mtime=stat.st_mtime_ns, size=stat.st_size)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name in local_modules:
+                    info.imports[alias.asname or alias.name] = alias.name
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            for alias in node.names:
+                module = f"{node.module}.{alias.name}"
+                module = module if module in local_modules else node.module
+                if module in local_modules:
+                    info.imports[alias.asname or alias.name] = module
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            info.functions[node.name] = parse_function(node)
+        elif isinstance(node, ast.ClassDef):
+            for method in node.body:
+                if isinstance(method, ast.FunctionDef):
+                    info.functions[f"{node.name}::{method.name}"] = parse_function(method)
+
+    if path.parts[0] in TESTID_SOURCES:
+        info.testids = sorted({
+            node.value for node in ast.walk(tree)
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and TESTID_PATTERN.match(node.value)
+        })
+
+    return info
+
+
+class ImpactGraph:
+    def __init__(self, root: Path, cache_file: Path):
+        self.root = root
+        self.cache_file = cache_file
+        self.parsed = 0
+        self.modules = self.load()
+
+        self.fixtures = {
+            name: (module, name)
+            for module, info in self.modules.items()
+            for name, function in info.functions.items() if function.fixture
+        }
+        self.module_closures: dict[str, set[str]] = {}
+        self.tests = self.get_tests()
+
+    def get_paths(self) -> list[Path]:
+        paths = []
+        for source in SOURCES:
+            if source.endswith(".py"):
+                paths.append(Path(source))
+            else:
+                paths.extend(path.relative_to(self.root) for path in self.root.joinpath(source).rglob("*.py"))
+
+        return [path for path in paths if self.root.joinpath(path).exists()]
+
+    def load(self) -> dict[str, ModuleInfo]:
+        cache = GraphCache()
+        if self.cache_file.exists():
+            cache = GraphCache.model_validate_json(self.cache_file.read_text())
+
+        paths = {get_module_name(path): path for path in self.get_paths()}
+        # Import resolution depends on which modules exist, so adding or removing one invalidates everything
+        if set(cache.modules) != set(paths):
+            cache.modules.clear()
+
+        modules = {}
+        for module, path in paths.items():
+            cached = cache.modules.get(module)
+            stat = self.root.joinpath(path).stat()
+            if cached and cached.mtime == stat.st_mtime_ns and cached.size == stat.st_size:
+                modules[module] = cached
+                continue
+
+            modules[module] = parse_module(self.root, path, set(paths))
+            self.parsed += 1
+
+        if self.parsed:
+            temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(GraphCache(modules=modules).model_dump_json())
+            os.replace(temp_file, self.cache_file)
+
+        return modules
+
+    def get_module_closure(self, module: str) -> set[str]:
+        if module not in self.module_closures:
+            closure, stack = set(), [module]
+            while stack:
+                current = stack.pop()
+                if current in closure or current not in self.modules:
+                    continue
+
+                closure.add(current)
+                stack.extend(self.modules[current].imports.values())
+
+            self.module_closures[module] = closure
+
+        return self.module_closures[module]
+
+    def get_function_closure(self, module: str, name: str, seen: set[tuple[str, str]]) -> set[str]:
+        seen.add((module, name))
+        info = self.modules[module]
+        function = info.functions[name]
+        closure = {module}
+
+        for used in function.names:
+            if used in info.imports:
+                closure |= self.get_module_closure(info.imports[used])
+            elif used in info.functions and (module, used) not in seen:
+                closure |= self.get_function_closure(module, used, seen)
+
+        for param in function.params:
+            fixture = self.fixtures.get(param)
+            if fixture and fixture not in seen:
+                closure |= self.get_function_closure(*fixture, seen)
+
+        return closure
+
+    def get_tests(self) -> dict[str, set[str]]:
+        tests = {}
+        for module, info in self.modules.items():
+            if not module.startswith("tests."):
+                continue
+
+            for name in info.functions:
+                if name.rpartition("::")[2].startswith("test"):
+                    tests[f"{info.path}::{name}"] = self.get_function_closure(module, name, set())
+
+        return tests
+
+    def get_testids(self, test: str) -> set[str]:
+        return {testid for module in self.tests[test] for testid in self.modules[module].testids}
+
+    def get_affected_tests(self, changed_files: list[str], changed_testids: set[str]) -> set[str] | None:
+        """Tests affected by the changes, or None when the whole suite has to run."""
+        paths = {info.path: module for module, info in self.modules.items()}
+        changed_modules = set()
+
+        for changed_file in changed_files:
+            if changed_file in paths:
+                changed_modules.add(paths[changed_file])
+            elif not any(fnmatch.fnmatch(changed_file, pattern) for pattern in IGNORED_FILES):
+                logger.info(f"'{changed_file}' is outside the page object graph, selecting every test")
+                return None
+
+        affected = {test for test, closure in self.tests.items() if closure & changed_modules}
+
+        # A module no test reaches can still act through hooks, e.g. a pytest plugin
+        if any(not any(module in closure for closure in self.tests.values()) for module in changed_modules):
+            logger.info("A changed module is not used by any test directly, selecting every test")
+            return None
+
+        for test in self.tests.keys() - affected:
+            patterns = [get_template_pattern(testid) for testid in self.get_testids(test)]
+            if any(pattern.fullmatch(testid) for pattern in patterns for testid in changed_testids):
+                affected.add(test)
+
+        return affected
@@ -0,0 +1,96 @@
+import json
+import posixpath
+import re
+import threading
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+from config import settings
+from tools.logger import configure_logging, get_logger
+
+logger = get_logger("LOCAL_APP")
+
+
+class LocalAppRequestHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, prefix: str, **kwargs):
+        self.prefix = prefix
+        super().__init__(*args, **kwargs)
+
+    def translate_path(self, path: str) -> str:
+        # The build references its assets under the deployment path, e.g. /qa-automation-engineer-ui-course/static/...
+        if path.startswith(self.prefix):
+            path = path[len(self.prefix):] or "/"
+
+        return super().translate_path(path)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalAppServer:
+    def __init__(self, build_dir: Path, prefix: str, port: int = 0):
+        if not build_dir.joinpath("index.html").exists():
+            raise FileNotFoundError(
+                f"Local app build is missing in '{build_dir}', vendor it with 'python -m tools.local_app'"
+            )
+
+        self.prefix = prefix.rstrip("/")
+        handler = partial(LocalAppRequestHandler, prefix=self.prefix, directory=str(build_dir))
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    def start(self):
+        self.thread.start()
+        logger.info(f"Serving local app on {self.url}")
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+def download(url: str, build_dir: Path, prefix: str) -> bytes:
+    path = urlparse(url).path
+    relative_path = posixpath.relpath(path, prefix) if path.startswith(prefix) else path.lstrip("/")
+    target = build_dir.joinpath("index.html" if relative_path in (".", "") else relative_path)
+
+    with urllib.request.urlopen(url) as response:
+        content = response.read()
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(content)
+    logger.info(f"Downloaded {url} to {target}")
+
+    return content
+
+
+def vendor_app_build(app_url: str, build_dir: Path):
+    base_url = f"{app_url.rstrip('/')}/"
+    prefix = urlparse(base_url).path.rstrip("/")
+
+    index = download(base_url, build_dir, prefix).decode()
+    assets = set(re.findall(r'(?:src|href)="([^"#]+)"', index))
+
+    try:
+        manifest = json.loads(download(urljoin(base_url, "asset-manifest.json"), build_dir, prefix))
+        assets.update(manifest.get("files", {}).values())
+    except OSError as error:
+        logger.warning(f"Asset manifest is not available, only index.html assets are vendored: {error}")
+
+    for asset in sorted(assets):
+        asset_url = urljoin(base_url, asset)
+        if urlparse(asset_url).netloc == urlparse(base_url).netloc:
+            download(asset_url, build_dir, prefix)
+
+
+if __name__ == "__main__":
+    configure_logging()
+    vendor_app_build(str(settings.app_url), settings.local_app.build_dir)
@@ -1,15 +1,121 @@
+import atexit
+import json
 import logging
+import queue
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+
+from config import settings
+from tools.metrics import get_worker_id
+
+current_test_id: ContextVar[str | None] = ContextVar("current_test_id", default=None)
+
+# Records wait in the queue until the listener is started, so loggers can be created at import time
+records = queue.SimpleQueue()
+listener: QueueListener | None = None
+logger_names: set[str] = set()
+
+
+class ContextFilter(logging.Filter):
+    # Runs in the calling thread, the listener thread can't see the test context
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.test_id = current_test_id.get()
+        record.worker = get_worker_id()
+        if not hasattr(record, "element"):
+            record.element = None
+
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            "time": self.formatTime(record),
+            "worker": record.worker,
+            "test_id": record.test_id,
+            "logger": record.name,
+            "level": record.levelname,
+            "element": record.element,
+            "message": record.getMessage()
+        })
+
+
+queue_handler = QueueHandler(records)
+queue_handler.addFilter(ContextFilter())
+
+
+def configure_logging():
+    """Starts writing the queued records, called from pytest_configure or the main() of a script."""
+    global listener
+
+    if listener is not None:
+        return
+
+    settings.logging.logs_dir.mkdir(parents=True, exist_ok=True)
+
+    file_handler = logging.FileHandler(
+        settings.logging.logs_dir.joinpath(f"{get_worker_id()}.jsonl"), mode="w", delay=True
+    )
+    file_handler.setFormatter(JsonFormatter())
+    handlers: list[logging.Handler] = [file_handler]
+
+    if settings.logging.console:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s | %(name)s | %(levelname)s | %(message)s"))
+        handlers.append(stream_handler)
+
+    for name in logger_names:
+        set_logger_level(name)
+
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    global listener
+
+    if listener is None:
+        return
+
+    # Stopping flushes the queue and closes the files
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    listener = None
+
+
+def set_logger_level(name: str):
+    logging.getLogger(name).setLevel(settings.logging.levels.get(name, settings.logging.level))
+
+
+def set_log_level(name: str, level: int | str):
+    logging.getLogger(name).setLevel(level)
+
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    logger_names.add(name)
+
+    # Levels come from the settings, which are only read once logging is configured. Until then every
+    # record is queued, an unset level would fall back to the root WARNING and drop INFO records
+    if listener is not None:
+        set_logger_level(name)
+    else:
+        logger.setLevel(logging.DEBUG)
 
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
 
-    formatter = logging.Formatter("%(asctime)s | %(name)s | %(levelname)s | %(message)s")
-    handler.setFormatter(formatter)
+    return logger
 
-    logger.addHandler(handler)
 
-    return logger
\ No newline at end of file
+@contextmanager
+def log_test_context(test_id: str):
+    token = current_test_id.set(test_id)
+    try:
+        yield
+    finally:
+        current_test_id.reset(token)
@@ -0,0 +1,47 @@
+import json
+import os
+
+from config import settings
+
+
+def get_worker_id() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def save_metrics(name: str, data: dict):
+    metrics_file = settings.metrics_dir.joinpath(f"{name}.{get_worker_id()}.json")
+    metrics_file.write_text(json.dumps(data, indent=2, default=str))
+
+
+def load_metrics() -> dict[str, list[dict]]:
+    metrics: dict[str, list[dict]] = {}
+
+    for metrics_file in sorted(settings.metrics_dir.glob("*.json")):
+        name, _, _ = metrics_file.name.partition(".")
+        metrics.setdefault(name, []).append(json.loads(metrics_file.read_text()))
+
+    return metrics
+
+
+def clear_metrics():
+    for metrics_file in settings.metrics_dir.glob("*.json"):
+        metrics_file.unlink(missing_ok=True)
+
+
+def merge_metrics(items: list[dict]) -> dict:
+    merged: dict = {}
+
+    for item in items:
+        for key, value in item.items():
+            if isinstance(value, dict):
+                merged[key] = merge_metrics([merged.get(key, {}), value])
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[key] = merged.get(key, 0) + value
+            else:
+                merged[key] = value
+
+    if "hits" in merged and "misses" in merged:
+        lookups = merged["hits"] + merged["misses"]
+        merged["hit_rate"] = round(merged["hits"] / lookups, 3) if lookups else 0.0
+
+    return merged
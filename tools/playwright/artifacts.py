@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import BrowserContext, Video
+from pydantic import BaseModel
+
+from config import ArtifactPolicy
+from tools.logger import get_logger
+from tools.metrics import save_metrics
+
+logger = get_logger("ARTIFACTS")
+
+phase_report_key = pytest.StashKey[dict[str, pytest.TestReport]]()
+
+
+class ArtifactStats(BaseModel):
+    retained: int = 0
+    discarded: int = 0
+    retained_bytes: int = 0
+    saved_bytes: int = 0
+
+
+class ArtifactsStats(BaseModel):
+    video: ArtifactStats = ArtifactStats()
+    tracing: ArtifactStats = ArtifactStats()
+
+    def save(self):
+        # Discarded traces are never written, so their size is estimated from the retained ones
+        if self.tracing.retained:
+            average_bytes = self.tracing.retained_bytes // self.tracing.retained
+            self.tracing.saved_bytes = average_bytes * self.tracing.discarded
+
+        save_metrics("artifacts", self.model_dump())
+
+
+artifacts_stats = ArtifactsStats()
+
+
+def get_execution_count(item: pytest.Item) -> int:
+    return getattr(item, "execution_count", 1)
+
+
+def is_failed(item: pytest.Item) -> bool:
+    reports = item.stash.get(phase_report_key, {})
+    return any(report.failed for report in reports.values())
+
+
+def should_record(policy: ArtifactPolicy, execution_count: int) -> bool:
+    if policy == ArtifactPolicy.ON_FIRST_RETRY:
+        return execution_count == 2
+
+    return policy != ArtifactPolicy.OFF
+
+
+def should_retain(policy: ArtifactPolicy, failed: bool, execution_count: int) -> bool:
+    if policy == ArtifactPolicy.RETAIN_ON_FAILURE:
+        return failed
+
+    return should_record(policy, execution_count)
+
+
+def stop_tracing(context: BrowserContext, path: Path | None):
+    context.tracing.stop(path=path)
+
+    if path is None:
+        artifacts_stats.tracing.discarded += 1
+        return
+
+    artifacts_stats.tracing.retained += 1
+    artifacts_stats.tracing.retained_bytes += path.stat().st_size
+
+
+def finish_video(video: Video, retain: bool):
+    size = Path(video.path()).stat().st_size
+
+    if retain:
+        artifacts_stats.video.retained += 1
+        artifacts_stats.video.retained_bytes += size
+        return
+
+    video.delete()
+    artifacts_stats.video.discarded += 1
+    artifacts_stats.video.saved_bytes += size
+    logger.info(f"Discarded video {video.path()} ({size} bytes)")
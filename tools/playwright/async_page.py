@@ -0,0 +1,34 @@
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+from playwright.async_api import Browser as PlaywrightBrowser, Page, async_playwright
+
+from config import settings, Browser
+from tools.playwright.resources import ResourcePolicy
+
+
+@asynccontextmanager
+async def initialize_async_playwright_page(
+        browser: PlaywrightBrowser,
+        storage_state: Path | None = None
+) -> AsyncIterator[Page]:
+    context = await browser.new_context(storage_state=storage_state, base_url=settings.get_base_url())
+    await ResourcePolicy(settings.resource_policy.profile).apply_async(context)
+    page = await context.new_page()
+
+    try:
+        yield page
+    finally:
+        await context.close()
+
+
+@asynccontextmanager
+async def launch_async_browser(browser_type: Browser) -> AsyncIterator[PlaywrightBrowser]:
+    async with async_playwright() as playwright:
+        browser = await playwright[browser_type].launch(headless=settings.headless)
+
+        try:
+            yield browser
+        finally:
+            await browser.close()
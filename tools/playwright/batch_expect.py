@@ -0,0 +1,128 @@
+from typing import Self
+
+import allure
+from playwright.sync_api import Page
+from ui_coverage_tool import ActionType
+
+from config import ReportingLevel
+from elements.base_element import BaseElement
+from tools.allure.steps import is_reported, report_step
+from tools.logger import get_logger
+
+logger = get_logger("BATCH_EXPECT")
+
+# Same default as Playwright's expect
+EXPECT_TIMEOUT = 5_000
+
+# Polls inside the page, so any number of checks costs a single driver round trip
+BATCH_EXPECT_SCRIPT = """
+async ([checks, timeout]) => {
+    const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+    const find = ({testId, nth, selector}) => {
+        const element = document.querySelectorAll(`[data-testid="${CSS.escape(testId)}"]`)[nth];
+        return element && selector ? element.querySelector(selector) : element;
+    };
+    const isVisible = (element) => {
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== "hidden";
+    };
+    const verify = (check) => {
+        const element = find(check.query);
+        if (!element) {
+            return "element not found";
+        }
+        if (check.kind === "visible" && !isVisible(element)) {
+            return "element is not visible";
+        }
+        if (check.kind === "text" && normalize(element.textContent) !== normalize(check.expected)) {
+            return `actual text '${normalize(element.textContent)}'`;
+        }
+        if (check.kind === "value" && element.value !== check.expected) {
+            return `actual value '${element.value}'`;
+        }
+        return null;
+    };
+
+    const deadline = Date.now() + timeout;
+    while (true) {
+        const failures = checks.map(verify);
+        if (failures.every((failure) => failure === null) || Date.now() >= deadline) {
+            return failures;
+        }
+        await new Promise((resolve) => setTimeout(resolve, 50));
+    }
+}
+"""
+
+ACTION_TYPES = {"visible": ActionType.VISIBLE, "text": ActionType.TEXT, "value": ActionType.VALUE}
+
+# Step titles of the single element checks, formatted with the element type, its name and the expected value
+CHECK_TITLES = {
+    "visible": "Check that {} '{}' is visible",
+    "text": "Check that {} '{}' has text '{}'",
+    "value": "Checking that {} '{}' has value a '{}'"
+}
+
+
+class BatchExpectation:
+    def __init__(self, page: Page, timeout: float = EXPECT_TIMEOUT):
+        self.page = page
+        self.timeout = timeout
+        self.checks: list[tuple[str, BaseElement, str | None, int, dict]] = []
+
+    def visible(self, element: BaseElement, nth: int = 0, **kwargs) -> Self:
+        self.checks.append(("visible", element, None, nth, kwargs))
+        return self
+
+    def text(self, element: BaseElement, text: str, nth: int = 0, **kwargs) -> Self:
+        self.checks.append(("text", element, text, nth, kwargs))
+        return self
+
+    def value(self, element: BaseElement, value: str, nth: int = 0, **kwargs) -> Self:
+        self.checks.append(("value", element, value, nth, kwargs))
+        return self
+
+    def describe(self, kind: str, element: BaseElement, expected: str | None) -> str:
+        return CHECK_TITLES[kind].format(element.type_of, element.name, expected)
+
+    def check(self):
+        if not self.checks:
+            return
+
+        failures = self.page.evaluate(BATCH_EXPECT_SCRIPT, [
+            [
+                {"kind": kind, "expected": expected, "query": element.get_query(nth, **kwargs)}
+                for kind, element, expected, nth, kwargs in self.checks
+            ],
+            self.timeout
+        ])
+
+        errors = []
+        for (kind, element, expected, nth, kwargs), failure in zip(self.checks, failures):
+            if failure is None:
+                with report_step(
+                    ReportingLevel.ACTIONS, logger, CHECK_TITLES[kind],
+                    element.type_of, element.name, expected, element=element.name
+                ):
+                    pass
+                element.track_coverage(ACTION_TYPES[kind], nth, **kwargs)
+                continue
+
+            error = f"{self.describe(kind, element, expected)} failed: {failure}"
+            logger.error(error, extra={"element": element.name})
+            if is_reported(ReportingLevel.ACTIONS):
+                with allure.step(error):
+                    pass
+            errors.append(error)
+
+        self.checks.clear()
+
+        if errors:
+            raise AssertionError("\n".join(errors))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.check()
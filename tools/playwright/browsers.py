@@ -0,0 +1,37 @@
+from playwright.sync_api import Playwright, Browser as PlaywrightBrowser
+
+from config import settings, Browser
+from tools.logger import get_logger
+
+logger = get_logger("BROWSERS")
+
+
+class BrowserRegistry:
+    def __init__(self, playwright: Playwright, exclusive: bool = False):
+        self.playwright = playwright
+        self.exclusive = exclusive
+        self.launches = 0
+        self.browsers: dict[Browser, PlaywrightBrowser] = {}
+
+    def get(self, browser_type: Browser) -> PlaywrightBrowser:
+        browser = self.browsers.get(browser_type)
+
+        if browser is None or not browser.is_connected():
+            if self.exclusive:
+                # Tests come grouped by engine, so the previous engine will not be needed again soon
+                self.close()
+
+            logger.info(f"Launching '{browser_type}' browser")
+            browser = self.playwright[browser_type].launch(headless=settings.headless)
+            self.browsers[browser_type] = browser
+            self.launches += 1
+
+        return browser
+
+    def close(self):
+        for browser_type, browser in self.browsers.items():
+            if browser.is_connected():
+                logger.info(f"Closing '{browser_type}' browser")
+                browser.close()
+
+        self.browsers.clear()
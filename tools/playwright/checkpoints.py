@@ -0,0 +1,159 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+from filelock import FileLock
+from playwright.sync_api import Page
+from pydantic import BaseModel
+
+from config import settings
+from tools.impact.graph import ImpactGraph
+from tools.logger import get_logger
+
+logger = get_logger("CHECKPOINTS")
+
+# Runs in the restored tab, the app reads its store from localStorage on the reload that follows
+SET_STORAGE_SCRIPT = """
+(items) => {
+    window.localStorage.clear();
+    for (const {name, value} of items) {
+        window.localStorage.setItem(name, value);
+    }
+}
+"""
+
+
+class Checkpoint(BaseModel):
+    name: str
+    params: dict
+    url: str
+    storage_state: dict
+    duration: float
+
+
+class CheckpointStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evicted: int = 0
+    saved_time: float = 0.0
+
+
+class CheckpointStore:
+    def __init__(self, cache_dir: Path, max_entries: int, graph: ImpactGraph):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.graph = graph
+        self.stats = CheckpointStats()
+        self.lock = FileLock(cache_dir.joinpath(".lock"))
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_flow_source(self, flow: Callable[[], None]) -> str:
+        # Partials are keyed on the function they call, their arguments belong in the params
+        function = getattr(flow, "func", flow)
+        try:
+            return inspect.getsource(function)
+        except (OSError, TypeError):
+            # Built-ins and code typed into a REPL have no source, their qualified name still tells them apart
+            return f"{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', repr(function))}"
+
+    def get_fingerprint(self, page_types: list[type], flow: Callable[[], None]) -> str:
+        # A snapshot is only valid while the flow, the page objects it drives and everything they import are unchanged
+        paths = {
+            self.graph.modules[module].path
+            for page_type in page_types
+            for module in self.graph.get_module_closure(page_type.__module__)
+        }
+
+        digest = hashlib.sha256(self.get_flow_source(flow).encode())
+        for path in sorted(paths):
+            digest.update(path.encode())
+            digest.update(self.graph.root.joinpath(path).read_bytes())
+
+        return digest.hexdigest()
+
+    def get_file(
+            self,
+            name: str,
+            params: dict,
+            page_types: list[type],
+            flow: Callable[[], None],
+            engine: str
+    ) -> Path:
+        fingerprint = self.get_fingerprint(page_types, flow)
+        # Storage states are not shared between engines, each one records its own snapshot
+        key = json.dumps(
+            [name, params, engine, str(settings.app_url), settings.test_user.model_dump(), fingerprint],
+            sort_keys=True,
+            default=str
+        )
+        return self.cache_dir.joinpath(f"{name}-{hashlib.sha256(key.encode()).hexdigest()[:16]}.json")
+
+    def load(self, checkpoint_file: Path) -> Checkpoint | None:
+        try:
+            checkpoint = Checkpoint.model_validate_json(checkpoint_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+        # The modification time is the recency used for eviction
+        os.utime(checkpoint_file)
+        return checkpoint
+
+    def save(self, checkpoint_file: Path, checkpoint: Checkpoint):
+        with self.lock:
+            temp_file = checkpoint_file.with_name(f"{checkpoint_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(checkpoint.model_dump_json())
+            os.replace(temp_file, checkpoint_file)
+
+            checkpoint_files = sorted(self.cache_dir.glob("*.json"), key=lambda file: file.stat().st_mtime, reverse=True)
+            for stale_file in checkpoint_files[self.max_entries:]:
+                logger.info(f"Evicting checkpoint {stale_file}")
+                stale_file.unlink(missing_ok=True)
+                self.stats.evicted += 1
+
+    def restore(self, page: Page, checkpoint: Checkpoint):
+        page.context.clear_cookies()
+        if checkpoint.storage_state.get("cookies"):
+            page.context.add_cookies(checkpoint.storage_state["cookies"])
+
+        page.goto(checkpoint.url, wait_until="load")
+        origin = page.evaluate("window.location.origin")
+        items = next(
+            (item.get("localStorage", []) for item in checkpoint.storage_state.get("origins", []) if item["origin"] == origin),
+            []
+        )
+        page.evaluate(SET_STORAGE_SCRIPT, items)
+        page.reload(wait_until="load")
+
+    def run(self, name: str, params: dict, flow: Callable[[], None], pages: list) -> bool:
+        """Restores the checkpoint or runs the flow and records it, returns whether it was restored."""
+        page: Page = pages[0].page
+        checkpoint_file = self.get_file(
+            name, params, [type(page_object) for page_object in pages], flow, page.context.browser.browser_type.name
+        )
+
+        checkpoint = self.load(checkpoint_file)
+        if checkpoint:
+            started = time.perf_counter()
+            self.restore(page, checkpoint)
+            self.stats.hits += 1
+            self.stats.saved_time += checkpoint.duration - (time.perf_counter() - started)
+            logger.info(f"Restored checkpoint '{name}' from {checkpoint_file}")
+            return True
+
+        started = time.perf_counter()
+        flow()
+        self.stats.misses += 1
+        self.save(checkpoint_file, Checkpoint(
+            name=name,
+            params=params,
+            url=page.url,
+            storage_state=page.context.storage_state(),
+            duration=time.perf_counter() - started
+        ))
+        logger.info(f"Recorded checkpoint '{name}' to {checkpoint_file}")
+        return False
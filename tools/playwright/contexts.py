@@ -0,0 +1,195 @@
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from playwright.sync_api import Browser as PlaywrightBrowser, BrowserContext, Page
+from pydantic import BaseModel
+
+from config import settings, Browser, ContextReuse
+from tools.logger import get_logger
+from tools.metrics import save_metrics
+from tools.playwright.network_cache import NetworkCache
+
+logger = get_logger("CONTEXT_POOL")
+
+# Contexts are handed out with a fresh tab, so "once per tab" means "once per test".
+# The script restores localStorage to the storage state the context was created with.
+RESET_STORAGE_SCRIPT = """
+((origins) => {
+    try {
+        if (window.sessionStorage.getItem("context-pool-storage-reset")) {
+            return;
+        }
+
+        window.localStorage.clear();
+        for (const {name, value} of origins[window.location.origin] || []) {
+            window.localStorage.setItem(name, value);
+        }
+
+        window.sessionStorage.setItem("context-pool-storage-reset", "true");
+    } catch (error) {
+        // Opaque origins such as about:blank have no storage to reset
+    }
+})(%s)
+"""
+
+
+@dataclass
+class PooledContext:
+    context: BrowserContext
+    page: Page
+
+
+class ContextPoolStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    created: int = 0
+    scrubbed: int = 0
+    discarded: int = 0
+    wait_time: float = 0.0
+
+
+class ContextPool:
+    def __init__(
+            self,
+            browser: PlaywrightBrowser,
+            size: int,
+            reuse: ContextReuse,
+            storage_state: Path | None = None,
+            record_video: bool = True,
+            network_cache: NetworkCache | None = None,
+            stats: ContextPoolStats | None = None
+    ):
+        self.browser = browser
+        self.size = size
+        self.reuse = reuse
+        self.storage_state = storage_state
+        self.record_video = record_video
+        self.network_cache = network_cache
+        self.stats = stats or ContextPoolStats()
+        self.idle: deque[BrowserContext] = deque()
+
+        state = json.loads(storage_state.read_text()) if storage_state else {}
+        self.cookies = state.get("cookies", [])
+        self.reset_storage_script = RESET_STORAGE_SCRIPT % json.dumps({
+            origin["origin"]: origin.get("localStorage", []) for origin in state.get("origins", [])
+        })
+
+        self.fill()
+
+    def create(self) -> BrowserContext:
+        context = self.browser.new_context(
+            record_video_dir=settings.videos_dir if self.record_video else None,
+            storage_state=self.storage_state,
+            base_url=settings.get_base_url()
+        )
+        context.add_init_script(self.reset_storage_script)
+        self.route_network_cache(context)
+        self.stats.created += 1
+
+        return context
+
+    def route_network_cache(self, context: BrowserContext):
+        if self.network_cache:
+            context.route(settings.network_cache.url_pattern, self.network_cache.handle)
+
+    def fill(self):
+        while len(self.idle) < self.size:
+            self.idle.append(self.create())
+
+    def acquire(self) -> PooledContext:
+        started = time.perf_counter()
+
+        if self.idle:
+            self.stats.hits += 1
+            context = self.idle.popleft()
+        else:
+            self.stats.misses += 1
+            context = self.create()
+
+        self.stats.wait_time += time.perf_counter() - started
+        # The page is opened on checkout, a recorded video starts with the test, not while the context sits idle
+        return PooledContext(context=context, page=context.new_page())
+
+    def release(self, pooled: PooledContext):
+        for page in pooled.context.pages:
+            page.close()
+
+        if self.reuse == ContextReuse.SCRUB and len(self.idle) < self.size:
+            try:
+                self.idle.append(self.scrub(pooled.context))
+                self.stats.scrubbed += 1
+                return
+            except Exception as error:
+                logger.warning(f"Failed to scrub browser context, discarding it: {error}")
+
+        pooled.context.close()
+        self.stats.discarded += 1
+        self.fill()
+
+    def scrub(self, context: BrowserContext) -> BrowserContext:
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_permissions()
+        context.clear_cookies()
+
+        if self.cookies:
+            context.add_cookies(self.cookies)
+
+        self.route_network_cache(context)
+
+        return context
+
+    def close(self):
+        while self.idle:
+            context = self.idle.popleft()
+            # Contexts of a closed browser are already gone
+            if self.browser.is_connected():
+                context.close()
+
+
+class ContextPoolRegistry:
+    def __init__(self, network_cache: NetworkCache | None = None):
+        self.network_cache = network_cache
+        self.pools: dict[tuple[Browser, Path | None, bool], ContextPool] = {}
+
+    def get(
+            self,
+            browser: PlaywrightBrowser,
+            browser_type: Browser,
+            storage_state: Path | None = None,
+            record_video: bool = True
+    ) -> ContextPool:
+        key = (browser_type, storage_state, record_video)
+        pool = self.pools.get(key)
+
+        if pool is None or pool.browser is not browser:
+            if pool is not None:
+                pool.close()
+
+            pool = ContextPool(
+                browser=browser,
+                size=settings.context_pool.size,
+                reuse=settings.context_pool.reuse,
+                storage_state=storage_state,
+                record_video=record_video,
+                network_cache=self.network_cache,
+                stats=pool.stats if pool else None
+            )
+            self.pools[key] = pool
+
+        return pool
+
+    def close(self):
+        stats = {}
+        for (browser_type, storage_state, record_video), pool in self.pools.items():
+            name = browser_type.value
+            name += "-with-state" if storage_state else ""
+            name += "-with-video" if record_video else ""
+            stats[name] = pool.stats.model_dump()
+            logger.info(f"Context pool '{name}' stats: {pool.stats.model_dump()}")
+            pool.close()
+
+        save_metrics("context_pool", stats)
+        self.pools.clear()
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from functools import cache
+from typing import Callable, Hashable
+
+from playwright.sync_api import Page, Locator
+from pydantic import BaseModel
+
+from config import settings
+from tools.metrics import save_metrics
+
+
+class LocatorCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class LocatorCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.stats = LocatorCacheStats()
+        self.caches: dict[Page, OrderedDict[Hashable, Locator]] = {}
+
+    def get_page_cache(self, page: Page) -> OrderedDict[Hashable, Locator]:
+        cache = self.caches.get(page)
+
+        if cache is None:
+            # Cached locators reference their page, so entries are dropped explicitly once it closes
+            cache = self.caches[page] = OrderedDict()
+            page.on("close", lambda _: self.caches.pop(page, None))
+
+        return cache
+
+    def get(self, page: Page, key: Hashable, build: Callable[[], Locator]) -> Locator:
+        cache = self.get_page_cache(page)
+        locator = cache.get(key)
+
+        if locator is not None:
+            self.stats.hits += 1
+            cache.move_to_end(key)
+            return locator
+
+        self.stats.misses += 1
+        locator = cache[key] = build()
+
+        if len(cache) > self.max_size:
+            cache.popitem(last=False)
+            self.stats.evictions += 1
+
+        return locator
+
+    def save(self):
+        save_metrics("locator_cache", self.stats.model_dump())
+
+
+@cache
+def get_locator_cache() -> LocatorCache:
+    # Built on the first locator, so importing elements doesn't load the settings
+    return LocatorCache(max_size=settings.locator_cache_size)
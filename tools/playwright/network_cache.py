@@ -0,0 +1,232 @@
+import argparse
+import base64
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from playwright.sync_api import Route
+from pydantic import BaseModel
+
+from config import settings
+from tools.logger import configure_logging, get_logger
+
+logger = get_logger("NETWORK_CACHE")
+
+# The body is stored decoded, so headers describing the transfer encoding no longer apply
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CachedResponse(BaseModel):
+    url: str
+    status: int
+    headers: dict[str, str]
+    sha256: str
+    size: int
+    etag: str | None = None
+
+
+class NetworkCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    invalidated: int = 0
+    bytes_saved: int = 0
+    bytes_recorded: int = 0
+
+
+class NetworkCache:
+    def __init__(self, cache_dir: Path, revalidate: bool = False):
+        self.cache_dir = cache_dir
+        self.revalidate = revalidate
+        self.stats = NetworkCacheStats()
+        self.bodies: dict[str, bytes] = {}
+
+        self.cache_dir.joinpath("entries").mkdir(parents=True, exist_ok=True)
+        self.cache_dir.joinpath("blobs").mkdir(parents=True, exist_ok=True)
+
+    def get_entry_file(self, url: str) -> Path:
+        return self.cache_dir.joinpath("entries", f"{hashlib.sha256(url.encode()).hexdigest()}.json")
+
+    def get_blob_file(self, sha256: str) -> Path:
+        return self.cache_dir.joinpath("blobs", sha256)
+
+    def write_atomically(self, path: Path, content: bytes):
+        # Workers share the cache directory, readers must never see a partially written file
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+
+    def entries(self) -> list[CachedResponse]:
+        return [
+            CachedResponse.model_validate_json(entry_file.read_text())
+            for entry_file in self.cache_dir.joinpath("entries").glob("*.json")
+        ]
+
+    def load(self, url: str) -> tuple[CachedResponse, bytes] | None:
+        entry_file = self.get_entry_file(url)
+        if not entry_file.exists():
+            return None
+
+        entry = CachedResponse.model_validate_json(entry_file.read_text())
+        body = self.bodies.get(entry.sha256)
+
+        if body is None:
+            blob_file = self.get_blob_file(entry.sha256)
+            body = blob_file.read_bytes() if blob_file.exists() else None
+
+            if body is None or hashlib.sha256(body).hexdigest() != entry.sha256:
+                logger.warning(f"Cached body of {url} is missing or corrupted, invalidating it")
+                self.invalidate(url=url)
+                return None
+
+            self.bodies[entry.sha256] = body
+
+        return entry, body
+
+    def store(self, url: str, status: int, headers: dict[str, str], body: bytes) -> CachedResponse:
+        sha256 = hashlib.sha256(body).hexdigest()
+        headers = {name.lower(): value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS}
+        entry = CachedResponse(
+            url=url,
+            status=status,
+            headers=headers,
+            sha256=sha256,
+            size=len(body),
+            etag=headers.get("etag")
+        )
+
+        blob_file = self.get_blob_file(sha256)
+        if not blob_file.exists():
+            self.write_atomically(blob_file, body)
+
+        self.write_atomically(self.get_entry_file(url), entry.model_dump_json().encode())
+        self.bodies[sha256] = body
+        self.stats.bytes_recorded += len(body)
+
+        return entry
+
+    def invalidate(
+            self,
+            url: str | None = None,
+            etag: str | None = None,
+            sha256: str | None = None,
+            all_entries: bool = False
+    ):
+        if (url, etag, sha256) == (None, None, None) and not all_entries:
+            raise ValueError("Pass a url, etag or sha256 to invalidate, or all_entries=True to clear the whole cache")
+
+        for entry in self.entries():
+            if url not in (None, entry.url) or etag not in (None, entry.etag) or sha256 not in (None, entry.sha256):
+                continue
+
+            self.get_entry_file(entry.url).unlink(missing_ok=True)
+            self.stats.invalidated += 1
+            logger.info(f"Invalidated cached response of {entry.url}")
+
+    def handle(self, route: Route):
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+
+        cached = self.load(request.url)
+
+        if cached and self.revalidate and cached[0].etag:
+            response = route.fetch(headers={**request.headers, "if-none-match": cached[0].etag})
+            self.stats.revalidated += 1
+
+            if response.status != 304:
+                self.record(route, response)
+                return
+
+        if cached:
+            entry, body = cached
+            route.fulfill(status=entry.status, headers=entry.headers, body=body)
+            self.stats.hits += 1
+            self.stats.bytes_saved += entry.size
+            return
+
+        self.record(route, route.fetch())
+
+    def record(self, route: Route, response):
+        self.stats.misses += 1
+
+        if response.status != 200:
+            route.fulfill(response=response)
+            return
+
+        entry = self.store(route.request.url, response.status, response.headers, response.body())
+        route.fulfill(status=entry.status, headers=entry.headers, body=self.bodies[entry.sha256])
+
+    def import_har(self, har_file: Path):
+        har = json.loads(har_file.read_text())
+
+        for har_entry in har["log"]["entries"]:
+            request, response = har_entry["request"], har_entry["response"]
+            content = response.get("content", {})
+
+            if request["method"] != "GET" or response["status"] != 200 or "text" not in content:
+                continue
+
+            body = content["text"].encode()
+            if content.get("encoding") == "base64":
+                body = base64.b64decode(content["text"])
+
+            headers = {header["name"]: header["value"] for header in response.get("headers", [])}
+            self.store(request["url"], response["status"], headers, body)
+
+    def export_har(self, har_file: Path):
+        har_entries = []
+
+        for entry in self.entries():
+            cached = self.load(entry.url)
+            if cached is None:
+                continue
+
+            har_entries.append({
+                "request": {"method": "GET", "url": entry.url, "headers": []},
+                "response": {
+                    "status": entry.status,
+                    "headers": [{"name": name, "value": value} for name, value in entry.headers.items()],
+                    "content": {
+                        "size": entry.size,
+                        "mimeType": entry.headers.get("content-type", ""),
+                        "text": base64.b64encode(cached[1]).decode(),
+                        "encoding": "base64"
+                    }
+                }
+            })
+
+        har = {"log": {"version": "1.2", "creator": {"name": "network-cache", "version": "1.0"}, "entries": har_entries}}
+        har_file.write_text(json.dumps(har, indent=2))
+
+
+def main():
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Manage the record-and-replay network cache")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("import").add_argument("har_file", type=Path)
+    subparsers.add_parser("export").add_argument("har_file", type=Path)
+    invalidate_parser = subparsers.add_parser("invalidate")
+    invalidate_parser.add_argument("--url")
+    invalidate_parser.add_argument("--etag")
+    invalidate_parser.add_argument("--sha256")
+    invalidate_parser.add_argument("--all", action="store_true", dest="all_entries", help="Invalidate every entry")
+    args = parser.parse_args()
+
+    if args.command == "invalidate" and not (args.url or args.etag or args.sha256 or args.all_entries):
+        invalidate_parser.error("pass --url, --etag or --sha256, or --all to clear the whole cache")
+
+    cache = NetworkCache(settings.network_cache.cache_dir)
+
+    if args.command == "import":
+        cache.import_har(args.har_file)
+    if args.command == "export":
+        cache.export_har(args.har_file)
+    if args.command == "invalidate":
+        cache.invalidate(url=args.url, etag=args.etag, sha256=args.sha256, all_entries=args.all_entries)
+
+
+if __name__ == "__main__":
+    main()
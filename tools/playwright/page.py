@@ -1,36 +1,116 @@
+from pathlib import Path
+
 import allure
-from playwright.sync_api import Page, Playwright
+import pytest
+from playwright.sync_api import Page, Browser as PlaywrightBrowser
 
-from config import settings, Browser
-from tools.playwright.mocks import mock_static_resources
+from config import settings, Browser, ResourceProfile
+from tools.playwright.artifacts import (
+    finish_video,
+    get_execution_count,
+    is_failed,
+    should_record,
+    should_retain,
+    stop_tracing
+)
+from tools.playwright.contexts import ContextPoolRegistry
+from tools.playwright.resources import ResourcePolicy
 
+playwright_pages_key = pytest.StashKey[list["PlaywrightPage"]]()
 
-def initialize_playwright_page(
-        playwright: Playwright,
-        test_name: str,
-        browser_type: Browser,
-        storage_state: str | None = None
-) -> Page:
-    browser = playwright[browser_type].launch(headless=settings.headless)
-    context = browser.new_context(
-        record_video_dir=settings.videos_dir,
-        storage_state=storage_state,
-        base_url=settings.get_base_url()
-    )
 
-    context.tracing.start(
-        screenshots=True,
-        snapshots=True,
-        sources=True
-    )
-    page = context.new_page()
+class PlaywrightPage:
+    def __init__(
+            self,
+            context_pools: ContextPoolRegistry,
+            browser: PlaywrightBrowser,
+            browser_type: Browser,
+            item: pytest.Item,
+            storage_state: Path | None = None
+    ):
+        self.context_pools = context_pools
+        self.browser = browser
+        self.browser_type = browser_type
+        self.item = item
+        self.storage_state = storage_state
+
+        marker = item.get_closest_marker("resource_profile")
+        self.resource_policy = ResourcePolicy(
+            profile=ResourceProfile(marker.args[0]) if marker else settings.resource_policy.profile
+        )
+
+        self.start()
+
+    @property
+    def page(self) -> Page:
+        return self.pooled.page
+
+    def start(self):
+        execution_count = get_execution_count(self.item)
+        self.record_video = should_record(settings.video_policy, execution_count)
+        self.record_tracing = should_record(settings.tracing_policy, execution_count)
+
+        self.context_pool = self.context_pools.get(
+            self.browser,
+            self.browser_type,
+            storage_state=self.storage_state,
+            record_video=self.record_video
+        )
+        self.pooled = self.context_pool.acquire()
+        self.resource_policy.apply(self.pooled.context)
+
+        if self.record_tracing:
+            self.pooled.context.tracing.start(
+                screenshots=True,
+                snapshots=True,
+                sources=True
+            )
+
+    def stop(self, retain_video: bool, retain_tracing: bool):
+        tracing_file = settings.tracing_dir.joinpath(f"{self.item.name}.zip")
 
-    mock_static_resources(page)
+        if self.record_tracing:
+            stop_tracing(self.pooled.context, tracing_file if retain_tracing else None)
 
-    yield page
+        self.context_pool.release(self.pooled)
+
+        if self.record_video:
+            finish_video(self.pooled.page.video, retain_video)
+
+        if retain_tracing:
+            allure.attach.file(source=tracing_file, name="tracing", extension="zip")
+
+        if retain_video:
+            allure.attach.file(source=f"{self.pooled.page.video.path()}", name="video", attachment_type=allure.attachment_type.WEBM)
+
+    def restart(self) -> Page:
+        # An attempt that is retried in place never keeps its artifacts, only the last one does
+        self.stop(retain_video=False, retain_tracing=False)
+        self.start()
+        return self.page
+
+    def close(self):
+        self.resource_policy.save(self.item.nodeid)
+
+        failed = is_failed(self.item)
+        execution_count = get_execution_count(self.item)
+        self.stop(
+            retain_video=self.record_video and should_retain(settings.video_policy, failed, execution_count),
+            retain_tracing=self.record_tracing and should_retain(settings.tracing_policy, failed, execution_count)
+        )
+
+
+def initialize_playwright_page(
+        context_pools: ContextPoolRegistry,
+        browser: PlaywrightBrowser,
+        browser_type: Browser,
+        item: pytest.Item,
+        storage_state: Path | None = None
+) -> Page:
+    playwright_page = PlaywrightPage(context_pools, browser, browser_type, item, storage_state=storage_state)
+    item.stash.setdefault(playwright_pages_key, []).append(playwright_page)
 
-    context.tracing.stop(path=settings.tracing_dir.joinpath(f"{test_name}.zip"))
-    browser.close()
+    yield playwright_page.page
 
-    allure.attach.file(source=settings.tracing_dir.joinpath(f"{test_name}.zip"), name="tracing", extension="zip")
-    allure.attach.file(source=f"{page.video.path()}", name="video", attachment_type=allure.attachment_type.WEBM)
\ No newline at end of file
+    item.stash[playwright_pages_key].remove(playwright_page)
+    playwright_page.close()
@@ -0,0 +1,144 @@
+import time
+from abc import ABC, abstractmethod
+
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+from tools.metrics import save_metrics
+
+logger = get_logger("READINESS")
+
+WAIT_FOR_DOM_STABLE_SCRIPT = """
+([quietMs, timeoutMs]) => new Promise(resolve => {
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    const finish = (stable) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(timeoutTimer);
+        resolve(stable);
+    };
+    let quietTimer = setTimeout(() => finish(true), quietMs);
+    const timeoutTimer = setTimeout(() => finish(false), timeoutMs);
+
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+})
+"""
+
+
+class ReadinessStrategy(ABC):
+    @abstractmethod
+    def wait(self, page: Page):
+        ...
+
+    @abstractmethod
+    async def wait_async(self, page: AsyncPage):
+        ...
+
+    def __str__(self) -> str:
+        return type(self).__name__
+
+
+class LoadStateReadiness(ReadinessStrategy):
+    def __init__(self, state: str = "networkidle"):
+        self.state = state
+
+    def wait(self, page: Page):
+        page.wait_for_load_state(self.state)
+
+    async def wait_async(self, page: AsyncPage):
+        await page.wait_for_load_state(self.state)
+
+    def __str__(self) -> str:
+        return f"load state '{self.state}'"
+
+
+class ElementVisibleReadiness(ReadinessStrategy):
+    def __init__(self, test_id: str):
+        self.test_id = test_id
+
+    def wait(self, page: Page):
+        page.get_by_test_id(self.test_id).first.wait_for(state="visible")
+
+    async def wait_async(self, page: AsyncPage):
+        await page.get_by_test_id(self.test_id).first.wait_for(state="visible")
+
+    def __str__(self) -> str:
+        return f"visible '{self.test_id}'"
+
+
+class DomStableReadiness(ReadinessStrategy):
+    def __init__(self, quiet_ms: int = 300, timeout_ms: int = 10_000):
+        self.quiet_ms = quiet_ms
+        self.timeout_ms = timeout_ms
+
+    def wait(self, page: Page):
+        if not page.evaluate(WAIT_FOR_DOM_STABLE_SCRIPT, [self.quiet_ms, self.timeout_ms]):
+            self.raise_unstable()
+
+    async def wait_async(self, page: AsyncPage):
+        if not await page.evaluate(WAIT_FOR_DOM_STABLE_SCRIPT, [self.quiet_ms, self.timeout_ms]):
+            self.raise_unstable()
+
+    def raise_unstable(self):
+        raise TimeoutError(f"DOM did not stay unchanged for {self.quiet_ms}ms within {self.timeout_ms}ms")
+
+    def __str__(self) -> str:
+        return f"DOM stable for {self.quiet_ms}ms"
+
+
+class CombinedReadiness(ReadinessStrategy):
+    def __init__(self, *strategies: ReadinessStrategy):
+        self.strategies = strategies
+
+    def wait(self, page: Page):
+        for strategy in self.strategies:
+            strategy.wait(page)
+
+    async def wait_async(self, page: AsyncPage):
+        for strategy in self.strategies:
+            await strategy.wait_async(page)
+
+    def __str__(self) -> str:
+        return " and ".join(str(strategy) for strategy in self.strategies)
+
+
+class ReadinessStats(BaseModel):
+    visits: int = 0
+    wait_time: float = 0.0
+
+
+readiness_stats: dict[str, ReadinessStats] = {}
+
+
+def record_readiness(strategy: ReadinessStrategy, page_name: str, wait_time: float):
+    stats = readiness_stats.setdefault(page_name, ReadinessStats())
+    stats.visits += 1
+    stats.wait_time += wait_time
+    logger.info(f"{page_name} became ready ({strategy}) in {wait_time * 1000:.0f}ms")
+
+
+def wait_for_readiness(page: Page, strategy: ReadinessStrategy, page_name: str) -> float:
+    started = time.perf_counter()
+    strategy.wait(page)
+    wait_time = time.perf_counter() - started
+
+    record_readiness(strategy, page_name, wait_time)
+    return wait_time
+
+
+async def wait_for_readiness_async(page: AsyncPage, strategy: ReadinessStrategy, page_name: str) -> float:
+    started = time.perf_counter()
+    await strategy.wait_async(page)
+    wait_time = time.perf_counter() - started
+
+    record_readiness(strategy, page_name, wait_time)
+    return wait_time
+
+
+def save_readiness_stats():
+    save_metrics("readiness", {page_name: stats.model_dump() for page_name, stats in readiness_stats.items()})
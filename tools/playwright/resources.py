@@ -0,0 +1,151 @@
+import json
+import os
+import urllib.request
+from pathlib import Path
+
+from filelock import FileLock
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+from playwright.sync_api import BrowserContext, Route
+from pydantic import BaseModel
+
+from config import settings, ResourceProfile
+from tools.logger import get_logger
+from tools.metrics import save_metrics
+
+logger = get_logger("RESOURCE_POLICY")
+
+
+class ResourceRules(BaseModel):
+    url_patterns: list[str] = []
+    resource_types: list[str] = []
+
+
+RESOURCE_PROFILES = {
+    ResourceProfile.MINIMAL: ResourceRules(url_patterns=["**/*.{ico,jpg,svg,webp,mp3,woff,woff2}"]),
+    ResourceProfile.VISUAL: ResourceRules(url_patterns=["**/*.{mp3,woff,woff2}"]),
+    ResourceProfile.FULL: ResourceRules()
+}
+
+
+class BlockedResourcesStats(BaseModel):
+    requests: int = 0
+    bytes: int = 0
+    unknown_size: int = 0
+
+
+blocked_urls: dict[str, list[str]] = {}
+
+
+def fetch_content_length(url: str) -> int | None:
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, method="HEAD"), timeout=5) as response:
+            content_length = response.headers.get("Content-Length")
+    except (OSError, ValueError) as error:
+        logger.warning(f"Failed to get the size of {url}: {error}")
+        return None
+
+    return int(content_length) if content_length else None
+
+
+class ResourceSizeIndex:
+    """Sizes of blocked resources, a blocked request never gets a response to measure, so they are asked for once.
+
+    Failed lookups are stored as null, so an unreachable url isn't asked for again on every run.
+    """
+
+    def __init__(self, index_file: Path):
+        self.index_file = index_file
+        self.lock = FileLock(f"{index_file}.lock")
+        self.sizes: dict[str, int | None] = self.load()
+
+    def load(self) -> dict[str, int | None]:
+        return json.loads(self.index_file.read_text()) if self.index_file.exists() else {}
+
+    def resolve(self, urls: set[str]):
+        resolved = {url: fetch_content_length(url) for url in sorted(urls - self.sizes.keys())}
+
+        if not resolved:
+            return
+
+        # Other workers resolve their own urls at the same time
+        with self.lock:
+            self.sizes = {**self.load(), **resolved}
+            temp_file = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(self.sizes, indent=2, sort_keys=True))
+            os.replace(temp_file, self.index_file)
+
+    def get_stats(self, urls: list[str]) -> BlockedResourcesStats:
+        sizes = [self.sizes.get(url) for url in urls]
+        return BlockedResourcesStats(
+            requests=len(urls),
+            bytes=sum(size for size in sizes if size is not None),
+            unknown_size=sizes.count(None)
+        )
+
+
+class ResourcePolicy:
+    def __init__(self, profile: ResourceProfile):
+        rules = RESOURCE_PROFILES[profile]
+
+        self.profile = profile
+        self.url_patterns = rules.url_patterns + settings.resource_policy.blocked_url_patterns
+        self.resource_types = set(rules.resource_types + settings.resource_policy.blocked_resource_types)
+        self.blocked: list[str] = []
+
+    def block(self, route: Route):
+        self.blocked.append(route.request.url)
+        route.abort()
+
+    def handle_resource_type(self, route: Route):
+        if route.request.resource_type in self.resource_types:
+            self.block(route)
+            return
+
+        route.fallback()
+
+    def apply(self, context: BrowserContext):
+        # Routed on the context, so popups and pages opened by the test are covered too. Every request
+        # matched by a route makes a round trip to Python, so the catch-all route needed for resource
+        # type rules is only installed when there are any
+        for url_pattern in self.url_patterns:
+            context.route(url_pattern, self.block)
+
+        if self.resource_types:
+            context.route("**/*", self.handle_resource_type)
+
+    async def block_async(self, route: AsyncRoute):
+        self.blocked.append(route.request.url)
+        await route.abort()
+
+    async def handle_resource_type_async(self, route: AsyncRoute):
+        if route.request.resource_type in self.resource_types:
+            await self.block_async(route)
+            return
+
+        await route.fallback()
+
+    async def apply_async(self, context: AsyncBrowserContext):
+        for url_pattern in self.url_patterns:
+            await context.route(url_pattern, self.block_async)
+
+        if self.resource_types:
+            await context.route("**/*", self.handle_resource_type_async)
+
+    def save(self, test_id: str):
+        blocked_urls[test_id] = self.blocked
+        logger.info(f"Blocked {len(self.blocked)} requests in '{test_id}'")
+
+
+def save_blocked_resources_stats():
+    index = ResourceSizeIndex(settings.resource_policy.sizes_file)
+    if settings.resource_policy.resolve_sizes:
+        index.resolve({url for urls in blocked_urls.values() for url in urls})
+
+    tests = {test_id: index.get_stats(urls) for test_id, urls in blocked_urls.items()}
+
+    save_metrics("blocked_resources", {
+        "requests": sum(stats.requests for stats in tests.values()),
+        "bytes": sum(stats.bytes for stats in tests.values()),
+        "unknown_size": sum(stats.unknown_size for stats in tests.values()),
+        "tests": {test_id: stats.model_dump() for test_id, stats in tests.items()}
+    })
@@ -0,0 +1,45 @@
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+from filelock import FileLock
+from playwright.sync_api import Browser as PlaywrightBrowser, BrowserContext
+
+from config import settings, Browser
+from tools.logger import get_logger
+
+logger = get_logger("BROWSER_STATE")
+
+
+def is_browser_state_fresh(state_file: Path) -> bool:
+    if not state_file.exists() or state_file.stat().st_size == 0:
+        return False
+
+    return time.time() - state_file.stat().st_mtime < settings.browser_state_ttl
+
+
+def get_browser_state(
+        browser: PlaywrightBrowser,
+        browser_type: Browser,
+        create: Callable[[BrowserContext], None]
+) -> Path:
+    state_file = settings.get_browser_state_file(browser_type)
+
+    with FileLock(f"{state_file}.lock"):
+        if is_browser_state_fresh(state_file):
+            logger.info(f"Reusing cached '{browser_type}' browser state {state_file}")
+            return state_file
+
+        logger.info(f"Creating '{browser_type}' browser state {state_file}")
+        context = browser.new_context(base_url=settings.get_base_url())
+        try:
+            create(context)
+
+            temp_state_file = state_file.with_suffix(f".{os.getpid()}.tmp")
+            context.storage_state(path=temp_state_file)
+            os.replace(temp_state_file, state_file)
+        finally:
+            context.close()
+
+    return state_file
@@ -0,0 +1,128 @@
+import heapq
+
+import pytest
+from xdist.workermanage import WorkerController
+
+from config import Browser
+from tools.scheduling.lpt import LPTScheduling
+from tools.scheduling.timings import TimingStore
+
+ENGINES = {browser.value for browser in Browser}
+
+
+def get_test_engine(nodeid: str) -> str | None:
+    _, _, params = nodeid.partition("[")
+    return next((param for param in params.rstrip("]").split("-") if param in ENGINES), None)
+
+
+def assign_engines(loads: dict[str, float], workers: int) -> list[list[str]]:
+    engines = sorted(loads, key=loads.__getitem__, reverse=True)
+    if not engines or workers <= 0:
+        return [[] for _ in range(max(workers, 0))]
+
+    if workers >= len(engines):
+        # Every engine gets a worker, the spare ones go to the engines with the most work per worker
+        counts = dict.fromkeys(engines, 1)
+        for _ in range(workers - len(engines)):
+            engine = max(engines, key=lambda name: loads[name] / counts[name])
+            counts[engine] += 1
+
+        return [[engine] for engine in engines for _ in range(counts[engine])]
+
+    # Fewer workers than engines: whole engines are packed longest-first onto the least loaded worker
+    assigned: list[list[str]] = [[] for _ in range(workers)]
+    heap = [(0.0, worker) for worker in range(workers)]
+    for engine in engines:
+        load, worker = heapq.heappop(heap)
+        assigned[worker].append(engine)
+        heapq.heappush(heap, (load + loads[engine], worker))
+
+    return assigned
+
+
+class BrowserAffinityScheduling(LPTScheduling):
+    def __init__(self, config: pytest.Config, log, timings: TimingStore):
+        super().__init__(config, log, timings)
+        self.engine_of: dict[int, str | None] = {}
+        self.node2engines: dict[WorkerController, list[str]] = {}
+        self.node2current: dict[WorkerController, str] = {}
+        self.node2launches: dict[WorkerController, int] = {}
+        self.node2sent: dict[WorkerController, int] = {}
+
+    @property
+    def engines(self) -> set[str]:
+        return {engine for engine in self.engine_of.values() if engine}
+
+    def get_report(self) -> dict:
+        launches = sum(self.node2launches.values())
+        # Load scheduling mixes the engines in one queue, so a worker ends up launching each one it gets a test for
+        launches_without_affinity = sum(min(len(self.engines), sent) for sent in self.node2sent.values())
+
+        return {
+            **super().get_report(),
+            "engines": len(self.engines),
+            "launches": launches,
+            "launches_without_affinity": launches_without_affinity,
+            "launches_avoided": launches_without_affinity - launches
+        }
+
+    def plan(self):
+        assert self.collection is not None
+
+        loads: dict[str, float] = {}
+        for index in self.predicted:
+            engine = self.engine_of[index] = get_test_engine(self.collection[index])
+            if engine:
+                loads[engine] = loads.get(engine, 0.0) + self.predicted[index]
+
+        for node, engines in zip(self.nodes, assign_engines(loads, len(self.nodes))):
+            self.node2engines[node] = engines
+
+    def take(self, node: WorkerController) -> int | None:
+        engines = self.node2engines.setdefault(node, [])
+
+        while True:
+            current = engines[0] if engines else None
+            for index in self.pending:
+                engine = self.engine_of[index]
+                if engine is None or engine == current:
+                    return index
+
+            if not engines:
+                break
+            engines.pop(0)
+
+        # The node ran out of its own engines, so it helps with the engine that has the most work left
+        remaining: dict[str, float] = {}
+        for index in self.pending:
+            engine = self.engine_of[index]
+            remaining[engine] = remaining.get(engine, 0.0) + self.predicted[index]
+
+        if not remaining:
+            return None
+
+        engines.append(max(remaining, key=remaining.__getitem__))
+        return self.take(node)
+
+    def send_next(self, node: WorkerController, count: int):
+        if not self.engine_of:
+            self.plan()
+
+        indexes = []
+        for _ in range(count):
+            index = self.take(node)
+            if index is None:
+                break
+
+            self.pending.remove(index)
+            indexes.append(index)
+
+            engine = self.engine_of[index]
+            if engine and engine != self.node2current.get(node):
+                self.node2current[node] = engine
+                self.node2launches[node] = self.node2launches.get(node, 0) + 1
+
+        if indexes:
+            self.node2sent[node] = self.node2sent.get(node, 0) + len(indexes)
+            self.node2pending[node].extend(indexes)
+            node.send_runtest_some(indexes)
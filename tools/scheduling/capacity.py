@@ -0,0 +1,131 @@
+import json
+import os
+from pathlib import Path
+
+from config import settings
+from tools.logger import configure_logging, get_logger
+
+logger = get_logger("CAPACITY")
+
+
+def get_cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def get_available_memory() -> int | None:
+    """Available memory in MB, or None when the platform does not report it."""
+    meminfo = Path("/proc/meminfo")
+    if meminfo.exists():
+        for line in meminfo.read_text().splitlines():
+            name, _, value = line.partition(":")
+            if name == "MemAvailable":
+                return int(value.split()[0]) // 1024
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 1024 ** 2
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def is_under_memory_pressure() -> bool:
+    available = get_available_memory()
+    return available is not None and available < settings.workers.memory_reserve_mb
+
+
+def get_process_rss(pid: int | str) -> int:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) // 1024
+
+    return 0
+
+
+def get_descendants_rss(pid: int) -> int:
+    children: dict[int, list[int]] = {}
+    for stat_file in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # The process name may contain spaces, the fields after it are fixed
+            fields = stat_file.read_text().rpartition(")")[2].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat_file.parent.name))
+
+    total, stack = 0, list(children.get(pid, []))
+    while stack:
+        child = stack.pop()
+        stack.extend(children.get(child, []))
+        try:
+            total += get_process_rss(child)
+        except OSError:
+            continue
+
+    return total
+
+
+def measure_footprints(engines: list[str]) -> dict[str, int]:
+    # Only this command launches browsers, collection and the xdist hook never pay for it
+    from playwright.sync_api import sync_playwright
+
+    pid = os.getpid()
+    footprints = {"worker": get_process_rss(pid)}
+
+    with sync_playwright() as playwright:
+        footprints["driver"] = get_descendants_rss(pid)
+
+        for engine in engines:
+            browser = playwright[engine].launch(headless=settings.headless)
+            page = browser.new_context().new_page()
+            # A blank page is a fraction of what a browser holds with the app loaded
+            page.goto(settings.get_base_url(), wait_until="networkidle")
+            footprints[engine] = get_descendants_rss(pid) - footprints["driver"]
+            browser.close()
+
+            logger.info(f"Measured '{engine}' footprint: {footprints[engine]} MB")
+
+    return footprints
+
+
+def get_footprints() -> dict[str, int]:
+    footprints_file = settings.workers.footprints_file
+    measured = json.loads(footprints_file.read_text()) if footprints_file.exists() else {}
+
+    return {**settings.workers.footprints_mb, **measured}
+
+
+def get_worker_count(engines: list[str], exclusive: bool) -> dict:
+    footprints = get_footprints()
+    engines_memory = [footprints[engine] for engine in engines]
+    # A worker keeps every engine it has launched, unless the registry closes the previous one
+    per_worker = footprints["worker"] + footprints["driver"] + (
+        max(engines_memory, default=0) if exclusive else sum(engines_memory)
+    )
+
+    cpus = get_cpu_count()
+    available = get_available_memory()
+    workers = cpus
+    if available is not None:
+        workers = min(workers, (available - settings.workers.memory_reserve_mb) // max(per_worker, 1))
+    if settings.workers.max_workers:
+        workers = min(workers, settings.workers.max_workers)
+
+    return {
+        "cpus": cpus,
+        "available_memory_mb": available,
+        "per_worker_memory_mb": per_worker,
+        "workers": max(workers, 1)
+    }
+
+
+def main():
+    configure_logging()
+
+    footprints = measure_footprints([browser.value for browser in settings.browsers])
+    settings.workers.footprints_file.write_text(json.dumps(footprints, indent=2, sort_keys=True))
+    logger.info(f"Saved footprints to {settings.workers.footprints_file}")
+
+
+if __name__ == "__main__":
+    main()
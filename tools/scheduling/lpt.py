@@ -0,0 +1,129 @@
+import heapq
+import time
+
+import pytest
+from xdist.scheduler import LoadScheduling
+from xdist.workermanage import WorkerController
+
+from config import settings
+from tools.logger import get_logger
+from tools.scheduling.capacity import is_under_memory_pressure
+from tools.scheduling.timings import TimingStore
+
+logger = get_logger("SCHEDULING")
+
+# A worker only starts an item once it knows the next one, so every node keeps two in flight
+ITEMS_PER_NODE = 2
+
+
+def predict_makespan(durations: list[float], workers: int) -> float:
+    loads = [0.0] * max(workers, 1)
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+
+    return max(loads)
+
+
+class LPTScheduling(LoadScheduling):
+    def __init__(self, config: pytest.Config, log, timings: TimingStore):
+        super().__init__(config, log)
+        self.timings = timings
+        self.predicted: dict[int, float] = {}
+        self.predicted_makespan = 0.0
+        self.workers = 0
+        self.started = 0.0
+        self.node2finished: dict[WorkerController, float] = {}
+        self.retired = 0
+        self.retired_at = 0.0
+
+    @property
+    def actual_makespan(self) -> float:
+        return max(self.node2finished.values(), default=0.0)
+
+    def get_report(self) -> dict:
+        return {
+            "workers": self.workers,
+            "tests": len(self.predicted),
+            "predicted_makespan": round(self.predicted_makespan, 2),
+            "actual_makespan": round(self.actual_makespan, 2),
+            "retired_workers": self.retired
+        }
+
+    def order_pending(self):
+        self.pending.sort(key=self.predicted.__getitem__, reverse=True)
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.predicted = {index: self.timings.predict(nodeid) for index, nodeid in enumerate(self.collection)}
+        self.workers = len(self.nodes)
+        self.predicted_makespan = predict_makespan(list(self.predicted.values()), self.workers)
+
+        self.pending[:] = self.predicted
+        self.order_pending()
+        self.started = time.monotonic()
+
+        for node in self.nodes:
+            self.check_schedule(node)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node: WorkerController, duration: float = 0):
+        if node.shutting_down:
+            return
+
+        if not self.pending or self.should_retire():
+            node.shutdown()
+            return
+
+        missing = ITEMS_PER_NODE - len(self.node2pending[node])
+        if missing > 0:
+            self.send_next(node, missing)
+
+    def should_retire(self) -> bool:
+        # One worker at a time, so the memory it frees shows up before the next check
+        if time.monotonic() - self.retired_at < settings.workers.pressure_interval:
+            return False
+
+        if sum(not node.shutting_down for node in self.nodes) <= 1 or not is_under_memory_pressure():
+            return False
+
+        logger.warning("Memory pressure detected, retiring a worker")
+        self.retired += 1
+        self.retired_at = time.monotonic()
+        return True
+
+    def send_next(self, node: WorkerController, count: int):
+        self._send_tests(node, count)
+
+    def mark_test_complete(self, node: WorkerController, item_index: int, duration: float = 0):
+        self.node2finished[node] = time.monotonic() - self.started
+        super().mark_test_complete(node, item_index, duration)
+
+    def remove_node(self, node: WorkerController) -> str | None:
+        pending = self.node2pending.pop(node)
+        if not pending:
+            return None
+
+        assert self.collection is not None
+        crash_item = self.collection[pending.pop(0)]
+
+        # Items of a crashed node go back into the queue, still longest first
+        self.pending.extend(pending)
+        self.order_pending()
+        for other_node in self.node2pending:
+            self.check_schedule(other_node)
+
+        return crash_item
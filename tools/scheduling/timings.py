@@ -0,0 +1,62 @@
+import json
+import os
+import statistics
+from pathlib import Path
+
+# Prediction for a test when nothing similar has been timed yet
+DEFAULT_DURATION = 5.0
+
+
+def get_test_name(nodeid: str) -> str:
+    return nodeid.partition("[")[0]
+
+
+def get_test_file(nodeid: str) -> str:
+    return nodeid.partition("::")[0]
+
+
+def get_median_by(durations: dict[str, float], key) -> dict[str, float]:
+    groups: dict[str, list[float]] = {}
+    for nodeid, duration in durations.items():
+        groups.setdefault(key(nodeid), []).append(duration)
+
+    return {group: statistics.median(values) for group, values in groups.items()}
+
+
+class TimingStore:
+    def __init__(self, timings_file: Path, history: int = 5):
+        self.timings_file = timings_file
+        self.history = history
+        self.recorded: dict[str, float] = {}
+
+        self.durations: dict[str, list[float]] = {}
+        if timings_file.exists():
+            self.durations = json.loads(timings_file.read_text())
+
+        self.known = {nodeid: statistics.median(values) for nodeid, values in self.durations.items()}
+        self.by_test = get_median_by(self.known, get_test_name)
+        self.by_file = get_median_by(self.known, get_test_file)
+        self.fallback = statistics.median(self.known.values()) if self.known else DEFAULT_DURATION
+
+    def predict(self, nodeid: str) -> float:
+        if nodeid in self.known:
+            return self.known[nodeid]
+
+        # A new browser param costs about what the same test costs on the other engines,
+        # a new test about what its neighbours in the same file cost
+        return self.by_test.get(get_test_name(nodeid)) or self.by_file.get(get_test_file(nodeid)) or self.fallback
+
+    def record(self, nodeid: str, when: str, duration: float):
+        # Every attempt starts with its setup, so a rerun replaces the phases of the attempt before it
+        if when == "setup":
+            self.recorded[nodeid] = 0.0
+
+        self.recorded[nodeid] = self.recorded.get(nodeid, 0.0) + duration
+
+    def save(self):
+        for nodeid, duration in self.recorded.items():
+            self.durations[nodeid] = [*self.durations.get(nodeid, []), round(duration, 3)][-self.history:]
+
+        temp_file = self.timings_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(self.durations, indent=2, sort_keys=True))
+        os.replace(temp_file, self.timings_file)